@@ -0,0 +1,138 @@
+"""Measures the cold start of the game and fails if it exceeds its budget
+
+Two numbers are measured, each as the median of several fresh processes:
+
+- import time: the total of 'python -X importtime -c "import run"', i.e.
+  the time needed to import the game modules and their dependencies
+- time to first frame: the time from starting 'python run.py' in a pseudo
+  terminal until the first screen has been drawn. A key is sent right away
+  to skip the intentional pause before the logo animation.
+
+Usage (from the repository root, Linux/macOS only):
+    python -m benchmarks.cold_start --catalog texts.json
+    python -m benchmarks.cold_start --catalog texts.json --frame-budget 150
+
+The text catalog is read from a JSON file written by MemorySheet.save(), so
+the measurement doesn't depend on the network. The program exits with
+status 1 if a median exceeds its budget, so it can guard the start-up time
+in CI.
+"""
+import argparse
+import os
+import pty
+import re
+import select
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from game.UI.display import Display
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Matches one line of -X importtime output, e.g.
+# 'import time:       274 |     124011 |   game.UI.sheets'
+IMPORT_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+# Give up on a game that hasn't drawn anything after this many seconds
+TIMEOUT = 10
+
+
+def measure_imports() -> tuple:
+    """Imports the game in a fresh interpreter with -X importtime
+
+    Returns:
+        tuple: Total import time of run.py in ms, and a list of
+            (ms, module) for the modules that run.py imports directly
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import run'],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+    total = 0
+    modules = []
+    imported = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = match.group(2, 3, 4)
+        if len(indent) == 3:
+            imported.append((int(cumulative) / 1000, name))
+        elif len(indent) == 1:
+            # Modules are listed after the modules they import, so the
+            # modules collected so far were imported by this one
+            if name == 'run':
+                total = int(cumulative) / 1000
+                modules = imported
+            imported = []
+    return total, sorted(modules, reverse=True)
+
+
+def measure_first_frame(catalog: str) -> float:
+    """Starts the game in a pseudo terminal and waits for the first frame
+
+    Args:
+        catalog (str): Path of the JSON text catalog
+
+    Returns:
+        float: Milliseconds from starting the process to the first frame
+    """
+    env = dict(os.environ, CATALOG=os.path.abspath(catalog))
+    border = Display.BORDER_CHAR.encode()
+    start = time.perf_counter()
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.chdir(ROOT)
+        os.execve(sys.executable, [sys.executable, 'run.py'], env)
+    try:
+        # Skip the pause before the logo animation; the key is not a valid
+        # menu choice, so the game then waits at the outer menu
+        os.write(fd, b' ')
+        output = b''
+        while border not in output:
+            if time.perf_counter() - start > TIMEOUT:
+                raise TimeoutError('The game has not drawn any frame')
+            ready, _, _ = select.select([fd], [], [], 0.1)
+            if ready:
+                output += os.read(fd, 65536)
+        return (time.perf_counter() - start) * 1000
+    finally:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        os.close(fd)
+
+
+def main():
+    """Measures the cold start and exits with status 1 if over budget"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--catalog', required=True,
+                        help='JSON file written by MemorySheet.save()')
+    parser.add_argument('-n', '--runs', type=int, default=5)
+    parser.add_argument('--import-budget', type=float, default=40,
+                        help='maximum import time in ms '
+                        '(default: %(default)s)')
+    parser.add_argument('--frame-budget', type=float, default=250,
+                        help='maximum time to first frame in ms '
+                        '(default: %(default)s)')
+    args = parser.parse_args()
+
+    imports = [measure_imports() for _ in range(args.runs)]
+    import_time = statistics.median(total for total, _ in imports)
+    frame_time = statistics.median(
+        measure_first_frame(args.catalog) for _ in range(args.runs))
+
+    print(f'import time:    {import_time:6.1f} ms '
+          f'(budget {args.import_budget:g} ms)')
+    for cumulative, name in imports[-1][1][:5]:
+        print(f'  {cumulative:6.1f} ms  {name}')
+    print(f'first frame:    {frame_time:6.1f} ms '
+          f'(budget {args.frame_budget:g} ms)')
+    over = [name for name, value, budget in (
+        ('import time', import_time, args.import_budget),
+        ('first frame', frame_time, args.frame_budget)) if value > budget]
+    if over:
+        print(f'Over budget: {", ".join(over)}', file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
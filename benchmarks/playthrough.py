@@ -0,0 +1,179 @@
+"""Plays complete games headlessly to benchmark and soak-test the game flow
+
+Every game runs from the outer menu through run(), the trials and mission
+phases and write_score() back to the outer menu, with scripted input, no
+pacing delays and all output rendered into memory.
+
+Usage (from the repository root):
+    python -m benchmarks.playthrough --catalog texts.json
+    python -m benchmarks.playthrough --catalog texts.json --soak -n 10000
+    python -m benchmarks.playthrough --catalog texts.json --sessions 1000
+
+The text catalog is read from a JSON file written by MemorySheet.save(). If
+the file doesn't exist yet, add --fetch to download it once from the Google
+sheet (this requires creds.json).
+
+In soak mode, each game is played with random valid answers. If a game
+crashes, its answers are saved as a key file that replays the same game
+with --keys and --seed.
+
+With --sessions, the games are not played one after the other but all at
+once: each game is an event-driven Session, and one loop feeds the next
+answer to every session in turn.
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+import traceback
+from game.UI.headless import HeadlessDisplay
+from game.UI.menu import Menu
+from game.UI.scripted import ScriptedKeyboard
+from game.UI.session import CALL, KEY, SLEEP, Session
+from game.UI.sheets import MemorySheet, Sheet
+from run import game, run
+
+KEYS = os.path.join(os.path.dirname(__file__), 'playthrough.keys')
+# Upper limit of answers per soak game; more means the game is stuck
+MAX_ANSWERS = 10_000
+
+
+def random_player(rng: random.Random):
+    """Returns an endless script that answers each prompt at random
+
+    Args:
+        rng (random.Random): Random number generator for the answers
+
+    Returns:
+        Iterator: Functions that pick one of the valid keys of a prompt
+    """
+    def answer(valid):
+        if valid is None:
+            # Only the player name prompt accepts any input
+            return 'Soak Tester'
+        return rng.choice(valid)
+    return itertools.islice(itertools.repeat(answer), MAX_ANSWERS)
+
+
+def play(sheet: object, keyboard: object, seed: int) -> object:
+    """Plays one game from the outer menu until the player exits
+
+    Args:
+        sheet (object): Reference to MemorySheet class instance
+        keyboard (object): Reference to ScriptedKeyboard class instance
+        seed (int): Seed for the game's own random numbers
+
+    Returns:
+        object: The HeadlessDisplay with the output counters of the game
+    """
+    random.seed(seed)
+    display = HeadlessDisplay(sheet, keep_output=False)
+    Session(game(Menu(display, sheet, run))).play(keyboard)
+    return display
+
+
+def play_interleaved(sheet: object, scripts: list) -> list:
+    """Plays several games at once in event-driven sessions
+
+    Pauses are ended right away by waking the session at its deadline.
+
+    Args:
+        sheet (object): Reference to MemorySheet class instance
+        scripts (list): One ScriptedKeyboard per game, used as the source
+            of the answers
+
+    Returns:
+        list: The HeadlessDisplay of each game
+    """
+    displays = [HeadlessDisplay(sheet, keep_output=False) for _ in scripts]
+    sessions = [Session(game(Menu(display, sheet, run)))
+                for display in displays]
+    requests = [session.start() for session in sessions]
+    active = [idx for idx, request in enumerate(requests) if request]
+    while active:
+        for idx in active:
+            kind, argument = requests[idx]
+            if kind == SLEEP:
+                requests[idx] = sessions[idx].wake(argument)
+            elif kind == KEY:
+                requests[idx] = sessions[idx].feed(
+                    scripts[idx].read_key(argument))
+            elif kind == CALL:
+                requests[idx] = sessions[idx].complete(argument())
+            else:
+                requests[idx] = sessions[idx].feed(scripts[idx].read_line())
+        active = [idx for idx in active if requests[idx]]
+    return displays
+
+
+def main():
+    """Plays the requested amount of games and prints the results"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--catalog', required=True,
+                        help='JSON file written by MemorySheet.save()')
+    parser.add_argument('--fetch', action='store_true',
+                        help='download the catalog if the file is missing')
+    parser.add_argument('--keys', default=KEYS,
+                        help='key file to replay (default: %(default)s)')
+    parser.add_argument('--soak', action='store_true',
+                        help='answer with random valid keys instead')
+    parser.add_argument('-n', '--games', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the first game (default: 0)')
+    parser.add_argument('--sessions', type=int, default=0,
+                        help='play this many games at once per batch; '
+                        'crashes are not caught in this mode')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.catalog) and args.fetch:
+        MemorySheet.save(Sheet(), args.catalog)
+    sheet = MemorySheet.load(args.catalog)
+    if not args.soak:
+        answers = list(ScriptedKeyboard.load(args.keys).script)
+
+    displays = []
+    crashes = 0
+    start = time.perf_counter()
+    if args.sessions:
+        random.seed(args.seed)
+        for first in range(0, args.games, args.sessions):
+            displays.extend(play_interleaved(sheet, [
+                ScriptedKeyboard(random_player(random.Random(seed))
+                                 if args.soak else answers)
+                for seed in range(args.seed + first, args.seed + min(
+                    first + args.sessions, args.games))]))
+    else:
+        for seed in range(args.seed, args.seed + args.games):
+            keyboard = ScriptedKeyboard(
+                random_player(random.Random(seed)) if args.soak else answers)
+            try:
+                displays.append(play(sheet, keyboard, seed))
+            except Exception:
+                crashes += 1
+                if not args.soak:
+                    raise
+                path = f'soak-{seed}.keys'
+                keyboard.save(path)
+                traceback.print_exc()
+                print(f'Game {seed} crashed; replay with --keys {path} '
+                      f'--seed {seed} -n 1', file=sys.stderr)
+    elapsed = time.perf_counter() - start
+
+    counters = [stats for display in displays
+                for stats in display.stats.values()]
+    print(f'games:     {args.games} ({crashes} crashed)')
+    print(f'time:      {elapsed:.3f} s, {elapsed / args.games * 1000:.2f} '
+          f'ms per game, {args.games / elapsed:.0f} games/s')
+    if displays:
+        frames = sum(stats['frames'] for stats in counters)
+        prompts = sum(stats['prompts'] for stats in counters)
+        output = sum(stats['bytes'] for stats in counters)
+        print(f'frames:    {frames / len(displays):.0f} per game')
+        print(f'prompts:   {prompts / len(displays):.0f} per game')
+        print(f'output:    {output / len(displays) / 1024:.1f} KiB per game')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""Compares the skill generator of the cadets with the uniform sampler
+
+Both ways to draw the skill values of a cadet are measured:
+
+- generator: the step-by-step rules of Cadets.__cadet_skill_generator()
+- uniform: one index drawn from the table of Cadets.compositions()
+
+For each of them, the skill values of many cadets are drawn through
+Cadets.recruit() and compared with the uniform distribution over all valid
+combinations: a chi-square test, the share of combinations that were drawn
+at all, the ratio between the most and least frequent combination, and the
+average value of each skill. Throughput is measured for recruit() and, if
+NumPy is installed, for Cadets.generate_batch().
+
+Usage (from the repository root):
+    python -m benchmarks.skill_sampler
+    python -m benchmarks.skill_sampler -n 1000000 --seed 7
+"""
+import argparse
+import math
+import random
+import time
+from collections import Counter
+from game.components.cadets import Cadets
+
+SKILLS = ['Captain', 'Doctor', 'Engineer', 'Pilot', 'Security']
+NAMES = [f'Cadet {nr}' for nr in range(1, 7)]
+SAMPLERS = {'generator': False, 'uniform': True}
+
+
+def draw(uniform: bool, cadets: int) -> tuple:
+    """Draws the skill values of cadets through Cadets.recruit()
+
+    Args:
+        uniform (bool): Value for Cadets.UNIFORM_SKILLS
+        cadets (int): Minimum amount of cadets to draw
+
+    Returns:
+        tuple: Counter of the drawn skill value tuples, and the cadets
+            drawn per second
+    """
+    Cadets.UNIFORM_SKILLS = uniform
+    roster = Cadets(skills=SKILLS, all_names=NAMES)
+    counts = Counter()
+    rosters = math.ceil(cadets / len(NAMES))
+    start = time.perf_counter()
+    for _ in range(rosters):
+        roster.recruit()
+        for values in roster.cadets.values():
+            counts[tuple(values.values())] += 1
+    duration = time.perf_counter() - start
+    return counts, rosters * len(NAMES) / duration
+
+
+def batch_throughput(uniform: bool, rosters: int, seed: int) -> float:
+    """Measures Cadets.generate_batch()
+
+    Args:
+        uniform (bool): Value for Cadets.UNIFORM_SKILLS
+        rosters (int): Amount of rosters to generate
+        seed (int): Seed of the NumPy generator
+
+    Returns:
+        float: Cadets drawn per second; None if NumPy is not installed
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    Cadets.UNIFORM_SKILLS = uniform
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    Cadets.generate_batch(rosters, rng)
+    return rosters * len(NAMES) / (time.perf_counter() - start)
+
+
+def chi_square(counts: Counter, table: list) -> tuple:
+    """Tests drawn values against the uniform distribution over a table
+
+    Args:
+        counts (Counter): Amount of draws per skill value tuple
+        table (list): All valid skill value tuples
+
+    Returns:
+        tuple: Chi-square statistic, degrees of freedom and the p-value,
+            approximated with the Wilson-Hilferty transformation
+    """
+    total = sum(counts.values())
+    expected = total / len(table)
+    statistic = sum((counts[values] - expected) ** 2 / expected
+                    for values in table)
+    freedom = len(table) - 1
+    # The cube root of chi-square / freedom is approximately normal
+    z = ((statistic / freedom) ** (1 / 3) - (1 - 2 / (9 * freedom))) \
+        / math.sqrt(2 / (9 * freedom))
+    return statistic, freedom, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def report(name: str, counts: Counter, table: list, speed: float,
+           batch_speed: float):
+    """Prints the statistics and throughput of one sampler
+
+    Args:
+        name (str): Name of the sampler
+        counts (Counter): Amount of draws per skill value tuple
+        table (list): All valid skill value tuples
+        speed (float): Cadets per second through recruit()
+        batch_speed (float): Cadets per second through generate_batch(),
+            or None
+    """
+    total = sum(counts.values())
+    statistic, freedom, p_value = chi_square(counts, table)
+    drawn = [counts[values] for values in table]
+    invalid = total - sum(drawn)
+    means = [sum(values[idx] * count for values, count in counts.items())
+             / total for idx in range(len(SKILLS))]
+    print(f'== {name}')
+    print(f'chi-square:     {statistic:.0f} with {freedom} degrees of '
+          f'freedom, p = {p_value:.3g}')
+    print(f'coverage:       {sum(1 for count in drawn if count)} of '
+          f'{len(table)} combinations, {invalid} invalid draws')
+    print(f'max/min ratio:  '
+          + (f'{max(drawn) / min(drawn):.1f}' if min(drawn) else 'inf'))
+    print('mean per skill: '
+          + ', '.join(f'{mean:.2f}' for mean in means))
+    print(f'recruit():      {speed:,.0f} cadets/s')
+    if batch_speed is not None:
+        print(f'batch:          {batch_speed:,.0f} cadets/s')
+    print()
+
+
+def main():
+    """Draws cadets with both samplers and prints the comparison"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--cadets', type=int, default=300_000,
+                        help='cadets per sampler (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    table = Cadets.compositions(len(SKILLS))
+    print(f'{len(table)} valid combinations, '
+          f'{args.cadets / len(table):.0f} draws per combination\n')
+    for name, uniform in SAMPLERS.items():
+        random.seed(args.seed)
+        counts, speed = draw(uniform, args.cadets)
+        batch_speed = batch_throughput(
+            uniform, math.ceil(args.cadets / len(NAMES)), args.seed)
+        report(name, counts, table, speed, batch_speed)
+    Cadets.UNIFORM_SKILLS = False
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 const Pty = require('node-pty');
 const fs = require('fs');
+const net = require('net');
 
 exports.install = function () {
 
@@ -15,6 +16,24 @@ function socket() {
 
     this.on('open', function (client) {
 
+        if (process.env.GAME_HOST_PORT) {
+            // Connect to the shared game host (server.py) instead of
+            // spawning one Python process per player
+            client.conn = net.connect(process.env.GAME_HOST_PORT, '127.0.0.1');
+            client.conn.setEncoding('utf8');
+            client.conn.on('data', function (data) {
+                client.send(data);
+            });
+            client.conn.on('close', function () {
+                client.conn = null;
+                client.close();
+            });
+            client.conn.on('error', function (err) {
+                console.log('Game host error: ', err.message);
+            });
+            return;
+        }
+
         // Spawn terminal
         client.tty = Pty.spawn('python3', ['run.py'], {
             name: 'xterm-color',
@@ -37,6 +56,10 @@ function socket() {
     });
 
     this.on('close', function (client) {
+        if (client.conn) {
+            client.conn.destroy();
+            client.conn = null;
+        }
         if (client.tty) {
             client.tty.kill(9);
             client.tty = null;
@@ -46,6 +69,7 @@ function socket() {
 
     this.on('message', function (client, msg) {
         client.tty && client.tty.write(msg);
+        client.conn && client.conn.write(msg);
     });
 }
 
@@ -0,0 +1,153 @@
+"""Contains the Admission class which limits the amount of concurrent games
+
+When more players connect than the host can serve, starting a game for each
+of them would slow down every game that is already running, or exhaust the
+memory. An Admission lets new players wait in a queue instead, where they
+see their position, until a game has ended and enough memory is available.
+
+The class only keeps the count and the queue; GameHost and Zygote admit and
+notify the waiting players in their own way.
+"""
+from collections import deque
+
+
+class Admission:
+    """Decides when waiting players may start their game
+
+    Players are admitted in the order in which they have joined the queue.
+
+    Args:
+        limit (int, optional): Maximum amount of games running at the same
+            time. Defaults to None, which doesn't limit the amount.
+        min_memory (int, optional): Available system memory in MiB that
+            must be left for a new game to be started. Defaults to None,
+            which doesn't check the memory.
+
+    Attributes:
+        MEMINFO (str): Path of the Linux file with the memory statistics;
+            on other systems, the memory is not checked
+        POLL_INTERVAL (float): Seconds after which waiting players check
+            again whether memory has become available
+        WAITING_TEXT (str): Text of the waiting screen
+        limit (int): Maximum amount of games running at the same time, or
+            None
+        min_memory (int): Minimum available memory in MiB, or None
+        active (int): Amount of games running
+        queue (deque): Tickets of the waiting players; any object that
+            identifies a player
+
+    Methods:
+        join(): Adds a player to the queue
+        cancel(): Removes a player who has left from the queue
+        admit(): Admits waiting players as long as there is room
+        leave(): Frees the place of a game that has ended
+        position(): Returns the position of a player in the queue
+        has_room(): Checks whether another game can be started
+        available_memory(): Returns the available system memory
+        waiting_screen(): Returns the waiting screen for a position
+    """
+    MEMINFO = '/proc/meminfo'
+    POLL_INTERVAL = 1.0
+    WAITING_TEXT = ('All simulators are busy right now.\r\n'
+                    '  Your place in the queue: {}\r\n\r\n'
+                    '  Your game starts automatically. Please wait...')
+
+    def __init__(self, limit=None, min_memory=None):
+        self.limit = limit
+        self.min_memory = min_memory
+        self.active = 0
+        self.queue = deque()
+
+    def join(self, ticket) -> int:
+        """Adds a player to the end of the queue
+
+        Args:
+            ticket: Any object that identifies the player
+
+        Returns:
+            int: The player's position in the queue, starting at 1
+        """
+        self.queue.append(ticket)
+        return len(self.queue)
+
+    def cancel(self, ticket):
+        """Removes a player who has left from the queue
+
+        Args:
+            ticket: The object passed to join()
+        """
+        if ticket in self.queue:
+            self.queue.remove(ticket)
+
+    def admit(self) -> list:
+        """Admits waiting players as long as there is room for their games
+
+        Returns:
+            list: Tickets of the admitted players; each of them is counted
+                as an active game until leave() is called
+        """
+        admitted = []
+        while self.queue and self.has_room():
+            admitted.append(self.queue.popleft())
+            self.active += 1
+        return admitted
+
+    def leave(self):
+        """Frees the place of a game that has ended"""
+        self.active = max(0, self.active - 1)
+
+    def position(self, ticket) -> int:
+        """Returns the position of a player in the queue
+
+        Args:
+            ticket: The object passed to join()
+
+        Returns:
+            int: The position, starting at 1; 0 if the player isn't waiting
+        """
+        return self.queue.index(ticket) + 1 if ticket in self.queue else 0
+
+    def has_room(self) -> bool:
+        """Checks whether another game can be started
+
+        Returns:
+            bool: True if fewer than limit games are running and at least
+                min_memory MiB of memory are available
+        """
+        if self.limit is not None and self.active >= self.limit:
+            return False
+        if self.min_memory is None:
+            return True
+        available = self.available_memory()
+        return available is None or available >= self.min_memory
+
+    def available_memory(self) -> int:
+        """Returns the memory that is available for new processes
+
+        Returns:
+            int: Available memory in MiB; None if it can't be determined
+        """
+        try:
+            with open(self.MEMINFO, encoding='ascii') as file:
+                for line in file:
+                    if line.startswith('MemAvailable:'):
+                        # The value is given in KiB
+                        return int(line.split()[1]) // 1024
+        except OSError:
+            pass
+        return None
+
+    def waiting_screen(self, position: int) -> bytes:
+        """Returns the waiting screen for a position in the queue
+
+        The screen is plain text without a Display, so that waiting players
+        use almost no memory.
+
+        Args:
+            position (int): The position in the queue
+
+        Returns:
+            bytes: Output for the player's terminal
+        """
+        text = self.WAITING_TEXT.format(position)
+        return f'\033[2J\033[H\r\n  {text}'.encode()
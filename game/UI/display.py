@@ -1,9 +1,18 @@
-"""Contains Display class which handles all screen output"""
+"""Contains Display class which handles all screen output
+
+Display never blocks. The methods that need input or time to pass, such as
+read_key(), wait() and play_frames(), are generators: they yield a request
+and receive the answer (see game/UI/session.py), so they must be called with
+'yield from'.
+"""
 import math
 import random
+import sys
 import time
-from typing import Union
+from typing import Callable, Union
 from colorama import just_fix_windows_console
+from game.UI.session import KEY, LINE, SLEEP
+from game.UI.width import display_width, pad
 
 
 class Display:
@@ -11,7 +20,8 @@ class Display:
 
     Contains screen and output formatting data, formats and handles all
     print operations.
-    All Display methods expect strings or list elements with <76 characters.
+    All Display methods expect strings or list elements with <76 characters
+    (measured in terminal cells, see game/UI/width.py).
 
     The Display class is used to print on screen:
     - Print menu choices on the screen:
@@ -20,10 +30,11 @@ class Display:
         display.build_menu(error_message_string, is_error=True)
     - Print a text above the menu:
         display.build_screen(
-            str||list||dict, starting_row_nr, center, ansi)
+            str||list||dict, starting_row_nr, center)
         Valid starting_row_nr values: 1-18.
         Set 'center=True' to center the string or list.
-        Set 'ansi=11' if the passed string or list elements contain ANSI codes.  
+        Strings may contain ANSI codes and Unicode characters of any width;
+        they are measured by their terminal cell width.
     - Clear error message:
         display.clear(is_error=True)
     - Clear menu line:
@@ -33,10 +44,13 @@ class Display:
     - Clear specific rows:
         display.clear([1,2,...])
     - Take user input with correct placement and formatting of the prompt:
-        input(self.display.build_input()).strip()
+        key = yield from display.read_key() for single-key menu choices and
+            ENTER prompts,
+        line = yield from display.read_line() for text such as the player
+            name
 
-    The output is finally rendered on screen only when input() is called.
-    To render output in-between (for example when using time.sleep), call
+    The output is finally rendered on screen only when input is requested.
+    To render output in-between (for example before display.wait()), call
     display.draw().
     
     Args:
@@ -51,9 +65,20 @@ class Display:
         ERROR_ROW_NR (int): Index of the row with error output
         MENU_ROW_NR (int): Index of the row with menu elements
         RED_BG, BRIGHT_GREEN, RESET (str): ANSI color codes
+        FRAME_INTERVAL (float): Default time between two animation frames;
+            identical draws within this interval are skipped
+        LOGO_VARIANTS (int): Amount of different reveal orders of the logo
+            animation, one of which is played at random
+        frame_cache (dict): Precomputed animation frames, shared by all
+            Display instances so that they are only computed once per process
+        screen_cache (dict): Rows of static screens per text catalog version,
+            shared by all Display instances
         rows (list): 22 strings containing all screen output
-        first_time (bool): True if Display is being initialized for the first
-            time; needed to only play loading animation once
+        listeners (list): Functions that are called after each drawn frame
+            with the arguments (rows, output): a tuple with the rows on screen
+            and the string that was written to the terminal
+        first_time (bool): True if the logo reveal animation hasn't been
+            played yet; needed to only play loading animation once
         enter_prompt (str): String to show in the input prompt when expecting
             the player to only press ENTER
 
@@ -64,8 +89,18 @@ class Display:
             dictionary passed from other functions to prepare terminal output
         build_menu(): Formats and builds menu string and error string
             to prepare terminal output
+        build_static(): Builds a static screen once and reuses its rows
+        format_dict_row(): Formats one row of a dictionary
+        blit(): Copies already formatted rows into the screen
         build_input(): Formats input prompt and calls draw to draw screen
+        read_key(): Draws the screen and waits for a single keystroke
+        read_line(): Draws the screen and reads a line of input
         draw(): Draws the screen; only needed when input prompt is not used
+        tick(): Waits until the next animation frame is due
+        wait(): Pauses the game for the given amount of seconds
+        build_frames(): Precomputes the frames of an animation
+        play_frames(): Plays precomputed animation frames
+        reveal_screen(): Plays the reveal animation of the current screen
     """
     HEIGHT = 22
     WIDTH = 80
@@ -78,10 +113,21 @@ class Display:
     RED_BG = "\033[41;1m"
     BRIGHT_GREEN = "\033[92;1m"
     RESET = "\033[0m"
+    FRAME_INTERVAL = 0.06
+    LOGO_VARIANTS = 8
+    frame_cache = {}
+    screen_cache = {}
 
     def __init__(self, sheet):
         self.sheet = sheet
         self.rows = []
+        # Frame scheduling: last drawn rows, time of the last draw and
+        # deadline of the next animation frame
+        self.__last_frame = None
+        self.__last_draw = 0.0
+        self.__frame_deadline = None
+        # Functions that are called with every frame, e.g. to broadcast it
+        self.listeners = []
         # Make sure the logo reveal animation is only played on first game load
         self.first_time = True
         self.enter_prompt = self.sheet.get_text('prompt_continue')
@@ -97,6 +143,33 @@ class Display:
         self.rows.extend([self.BORDER_CHAR * self.WIDTH for _ in range(2)])
         self.rows.append(str(self.BORDER_CHAR * self.WIDTH))
 
+    def build_static(self, key: str, build: Callable, first_row=1,
+                     last_row=18):
+        """Builds a static screen from the screen cache
+
+        Static screens only depend on the text catalog. The first time a
+        screen is requested for a catalog version, build() is called to
+        build it the usual way and the resulting rows are stored in the
+        class-level screen_cache. On all subsequent calls, the cached rows
+        are copied into self.rows in one step without calling build().
+
+        Args:
+            key (str): Unique name of the screen
+            build (Callable): Function without arguments that builds the
+                screen into self.rows, e.g. by calling build_screen()
+            first_row (int, optional): First row index that belongs to the
+                screen. Defaults to 1.
+            last_row (int, optional): Last row index that belongs to the
+                screen. Defaults to 18.
+        """
+        cache_key = (key, self.sheet.version)
+        rows = self.screen_cache.get(cache_key)
+        if rows is None:
+            build()
+            rows = tuple(self.rows[first_row:last_row + 1])
+            self.screen_cache[cache_key] = rows
+        self.blit(rows, first_row)
+
     def clear(self, indexes=None, is_error=False):
         """Clears specific rows in the terminal
 
@@ -120,7 +193,7 @@ class Display:
                 self.rows[index] = self.EMPTY_ROW
 
     def build_screen(self, text: Union[str, list, dict], row_nr=1,
-                     center=False, center_logo=False, ansi=0):
+                     center=False, center_logo=False):
         """Prepares a text for terminal output above the menu row
 
         Receives a string, list, or dictionary and passes it on to the
@@ -132,22 +205,19 @@ class Display:
             center (bool, optional): States whether the message should be
                 centered on screen. Defaults to False.
             center_logo (bool, optional): States whether the message is the
-                logo, which requires its own build logic and animation.
-            ansi (int, optional): Amount of ANSI chars to subtract from the
-                string length when building the correct string with borders;
-                ansi=11 seems to work for all cases in this game.
+                logo, which requires its own build logic.
         """
         if not text:
             return
         # String processing
         if isinstance(text, str):
-            self.__build_from_string(text, row_nr, center, ansi)
+            self.__build_from_string(text, row_nr, center)
         # List processing
         elif isinstance(text, list):
             if center_logo:
                 self.__build_logo_from_list(text, row_nr)
             else:
-                self.__build_from_list(text, row_nr, center, ansi)
+                self.__build_from_list(text, row_nr, center)
         # Dictionary processing:
         elif isinstance(text, dict):
             self.__build_from_dict(text, row_nr)
@@ -167,12 +237,13 @@ class Display:
                 Defaults to False.
         """
         if is_error:
-            result = (f'{self.BORDER_CHAR}{self.RED_BG}{" "}{text:>76}{" "}'
+            result = (f'{self.BORDER_CHAR}{self.RED_BG}{" "}'
+                      f'{" " * (76 - display_width(text)) + text}{" "}'
                       f'{self.RESET}{self.BORDER_CHAR}')
             self.rows[self.ERROR_ROW_NR] = result
         else:
-            result = (f'{self.BORDER_CHAR}{self.BRIGHT_GREEN}{"▶ "}{text:<74}'
-                      f'{"◀ "}{self.RESET}{self.BORDER_CHAR}')
+            result = (f'{self.BORDER_CHAR}{self.BRIGHT_GREEN}{"▶ "}'
+                      f'{pad(text, 74)}{"◀ "}{self.RESET}{self.BORDER_CHAR}')
             self.rows[self.MENU_ROW_NR] = result
 
     def build_input(self, prompt='', prompt_enter=False) -> str:
@@ -180,7 +251,8 @@ class Display:
 
         Calls draw() to draw the terminal. Thus, the screen is always re-drawn
         whenever user input is required.
-        This method is supposed to be called as an argument to input().
+        This method is called by read_key() and read_line(), but can also be
+        called as an argument to input().
 
         Args:
             prompt (str, optional): Prompt to put before the user input.
@@ -192,17 +264,68 @@ class Display:
             str: String with user input decoration and prompt
         """
         self.draw()
+        # The input echo changes the terminal, so the next draw() must not be
+        # skipped even if the rows stay the same
+        self.__last_frame = None
         if prompt_enter:
             prompt = self.enter_prompt
 
         return self.BRIGHT_GREEN + self.INPUT_PROMPT + prompt + self.RESET
 
+    def read_key(self, prompt='', prompt_enter=False, valid=None):
+        """Draws the terminal and waits for a single keystroke
+
+        Used for all menu choices and for ENTER prompts, which don't need a
+        whole line of input. A valid key that the player has typed ahead is
+        returned right away.
+        Generator: must be called with 'yield from'.
+
+        Args:
+            prompt (str, optional): Prompt to put before the user input.
+                Defaults to ''.
+            prompt_enter (bool, optional): States whether player should be
+                prompted for the ENTER key. Only ENTER is then accepted from
+                the type-ahead queue.
+            valid (Collection, optional): Menu choices accepted from the
+                type-ahead queue. Defaults to None, which accepts any key.
+
+        Yields:
+            tuple: The request (KEY, valid)
+
+        Returns:
+            str: The pressed key without surrounding whitespace
+        """
+        if prompt_enter and valid is None:
+            valid = ('',)
+        self.__emit(self.build_input(prompt, prompt_enter), prompt=True)
+        return (yield (KEY, valid))
+
+    def read_line(self, prompt='', prompt_enter=False):
+        """Draws the terminal and reads a whole line of user input
+
+        Generator: must be called with 'yield from'.
+
+        Args:
+            prompt (str, optional): Prompt to put before the user input.
+                Defaults to ''.
+            prompt_enter (bool, optional): States whether player should be
+                prompted for the ENTER key.
+
+        Yields:
+            tuple: The request (LINE, None)
+
+        Returns:
+            str: The entered line without surrounding whitespace
+        """
+        self.__emit(self.build_input(prompt, prompt_enter), prompt=True)
+        return (yield (LINE, None))
+
     def draw(self, shallow_clear=False):
         """Clears the previous screen and re-draws the new terminal
 
         This function is usually called by build_input() to draw the screen
         just before receiving user input. It should be used on its own only
-        before time.sleep() in order to avoid unnecessary re-drawing of the
+        before wait() or tick() in order to avoid unnecessary re-drawing of the
         screen when the user can't even see the result.
         
         Args:
@@ -211,21 +334,215 @@ class Display:
                 clearing the entire terminal. Reduces flickering while an
                 animation is being rendered. Defaults to False.
         """
+        # Coalesce redundant draws: if the same screen has already been drawn
+        # within the current frame, e.g. by draw() followed by build_input(),
+        # there is nothing new to show
+        frame = tuple(self.rows)
+        now = time.monotonic()
+        if (frame == self.__last_frame
+                and now - self.__last_draw < self.FRAME_INTERVAL):
+            return
+        self.__last_frame = frame
+        self.__last_draw = now
         if shallow_clear:
             # Only moves the cursor to row 1 column 1 without clearing the
             # screen or the input prompt
-            print('\033[1;1H', end='')
+            prefix = '\033[1;1H'
         else:
             # Clears the entire screen including previous output and input
             # prompt.
             # Info found on https://stackoverflow.com/questions/2084508/
             # clear-the-terminal-in-python
-            print('\033c', end='')
-        for row in self.rows:
-            print(f'{row}')
+            prefix = '\033c'
+        self.__emit(prefix + ''.join(f'{row}\n' for row in self.rows), frame)
+
+    def tick(self, interval=FRAME_INTERVAL):
+        """Waits until the next animation frame is due
+
+        The deadline of each frame is calculated from the deadline of the
+        previous frame instead of the current time. Thus, the time needed to
+        render a frame is subtracted from the waiting time and the animation
+        keeps a steady pace. If the previous deadline lies more than one
+        interval in the past, e.g. because a new animation starts, the
+        deadlines are counted from now.
+        Generator: must be called with 'yield from'.
+
+        Args:
+            interval (float, optional): Seconds between two frames. Defaults
+                to FRAME_INTERVAL.
+
+        Yields:
+            tuple: The request (SLEEP, deadline)
+
+        Returns:
+            bool: True if the player pressed a key while waiting
+        """
+        now = time.monotonic()
+        if (self.__frame_deadline is None
+                or now - self.__frame_deadline > interval):
+            self.__frame_deadline = now
+        self.__frame_deadline += interval
+        return (yield (SLEEP, self.__frame_deadline))
+
+    def wait(self, seconds: float):
+        """Pauses the game for the given amount of seconds
+
+        The pause ends early as soon as the player presses a key. The key is
+        kept for the next prompts (type-ahead).
+        Generator: must be called with 'yield from'.
+
+        Args:
+            seconds (float): Seconds to wait
+
+        Yields:
+            tuple: The request (SLEEP, deadline)
+
+        Returns:
+            bool: True if the player pressed a key while waiting
+        """
+        return (yield (SLEEP, time.monotonic() + seconds))
+
+    def __emit(self, text: str, frame=None, prompt=False):
+        """Outputs one frame and passes it on to all listeners
+
+        Args:
+            text (str): Output including ANSI escape sequences
+            frame (tuple, optional): The rows shown by this frame. Defaults to
+                the current content of self.rows.
+            prompt (bool, optional): True if the text is the input prompt
+                rather than a frame. Defaults to False.
+        """
+        self._write(text, prompt)
+        if self.listeners:
+            frame = frame or tuple(self.rows)
+            for listener in self.listeners:
+                listener(frame, text)
+
+    def _write(self, text: str, prompt=False):
+        """Writes a string to the terminal
+
+        All screen output passes through this method. Other backends, such as
+        HeadlessDisplay, override it to send the output elsewhere.
+
+        Args:
+            text (str): Output including ANSI escape sequences
+            prompt (bool, optional): True if the text is the input prompt
+                written by read_key() or read_line(), False if it is a frame
+                written by draw() or play_frames(). Defaults to False.
+        """
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def build_frames(self, frames: list, row_nr=1, center=False) -> tuple:
+        """Precomputes animation frames for play_frames()
+
+        Receives a list of frames, where each frame is a list of strings to
+        be shown starting at row_nr, and formats them exactly like
+        build_screen() does. The formatted rows are compared with the previous
+        frame so that only changed rows are kept. The first frame always
+        contains all rows of the animation area.
+        self.rows is not modified by this method, so the result can be cached
+        and played on any Display instance.
+
+        Args:
+            frames (list): List of frames, each a list of strings
+            row_nr (int, optional): Row index at which each frame starts.
+                Defaults to 1.
+            center (bool, optional): States whether the frame lines should be
+                centered on screen. Defaults to False.
+
+        Returns:
+            tuple: Frames in the format (changes, output) where changes is a
+                tuple of (row index, row string) pairs and output is the
+                string that draws all changes directly in the terminal
+        """
+        saved_rows = self.rows
+        self.rows = saved_rows[:]
+        previous = {}
+        result = []
+        for lines in frames:
+            self.build_screen(lines, row_nr, center)
+            current = {idx: self.rows[idx]
+                       for idx in range(row_nr, row_nr + len(lines))}
+            result.append(self.__make_frame(
+                [(idx, row) for idx, row in current.items()
+                 if previous.get(idx) != row]))
+            previous = current
+        self.rows = saved_rows
+        return tuple(result)
+
+    def play_frames(self, frames: tuple, delay: float):
+        """Plays precomputed animation frames
+
+        Writes each frame straight to the terminal instead of re-drawing the
+        whole screen and keeps self.rows up to date, so that the last frame
+        stays on screen after the animation.
+        If the player presses a key during the animation, the remaining
+        frames are skipped and the final frame is drawn at once.
+        Generator: must be called with 'yield from'.
+
+        Args:
+            frames (tuple): Frames as returned by build_frames()
+            delay (float): Seconds to wait after each frame
+
+        Yields:
+            tuple: One request (SLEEP, deadline) per frame
+        """
+        skipped = False
+        for changes, output in frames:
+            for idx, row in changes:
+                self.rows[idx] = row
+            if skipped:
+                # Only update the rows to reach the final frame
+                continue
+            self.__emit(output)
+            skipped = yield from self.tick(delay)
+        if skipped:
+            self.draw(shallow_clear=True)
+
+    def reveal_screen(self):
+        """Plays the reveal animation of the current screen once
+
+        The screen is first filled with block characters, which then
+        disappear in random order to reveal the content of self.rows. The
+        animation is only played the first time this method is called.
+        Generator: must be called with 'yield from'.
+
+        Yields:
+            tuple: Requests (SLEEP, deadline) for the pauses and frames
+        """
+        if not self.first_time:
+            return
+        # This bool makes sure that the reveal animation is only played
+        # once at game start, not every time the player reaches the outer
+        # menu.
+        self.first_time = False
+        if (yield from self.wait(0.5)):
+            # The player pressed a key: show the screen right away
+            return
+        frames = self.__get_logo_frames()
+        # Overwrite the screen to fill it with block characters; the
+        # first frame draws all rows, so no extra draw is needed here
+        self.rows = [str(self.BORDER_CHAR * self.WIDTH)
+                     for _ in range(self.HEIGHT)]
+        yield from self.play_frames(frames, 0.06)
+
+    def __make_frame(self, changes: list) -> tuple:
+        """Builds one animation frame from a list of changed rows
+
+        The output string moves the cursor to the beginning of each changed
+        row before printing it, which makes clearing the screen unnecessary.
+
+        Args:
+            changes (list): List with (row index, row string) pairs
 
-    def __build_from_string(self, text: str, row_nr: int, center: bool,
-                            ansi: int):
+        Returns:
+            tuple: Frame in the format (changes, output)
+        """
+        output = ''.join(f'\033[{idx + 1};1H{row}' for idx, row in changes)
+        return (tuple(changes), output)
+
+    def __build_from_string(self, text: str, row_nr: int, center: bool):
         """Prepares a string for terminal output
         
         Receives a string, formats its contents, and overwrites the specified
@@ -236,29 +553,32 @@ class Display:
                 terminal output 
             row_nr (int): Row number at which to display the string
             center (bool): True if the string must be centered on the screen 
-            ansi (int): Amount of ANSI color code chars to be subtracted
+        """
+        self.rows[row_nr] = self.__format_row(text, center)
+
+    def __format_row(self, text: str, center: bool) -> str:
+        """Formats a string as a complete screen row with border chars
+
+        The string is padded according to its width in terminal cells, so
+        ANSI codes and wide characters don't disrupt the row length.
+
+        Args:
+            text (str): Raw string with <76 characters
+            center (bool): True if the string must be centered on the screen
+
+        Returns:
+            str: Screen row with a visible width of 80 cells
         """
         # If the text will be centered, it must be prefaced with the
         # following amount of whitespaces:
         # max screen width (80) minus 2 border chars (->78)
-        # minus length of text, result divided by 2.
-        # If an ANSI code is present, the amount of ANSI chars must be
-        # subtracted from the text length and added to the total width
-        # to achieve the correct row length.
+        # minus width of text, result divided by 2.
         if center:
-            width = "<" + str(78 + ansi)
-            str_len = len(text) - ansi
-            result = (f'{self.BORDER_CHAR}'
-                      f'{" "*math.ceil((78-str_len)/2) + text:{width}}'
-                      f'{self.BORDER_CHAR}')
-            self.rows[row_nr] = result
-            return
-
-        # Build a row from a string, aligned to the left
-        width = "<" + str(76 + ansi)
-        result = (f'{self.BORDER_CHAR}{" "}{text:{width}}{" "}'
+            indent = " " * math.ceil((78 - display_width(text)) / 2)
+            return (f'{self.BORDER_CHAR}{pad(indent + text, 78)}'
                     f'{self.BORDER_CHAR}')
-        self.rows[row_nr] = result
+        # Build a row from a string, aligned to the left
+        return f'{self.BORDER_CHAR} {pad(text, 76)} {self.BORDER_CHAR}'
 
     def __build_logo_from_list(self, text: list, row_nr: int):
         """Prepares the logo for terminal output
@@ -266,80 +586,79 @@ class Display:
         Receives the logo as a list, formats the contents of each element,
         and overwrites the specified rows of self.rows with the contents,
         starting at row_nr.
-        If this method is called for the first time at game start, the logo
-        reveal animation is played.
         
         Args:
             text (str): List with raw strings with <78 characters each to be
                 prepared for terminal output 
             row_nr (int): Row number at which to display the first element
         """
-        if self.first_time:
-            # This bool makes sure that the reveal animation is only played
-            # once at game start, not every time the player reaches the outer
-            # menu.
-            self.first_time = False
-            time.sleep(0.5)
-            self.flush_input()
-            # Build the formatted screen rows with the logo inside
-            for idx, line in enumerate(text):
-                result = (f'{self.BORDER_CHAR}{" "*24 + line:<78}'
-                          f'{self.BORDER_CHAR}')
-                self.rows[row_nr + idx] = result
-            # Turn the logo screen into a list with 22 rows where each row
-            # contains a list of single characters
-            rows_matrix_logo = []
-            for row in self.rows:
-                rows_matrix_logo.append(list(row))
-            # Overwrite the screen to fill it with block characters
-            self.rows = [str(self.BORDER_CHAR * self.WIDTH)
-                         for _ in range(self.HEIGHT)]
-            # Turn the filled screen into a list with 22 rows where each row
-            # contains a list of single block characters
-            rows_matrix_filled = []
-            for row in self.rows:
-                rows_matrix_filled.append(list(row))
-            # Create a list with coordinate tuples for 22 rows and 80 columns
-            coord_list = [(x, y) for x in range(self.HEIGHT)
-                          for y in range(self.WIDTH)]
-            len_coord = len(coord_list)
-            # Loop over the coordinates list, randomly select several coords,
-            # overwrite the filled screen characters with the logo screen
-            # characters at the selected coordinates, and draw the screen.
-            # 26 reps are needed to reveal the logo screen, but since
-            # len_coord/60 is 29, 3 must be subtracted.
-            for x in range(math.floor(len_coord/60)-3):
-                # 10+x*5 makes sure that with each loop, more characters are
-                # revealed at once.
-                for _ in range(10+x*5):
-                    if len(coord_list) > 0:
-                        idx = random.choice(range(len(coord_list)))
-                        row = coord_list[idx][0]
-                        col = coord_list[idx][1]
-                        rows_matrix_filled[row][col] = \
-                            rows_matrix_logo[row][col]
-                        coord_list.pop(idx)
-                    else:
-                        break
-                # Join the single characters of the revealed logo to form
-                # proper strings again
-                for i in range(len(self.rows)):
-                    self.rows[i] = ''.join(rows_matrix_filled[i])
-                self.draw(shallow_clear=True)
-                time.sleep(0.06)
-                # Disable keyboard input while sleeping
-                self.flush_input()
-            return
-
-        # Build logo without animation on subsequent playthroughs
         for idx, line in enumerate(text):
-            result = (f'{self.BORDER_CHAR}{" "*24 + line:<78}'
+            result = (f'{self.BORDER_CHAR}{pad(" "*24 + line, 78)}'
                       f'{self.BORDER_CHAR}')
             self.rows[row_nr + idx] = result
-        return
 
-    def __build_from_list(self, text: list, row_nr: int, center:bool,
-                          ansi:int):
+    def __get_logo_frames(self) -> tuple:
+        """Returns the frames of the logo reveal animation
+
+        The frames are computed from the current content of self.rows, which
+        must already contain the finished logo screen. LOGO_VARIANTS reveal
+        orders are computed at once and stored in the class-level
+        frame_cache, and every playback picks one of them at random, so
+        players don't all see the same animation.
+
+        See build_frames() for the frame format.
+
+        Returns:
+            tuple: Frames needed to reveal the logo screen
+        """
+        key = ('logo', tuple(self.rows))
+        if key not in self.frame_cache:
+            self.frame_cache[key] = tuple(
+                self.__build_logo_frames() for _ in range(self.LOGO_VARIANTS))
+        return random.choice(self.frame_cache[key])
+
+    def __build_logo_frames(self) -> tuple:
+        """Computes the logo reveal animation with a random reveal order
+
+        Returns:
+            tuple: Frames needed to reveal the logo screen
+        """
+        # Turn the logo screen into a list with 22 rows where each row
+        # contains a list of single characters
+        rows_matrix_logo = [list(row) for row in self.rows]
+        # Turn a screen filled with block characters into a list with 22 rows
+        # where each row contains a list of single block characters
+        rows_matrix_filled = [list(self.BORDER_CHAR * self.WIDTH)
+                              for _ in range(self.HEIGHT)]
+        # Shuffle all cell numbers for 22 rows and 80 columns once instead of
+        # randomly picking and removing coordinates from a list
+        reveal_order = list(range(self.HEIGHT * self.WIDTH))
+        random.shuffle(reveal_order)
+        frames = []
+        start = 0
+        # 26 reps are needed to reveal the logo screen, but since
+        # len(reveal_order)/60 is 29, 3 must be subtracted.
+        for x in range(math.floor(len(reveal_order)/60)-3):
+            # 10+x*5 makes sure that with each frame, more characters are
+            # revealed at once.
+            batch = reveal_order[start:start + 10 + x*5]
+            start += 10 + x*5
+            # The first frame must draw the entire screen filled with block
+            # characters
+            changed_rows = set() if x else set(range(self.HEIGHT))
+            for cell in batch:
+                row, col = divmod(cell, self.WIDTH)
+                if col < len(rows_matrix_logo[row]):
+                    rows_matrix_filled[row][col] = rows_matrix_logo[row][col]
+                    changed_rows.add(row)
+            # Join the single characters of the changed rows to form proper
+            # strings again
+            frames.append(self.__make_frame(
+                [(row, ''.join(rows_matrix_filled[row]))
+                 for row in sorted(changed_rows)]))
+        return tuple(frames)
+
+    def __build_from_list(self, text: list, row_nr: int, center: bool):
         """Prepares a list for terminal output
         
         Receives a list, formats the contents of each element, and overwrites
@@ -350,34 +669,34 @@ class Display:
                 prepared for terminal output 
             row_nr (int): Row number at which to display the first line
             center (bool): True if the lines must be centered on the screen 
-            ansi (int): Amount of ANSI color code chars to be subtracted from
-                each line
         """
-        if center:
-            # If the text will be centered, it must be prefaced with the
-            # following amount of whitespaces:
-            # max screen width (80) minus 2 border chars (->78)
-            # minus length of text, result divided by 2.
-            # If an ANSI code is present, the amount of ANSI chars must be
-            # subtracted from the text length and added to the total width
-            # to achieve the correct row length.
-            for idx, line in enumerate(text):
-                width = "<" + str(78 + ansi)
-                str_len = len(line) - ansi
-                result = (f'{self.BORDER_CHAR}'
-                          f'{" "*math.ceil((78-str_len)/2) + line:{width}}'
-                          f'{self.BORDER_CHAR}')
-                # Fill the final list starting at specified row index
-                self.rows[row_nr + idx] = result
-            return
-
-        # Build left-aligned list
         for idx, line in enumerate(text):
-            width = "<" + str(76 + ansi)
-            result = (f'{self.BORDER_CHAR}{" "}{line:{width}}{" "}'
-                        f'{self.BORDER_CHAR}')
             # Fill the final list starting at specified row index
-            self.rows[row_nr + idx] = result
+            self.rows[row_nr + idx] = self.__format_row(line, center)
+
+    def format_dict_row(self, key: str, value: str) -> str:
+        """Formats one row of a dictionary as shown by build_screen()
+
+        Args:
+            key (str): Key label with max 16 characters, shown on the left;
+                an empty string for all but the first value of a key
+            value (str): Value string with max 61 characters
+
+        Returns:
+            str: Screen row with border chars
+        """
+        return (f'{self.BORDER_CHAR} {pad(key, 16)}{pad(value, 61)}'
+                f'{self.BORDER_CHAR}')
+
+    def blit(self, rows: list, row_nr: int):
+        """Copies already formatted rows into self.rows in one step
+
+        Args:
+            rows (list): Complete screen rows with border chars, e.g. from
+                format_dict_row()
+            row_nr (int): Row index at which to place the first row
+        """
+        self.rows[row_nr:row_nr + len(rows)] = rows
 
     def __build_from_dict(self, text: dict, row_nr: int):
         """Prepares a dictionary for terminal output
@@ -412,36 +731,10 @@ class Display:
             # while all other strings start at column 17.
             for i in range(1, len(temp_list)):
                 if i == 1:
-                    result = (f'{self.BORDER_CHAR}{" "}'
-                                f'{temp_list[0]:<16}{temp_list[i]:<61}'
-                                f'{self.BORDER_CHAR}')
-                    self.rows[row_nr + k] = result
+                    self.rows[row_nr + k] = self.format_dict_row(
+                        temp_list[0], temp_list[i])
                 else:
-                    result = (f'{self.BORDER_CHAR}{" " * 17}'
-                                f'{temp_list[i]:<61}{self.BORDER_CHAR}')
-                    self.rows[row_nr + i + k - 1] = result
+                    self.rows[row_nr + i + k - 1] = self.format_dict_row(
+                        '', temp_list[i])
             # Update row index to skip already added lines
             k += i
-
-    # Function copied from:
-    # https://stackoverflow.com/questions/67083097/
-    # how-to-prevent-user-input-into-console-when-program-is-running-in-python
-    def flush_input(self):
-        """ Flushes any pending user input from the input buffer
-        
-        This function is needed in scenarios where time.sleep is used to create
-        a delay in the program execution before the next input prompt.
-        By flushing the input, the user is presented with a clean input prompt,
-        even if they pressed keys while waiting.
-
-        Note: This function may not work as expected in all environments.
-        """
-        try:
-            import msvcrt
-            while msvcrt.kbhit():
-                msvcrt.getch()
-        except ImportError:
-            import sys
-            # For linux/unix
-            import termios
-            termios.tcflush(sys.stdin, termios.TCIOFLUSH)
@@ -0,0 +1,97 @@
+"""Contains the HeadlessDisplay class which renders without a terminal
+
+HeadlessDisplay behaves exactly like Display, but writes all output into an
+in-memory buffer instead of stdout. Like every Display, it never sleeps or
+reads input itself; combined with a ScriptedKeyboard or an event-driven
+Session, no time is spent on pacing. It keeps count of the frames, bytes
+and ANSI escape sequences that each screen produces, so that render cost
+and output volume can be measured without a real tty.
+"""
+import io
+from contextlib import contextmanager
+from game.UI.display import Display
+from game.UI.width import ANSI_PATTERN
+
+
+class HeadlessDisplay(Display):
+    """Display backend that renders into an in-memory buffer
+
+    Usage:
+        display = HeadlessDisplay(sheet)
+        with display.measure('1_logo'):
+            Session(menu.info_screen('1_logo')).play(ScriptedKeyboard([]))
+        display.stats['1_logo']  # {'frames': 27, 'bytes': ..., ...}
+
+    Args:
+        sheet (object): Reference to Sheet class instance
+        keep_output (bool, optional): States whether the output is kept in
+            the buffer. Set to False to only count it, e.g. when thousands of
+            games are played. Defaults to True.
+
+    Attributes:
+        keep_output (bool): States whether the output is kept in the buffer
+        buffer (io.StringIO): Everything written since the last reset()
+        screen (str): Label under which output is currently counted
+        stats (dict): Output counters per screen label, format
+            {label: {'frames': int, 'prompts': int, 'bytes': int,
+            'escapes': int}}; bytes and escapes include the prompts
+
+    Methods:
+        measure(): Context manager that counts output under a screen label
+        output(): Returns everything written since the last reset()
+        reset(): Clears the buffer and all counters
+    """
+
+    def __init__(self, sheet: object, keep_output=True):
+        self.keep_output = keep_output
+        self.buffer = io.StringIO()
+        self.screen = 'default'
+        self.stats = {}
+        super().__init__(sheet)
+
+    @contextmanager
+    def measure(self, label: str):
+        """Counts all output produced inside the with-block under label
+
+        Args:
+            label (str): Name of the screen, e.g. the info_screen() part ID
+        """
+        previous = self.screen
+        self.screen = label
+        try:
+            yield self.stats.setdefault(label, self.__counters())
+        finally:
+            self.screen = previous
+
+    def output(self) -> str:
+        """Returns everything written since the last reset()
+
+        Returns:
+            str: Raw output including ANSI escape sequences
+        """
+        return self.buffer.getvalue()
+
+    def reset(self):
+        """Clears the output buffer and all counters"""
+        self.buffer = io.StringIO()
+        self.stats = {}
+
+    def _write(self, text: str, prompt=False):
+        """Writes into the buffer and counts the output for the current screen
+
+        Args:
+            text (str): Output including ANSI escape sequences
+            prompt (bool, optional): True if the text is the input prompt,
+                which is counted apart from the frames. Defaults to False.
+        """
+        if self.keep_output:
+            self.buffer.write(text)
+        counters = self.stats.setdefault(self.screen, self.__counters())
+        counters['prompts' if prompt else 'frames'] += 1
+        counters['bytes'] += len(text.encode())
+        counters['escapes'] += len(ANSI_PATTERN.findall(text))
+
+    @staticmethod
+    def __counters() -> dict:
+        """Returns the output counters of a screen that has no output yet"""
+        return {'frames': 0, 'prompts': 0, 'bytes': 0, 'escapes': 0}
@@ -0,0 +1,422 @@
+"""Contains the classes that serve many players from one process
+
+GameHost is an asyncio TCP server. Each connection gets its own Connection
+with its own StreamDisplay and Session, and run() creates a new Player,
+Cadets, Trials and Mission for it as usual. The Sheet with the text catalog
+and the class-level frame and screen caches of Display are shared by all
+sessions. Pauses are awaited as timeouts and slow Sheet requests run in
+worker threads, so no session ever blocks the others.
+
+An Admission can limit the amount of games that run at the same time;
+further players wait in a queue and see their position.
+
+With a Metrics instance, the host reports its sessions per phase, its
+memory, and the time needed for frames, key presses and Sheet requests.
+
+Sessions that stay idle at a menu prompt can be hibernated: the game state
+is saved as a Snapshot file and the game objects are dropped, so that only
+the connection itself stays in memory. The next key resumes the game.
+
+Usage:
+    def start_game(display, snapshot=None):
+        menu = Menu(display, sheet, run)
+        if snapshot is None:
+            return menu, game(menu)
+        return menu, resume(menu, snapshot)
+
+    host = GameHost(sheet, start_game, idle_timeout=600)
+    asyncio.run(host.serve(port=8002))
+
+Players can then connect with any raw terminal client, e.g.:
+    nc localhost 8002
+"""
+import asyncio
+import os
+import tempfile
+import time
+import traceback
+import uuid
+from game.UI.display import Display
+from game.UI.keyboard import Keyboard
+from game.UI.session import CALL, KEY, LINE, SLEEP, Session
+from game.UI.snapshot import Snapshot
+
+
+class StreamDisplay(Display):
+    """Display backend that writes to a network connection
+
+    Args:
+        sheet (object): Reference to Sheet class instance
+        write (Callable): Function that sends bytes to the player, e.g.
+            asyncio.StreamWriter.write
+        metrics (object, optional): Reference to Metrics class instance
+            that measures the frame render time. Defaults to None.
+
+    Every frame, whether drawn by draw() or played by play_frames(), is
+    sent by _write(), which measures it: frames of draw() from the start
+    of draw(), including building the output, and precomputed animation
+    frames from the start of sending them. Input prompts are not frames and
+    are not measured.
+    """
+
+    def __init__(self, sheet: object, write, metrics=None):
+        self.write = write
+        self.metrics = metrics
+        self.__frame_start = None
+        super().__init__(sheet)
+
+    def draw(self, shallow_clear=False):
+        """Draws the screen like Display.draw()
+
+        Args:
+            shallow_clear (bool, optional): See Display.draw()
+        """
+        # The frame is measured from here until _write() has sent it
+        self.__frame_start = time.perf_counter()
+        try:
+            super().draw(shallow_clear)
+        finally:
+            self.__frame_start = None
+
+    def _write(self, text: str, prompt=False):
+        """Sends a string to the player and measures the frame
+
+        A pty turns '\\n' into '\\r\\n'; without one, this must be done here.
+
+        Args:
+            text (str): Output including ANSI escape sequences
+            prompt (bool, optional): True if the text is the input prompt,
+                which is not measured. Defaults to False.
+        """
+        start = self.__frame_start or time.perf_counter()
+        self.write(text.replace('\n', '\r\n').encode())
+        if self.metrics is not None and not prompt:
+            self.metrics.observe('frame_render_seconds',
+                                 time.perf_counter() - start)
+
+
+class Connection:
+    """Plays one game over one network connection
+
+    Translates the raw input of the connection into Session events: single
+    keys for menu prompts and pauses, and whole lines for the player name,
+    which is edited and echoed here since there is no pty to do it.
+
+    Args:
+        host (object): Reference to GameHost class instance
+        reader (asyncio.StreamReader): Input from the player
+        writer (asyncio.StreamWriter): Output to the player
+
+    Attributes:
+        BACKSPACE (tuple): Keys that delete the last character of a line
+        host (object): Reference to GameHost class instance
+        display (object): Reference to StreamDisplay class instance; None
+            while the session is hibernated
+        menu (object): Reference to Menu class instance; None while the
+            session is hibernated
+        session (object): Reference to Session class instance; None while
+            the session is hibernated
+        snapshot_path (str): Path of the snapshot file while the session is
+            hibernated, else None
+        admitted (bool): True once the player has been admitted by the
+            host's Admission, if it has one
+        line (str): The line the player is typing
+
+    Properties:
+        phase (str): The game phase of the player, see Menu.phase, or
+            'queued' or 'hibernated'
+
+    Methods:
+        run(): Plays the game until it ends or the player disconnects
+        close(): Ends the game and closes the connection
+    """
+    BACKSPACE = ('\x7f', '\x08')
+
+    def __init__(self, host: object, reader, writer):
+        self.host = host
+        self.reader = reader
+        self.writer = writer
+        self.display = None
+        self.menu = None
+        self.session = None
+        self.snapshot_path = None
+        self.admitted = False
+        self.line = ''
+
+    @property
+    def phase(self) -> str:
+        """The game phase of the player, for the metrics"""
+        if self.snapshot_path:
+            return 'hibernated'
+        if self.menu is None:
+            return 'queued'
+        return self.menu.phase
+
+    async def run(self):
+        """Plays the game until it ends or the player disconnects"""
+        loop = asyncio.get_running_loop()
+        if self.host.admission and not await self.__wait_for_admission():
+            return
+        # Reset the player's terminal, like main() does
+        self.writer.write(b'\033c')
+        request = self.__start()
+        while request is not None:
+            kind, argument = request
+            if kind == CALL:
+                start = time.perf_counter()
+                try:
+                    result = await loop.run_in_executor(None, argument)
+                except Exception as error:
+                    request = self.session.fail(error)
+                else:
+                    request = self.session.complete(result)
+                if self.host.metrics:
+                    self.host.metrics.observe(
+                        'sheet_call_seconds', time.perf_counter() - start,
+                        call=argument.func.__name__)
+                continue
+            await self.writer.drain()
+            timeout = None
+            if kind == SLEEP:
+                timeout = argument - time.monotonic()
+            elif self.host.idle_timeout and self.menu.position:
+                timeout = self.host.idle_timeout
+            try:
+                data = await asyncio.wait_for(self.reader.read(1024), timeout)
+            except asyncio.TimeoutError:
+                if kind == SLEEP:
+                    request = self.session.wake()
+                    continue
+                self.__hibernate()
+                data = await self.reader.read(1024)
+                if data:
+                    # The key is passed on to the resumed game below
+                    request = self.__start(self.__wake())
+            if not data:
+                # The player has disconnected
+                return
+            received = time.perf_counter()
+            # Terminal clients send '\r' for ENTER, line-based ones '\r\n'
+            text = data.decode(errors='ignore').replace('\r\n', '\r')
+            for key in Keyboard.KEY_PATTERN.findall(text):
+                request = self.__handle(key)
+                if request is None:
+                    break
+            if self.host.metrics:
+                # The frames caused by the keys have been written by now
+                self.host.metrics.observe('input_latency_seconds',
+                                          time.perf_counter() - received)
+        await self.writer.drain()
+
+    def close(self):
+        """Ends the game and closes the connection"""
+        if self.session:
+            self.session.flow.close()
+        if self.snapshot_path:
+            os.remove(self.snapshot_path)
+        if self.admitted:
+            # Let the next waiting player in
+            self.host.admission.leave()
+            for ticket in self.host.admission.admit():
+                ticket.set()
+        self.writer.close()
+
+    async def __wait_for_admission(self) -> bool:
+        """Shows the waiting screen until the host admits the player
+
+        Keys typed while waiting are discarded.
+
+        Returns:
+            bool: True once admitted; False if the player has disconnected
+        """
+        admission = self.host.admission
+        ticket = asyncio.Event()
+        admission.join(ticket)
+        reading = asyncio.ensure_future(self.reader.read(1024))
+        shown = None
+        try:
+            while True:
+                for admitted in admission.admit():
+                    admitted.set()
+                if ticket.is_set():
+                    self.admitted = True
+                    return True
+                position = admission.position(ticket)
+                if position != shown:
+                    self.writer.write(admission.waiting_screen(position))
+                    shown = position
+                # Wait until a game ends, or check again for free memory
+                # and new positions after the poll interval
+                waiting = asyncio.ensure_future(ticket.wait())
+                await asyncio.wait({waiting, reading},
+                                   timeout=admission.POLL_INTERVAL,
+                                   return_when=asyncio.FIRST_COMPLETED)
+                waiting.cancel()
+                if reading.done():
+                    if not reading.result():
+                        # The player has disconnected
+                        return False
+                    reading = asyncio.ensure_future(self.reader.read(1024))
+        finally:
+            reading.cancel()
+            if ticket.is_set() and not self.admitted:
+                # Admitted just as the player left
+                admission.leave()
+            admission.cancel(ticket)
+
+    def __start(self, snapshot=None) -> tuple:
+        """Starts a new game, or resumes a game from a snapshot
+
+        Args:
+            snapshot (object, optional): Reference to Snapshot class
+                instance. Defaults to None, which starts a new game.
+
+        Returns:
+            tuple: The first request of the session
+        """
+        self.display = StreamDisplay(self.host.sheet, self.writer.write,
+                                     self.host.metrics)
+        self.menu, flow = self.host.start_game(self.display, snapshot)
+        self.session = Session(flow)
+        return self.session.start()
+
+    def __hibernate(self):
+        """Saves the game as a snapshot file and drops the game objects"""
+        snapshot = Snapshot.take(self.menu)
+        self.snapshot_path = os.path.join(
+            self.host.snapshot_dir, f'{uuid.uuid4().hex}.snapshot')
+        snapshot.save(self.snapshot_path)
+        self.session.flow.close()
+        self.display = self.menu = self.session = None
+
+    def __wake(self) -> object:
+        """Reads and removes the snapshot file of the hibernated game
+
+        Returns:
+            object: Reference to Snapshot class instance
+        """
+        snapshot = Snapshot.load(self.snapshot_path)
+        os.remove(self.snapshot_path)
+        self.snapshot_path = None
+        return snapshot
+
+    def __handle(self, key: str) -> tuple:
+        """Passes one key to the session
+
+        Args:
+            key (str): One key as matched by Keyboard.KEY_PATTERN
+
+        Returns:
+            tuple: The next request of the session
+        """
+        if self.session.request[0] != LINE:
+            if self.session.request[0] == KEY and key.isprintable():
+                self.writer.write(key.encode())
+            return self.session.feed(key)
+        # Line editing for the player name
+        if key in ('\r', '\n'):
+            line, self.line = self.line, ''
+            return self.session.feed(line)
+        if key in self.BACKSPACE:
+            if self.line:
+                self.line = self.line[:-1]
+                self.writer.write(b'\b \b')
+        elif len(key) == 1 and key.isprintable():
+            self.line += key
+            self.writer.write(key.encode())
+        return self.session.request
+
+
+class GameHost:
+    """Hosts any number of concurrent game sessions in one event loop
+
+    Args:
+        sheet (object): Reference to Sheet class instance, shared by all
+            sessions
+        start_game (Callable): Function that receives the Display of a
+            connection and a Snapshot to resume from, or None for a new
+            game, and returns the Menu and the game flow (see module
+            docstring)
+        idle_timeout (float, optional): Seconds after which a session that
+            waits at a menu prompt is hibernated. Defaults to None, which
+            never hibernates sessions.
+        snapshot_dir (str, optional): Directory for the snapshot files of
+            hibernated sessions. Defaults to the system's temp directory.
+        admission (object, optional): Reference to Admission class
+            instance that limits the amount of concurrent games. Defaults
+            to None, which starts every game at once.
+        metrics (object, optional): Reference to Metrics class instance.
+            Defaults to None, which measures nothing.
+
+    Attributes:
+        connections (set): All connections with a running game
+
+    Methods:
+        serve(): Accepts players until the program is stopped
+        play(): Plays one game over a connection
+    """
+
+    def __init__(self, sheet: object, start_game, idle_timeout=None,
+                 snapshot_dir=None, admission=None, metrics=None):
+        self.sheet = sheet
+        self.start_game = start_game
+        self.idle_timeout = idle_timeout
+        self.snapshot_dir = snapshot_dir or tempfile.gettempdir()
+        self.admission = admission
+        self.metrics = metrics
+        if metrics:
+            metrics.collect = self.__collect_metrics
+        self.connections = set()
+
+    async def serve(self, host='', port=8002):
+        """Accepts players until the program is stopped
+
+        Args:
+            host (str, optional): Interface to listen on. Defaults to all.
+            port (int, optional): TCP port to listen on. Defaults to 8002.
+        """
+        if self.metrics:
+            asyncio.ensure_future(self.metrics.run())
+        server = await asyncio.start_server(self.play, host, port)
+        async with server:
+            await server.serve_forever()
+
+    def __collect_metrics(self):
+        """Sets the gauges of the metrics before they are rendered"""
+        phases = dict.fromkeys(self.metrics.PHASES, 0)
+        for connection in self.connections:
+            phases[connection.phase] = phases.get(connection.phase, 0) + 1
+        for phase, count in phases.items():
+            self.metrics.set_gauge('sessions', count, phase=phase)
+        resident = self.metrics.resident_bytes()
+        if resident is not None:
+            self.metrics.set_gauge('process_resident_bytes', resident)
+            # Games share this process, so only their average is known.
+            # Queued and hibernated players have no game in memory.
+            live = sum(count for phase, count in phases.items()
+                       if phase not in ('queued', 'hibernated'))
+            self.metrics.set_gauge('process_resident_bytes_per_session',
+                                   resident // live if live else 0)
+
+    async def play(self, reader, writer):
+        """Plays one game over a connection
+
+        Errors in one game are logged and end only that game. Called by
+        serve() for each new connection, or by a Zygote child for its single
+        connection.
+
+        Args:
+            reader (asyncio.StreamReader): Input from the player
+            writer (asyncio.StreamWriter): Output to the player
+        """
+        connection = Connection(self, reader, writer)
+        self.connections.add(connection)
+        try:
+            await connection.run()
+        except ConnectionError:
+            pass
+        except Exception:
+            traceback.print_exc()
+        finally:
+            self.connections.discard(connection)
+            connection.close()
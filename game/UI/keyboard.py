@@ -0,0 +1,200 @@
+"""Contains the Keyboard class which handles all keyboard input
+
+Menu choices in the game are single digits, so they are read as single
+keystrokes without waiting for ENTER. Only the player name is read as a
+whole line. If stdin is not a terminal (e.g. when input is piped into the
+game), every read falls back to reading a whole line.
+
+Keys that are typed while the game is busy (during animations and pauses)
+are not thrown away. Session.play() collects them with pending() and keeps
+them in the type-ahead queue of the Session for the next prompts, as long
+as they are valid choices for these prompts.
+"""
+import os
+import re
+import select
+import sys
+import time
+from contextlib import contextmanager
+
+
+class Keyboard:
+    """Reads single keystrokes and lines from the terminal
+
+    On Linux/Unix, the terminal is switched to cbreak mode only while a key
+    is being read or awaited: keys are then available immediately and are
+    not echoed. On Windows, msvcrt is used instead.
+
+    Attributes:
+        KEY_PATTERN (re.Pattern): Matches one key in a string of input: an
+            escape sequence (e.g. an arrow key) or a single character
+        msvcrt (module): The msvcrt module on Windows, None on other systems
+        is_tty (bool): States whether stdin is a terminal
+
+    Methods:
+        read_keys(): Waits for a keystroke and returns all keys typed
+        read_line(): Reads a whole line of input
+        wait(): Waits for a keypress for a limited time
+        pending(): Returns the keys typed so far without waiting
+    """
+    KEY_PATTERN = re.compile(r'\033(?:\[[0-9;?]*[ -/]*[@-~]|O.)?|.', re.S)
+
+    def __init__(self):
+        try:
+            import msvcrt
+        except ImportError:
+            msvcrt = None
+        self.msvcrt = msvcrt
+        self.is_tty = sys.stdin.isatty()
+
+    def read_keys(self, valid=None) -> list:
+        """Waits for the player to press a key and returns all keys typed
+
+        The first key answers the prompt and is echoed. Several keys arrive
+        at once if the player types quickly; the others are meant for the
+        next prompts. Keys that send several characters at once, like the
+        arrow keys, are returned as one string.
+
+        Args:
+            valid (Collection, optional): Ignored; the first key is returned
+                whether it is valid or not, so the caller can show an error
+
+        Returns:
+            list: The keys without surrounding whitespace; '' for ENTER
+        """
+        if not self.is_tty and not self.msvcrt:
+            return [input().strip()]
+        if self.msvcrt:
+            keys = self.__split_keys(self.msvcrt.getwch())
+        else:
+            with self.__cbreak() as fd:
+                keys = self.__split_keys(self.__read_available(fd))
+        self.__echo(keys[0])
+        return keys
+
+    def read_line(self) -> str:
+        """Reads a whole line of input
+
+        Returns:
+            str: The line without surrounding whitespace
+        """
+        return input().strip()
+
+    def wait(self, timeout: float) -> bool:
+        """Waits for a keypress for a limited time
+
+        The key itself is not consumed; it is returned by the next call to
+        pending() or read_keys().
+
+        Args:
+            timeout (float): Maximum amount of seconds to wait
+
+        Returns:
+            bool: True if a key was pressed before the timeout
+        """
+        if self.msvcrt:
+            # For Windows: check for a keypress every 10 ms
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                if self.msvcrt.kbhit():
+                    return True
+                time.sleep(0.01)
+            return False
+        if not self.is_tty:
+            time.sleep(timeout)
+            return False
+        # For linux/unix: in cbreak mode a single keypress can be detected
+        # without waiting for ENTER and is not echoed on screen
+        with self.__cbreak() as fd:
+            return self.__ready(fd, timeout)
+
+    def pending(self) -> list:
+        """Returns the keys typed so far without waiting
+
+        Called after animations and pauses instead of flushing the input, so
+        that keys typed by fast players are not lost.
+
+        Returns:
+            list: The keys without surrounding whitespace; '' for ENTER
+        """
+        if self.msvcrt:
+            data = ''
+            while self.msvcrt.kbhit():
+                data += self.msvcrt.getwch()
+            return self.__split_keys(data)
+        if self.is_tty:
+            with self.__cbreak() as fd:
+                if self.__ready(fd, 0):
+                    return self.__split_keys(self.__read_available(fd))
+        return []
+
+    def __read_available(self, fd: int) -> str:
+        """Reads all input that is available on a file descriptor
+
+        Blocks until at least one byte has been read, then collects the rest
+        of multi-byte keys and escape sequences without blocking.
+
+        Args:
+            fd (int): File descriptor of stdin
+
+        Returns:
+            str: The decoded input
+        """
+        data = os.read(fd, 64)
+        while self.__ready(fd, 0):
+            data += os.read(fd, 64)
+        return data.decode(errors='ignore')
+
+    def __split_keys(self, data: str) -> list:
+        """Splits input into single keys
+
+        Args:
+            data (str): Raw input
+
+        Returns:
+            list: Keys without surrounding whitespace; ENTER becomes ''
+        """
+        return [key.strip() for key in self.KEY_PATTERN.findall(data)]
+
+    def __echo(self, key: str):
+        """Echoes a key so the player sees what was pressed
+
+        Args:
+            key (str): The key to show
+        """
+        if key.isprintable():
+            sys.stdout.write(key)
+            sys.stdout.flush()
+
+    def __ready(self, fd: int, timeout: float) -> bool:
+        """Checks whether input is available within timeout seconds
+
+        Args:
+            fd (int): File descriptor of stdin
+            timeout (float): Seconds to wait; 0 to check without waiting
+
+        Returns:
+            bool: True if input is available
+        """
+        ready, _, _ = select.select([fd], [], [], timeout)
+        return bool(ready)
+
+    @contextmanager
+    def __cbreak(self):
+        """Keeps the terminal in cbreak mode inside a with-block
+
+        Yields:
+            int: File descriptor of stdin; the previous terminal settings are
+                restored when the with-block is left
+        """
+        # termios and tty are not available on Windows
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            # TCSANOW: the default TCSAFLUSH would discard typed-ahead keys
+            tty.setcbreak(fd, termios.TCSANOW)
+            yield fd
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
@@ -3,8 +3,11 @@
 The Menu class was supposed to handle menu choice logic and call appropriate
 functions where needed. However, it has grown into an overarching class that
 handles all relevant user input and shows informational screens in-between.
+
+All methods that wait for input are generators and are advanced by a Session
+(see game/UI/session.py), so they must be called with 'yield from'.
 """
-import time
+from game.UI.session import LINE, call
 
 
 class Menu():
@@ -33,9 +36,10 @@ class Menu():
     - Clear specific rows:
         self.display.clear([1,2,...])
     - Take user input with correct placement and formatting of the prompt:
-        input(self.display.build_input()).strip()
+        key = yield from self.display.read_key() for single-key choices,
+        name = yield from self.display.read_line() for the player name
 
-    The output is finally rendered on screen only when input() is called.
+    The output is finally rendered on screen only when input is requested.
 
     Args:
         display (object): Reference to Display class instance
@@ -48,6 +52,15 @@ class Menu():
             by the player.
         active_player (object): Reference to Player class instance; set by
             global function run().
+        cadets, trials, mission (object): References to the Cadets, Trials
+            and Mission class instances of the current game; set by global
+            function run().
+        phase (str): The game phase the player is in: 'menu' (outer menu
+            and screens between games), 'recruit', 'trials', 'mission' or
+            'score'; set by run_outer_loop() and global function run().
+        position (str): The prompt the player is at, if the game can be
+            saved there as a snapshot (see game/UI/snapshot.py): 'outer',
+            'trials' or 'mission'; None at all other prompts.
         stay_in_trial_menu (bool): States whether the player has not used up
             all available trial runs; needed to exit the trial menu loop and
             proceed to the next menu.
@@ -81,6 +94,11 @@ class Menu():
         self.run_game = run_game
         self.chosen_skill = None
         self.active_player = None
+        self.cadets = None
+        self.trials = None
+        self.mission = None
+        self.phase = 'menu'
+        self.position = None
         # Does the player still have trial runs left?
         self.stay_in_trial_menu = True
         # Is the player accessing the trial menu for the first time?
@@ -93,25 +111,28 @@ class Menu():
         in the end, which returns to main() on game exit.
         """
         while True:
+            self.phase = 'menu'
             # Before the input: Build the screen content
-            self.info_screen('1_logo')
+            yield from self.info_screen('1_logo')
             self.display.build_menu(self.sheet.get_text('menu_outer'))
             # Draw the screen and take input
-            choice = input(self.display.build_input()).strip()
+            choice = yield from self.__read_checkpoint(
+                'outer', valid=self.__choices(4))
             # After the input: Clear error messages and previous screen content
             self.display.clear(is_error=True)
             self.display.clear()
             match choice:
                 case '1':
                     # Call the game manager function
-                    self.run_game(self, self.active_player, self.display,
-                                  self.sheet)
+                    yield from self.run_game(self, self.active_player,
+                                             self.display, self.sheet)
                 case '2':
                     # Restart the game without passing the old player so that
                     # run() can re-initialize the Player class
-                    self.run_game(self, None, self.display, self.sheet)
+                    yield from self.run_game(self, None, self.display,
+                                             self.sheet)
                 case '3':
-                    self.info_screen('9_highscore')
+                    yield from self.info_screen('9_highscore')
                 case '4':
                     # Return to main() and exit game
                     return
@@ -122,10 +143,10 @@ class Menu():
     def run_player_init(self):
         """Prompts user to enter a player name until valid name is entered"""
         self.display.clear(is_error=True)
-        self.info_screen('2_welcome')
+        yield from self.info_screen('2_welcome')
         self.display.build_menu(self.sheet.get_text('prompt_name'))
         while True:
-            name = input(self.display.build_input()).strip()
+            name = yield from self.display.read_line()
             if self.active_player.set_name(name):
                 break
             self.display.build_menu(self.sheet.get_text('err_player'),
@@ -146,13 +167,23 @@ class Menu():
             cadets (object): reference to Cadets class instance
             mission (object): Reference to Mission class instance
         """
-        menu_line = self.sheet.get_text('menu_trial')
+        menu_line = self.sheet.get_text(
+            'menu_trial' if self.trial_first_time else 'menu_trial_new')
         self.display.clear()
         if self.trial_first_time:
-            self.info_screen('4_trials_desc', mission.difficulty)
+            yield from self.info_screen('4_trials_desc', mission.difficulty)
             trials_left = self.sheet.get_text(
                 "trials_left", trials.MAX_RUNS)
             self.display.build_screen(f'{trials_left:>76}', 18)
+        else:
+            # A game resumed from a snapshot re-enters the trials menu after
+            # the first trial: rebuild the trials log and status rows
+            trials.show_log()
+            trials.show_runs_left()
+            if self.chosen_skill:
+                self.display.build_screen(
+                    [self.sheet.get_text('scr_trial_active'),
+                     f'{self.chosen_skill}:  '], 16)
         while True:
             self.display.build_menu(menu_line)
             # Exit the menu loop if no more trial runs are available
@@ -162,12 +193,13 @@ class Menu():
                 self.display.clear([16, 17, 18])
                 self.display.build_screen(self.sheet.get_text(
                     'no_more_trials'), 16)
-                input(self.display.build_input(prompt_enter=True))
+                yield from self.display.read_key(prompt_enter=True)
                 self.display.clear(is_error=True)
                 self.display.clear()
                 break
 
-            choice = input(self.display.build_input()).strip()
+            choice = yield from self.__read_checkpoint(
+                'trials', valid=self.__choices(3))
             self.display.clear(is_error=True)
 
             match choice:
@@ -180,7 +212,7 @@ class Menu():
                         # Switch to different menu line once a track has been
                         # chosen
                         menu_line = self.sheet.get_text('menu_trial_new')
-                    self.run_skill_choice(trials, cadets)
+                    yield from self.run_skill_choice(trials, cadets)
                     continue
                 case '2':
                     # Make sure that a career track has been chosen before
@@ -189,7 +221,7 @@ class Menu():
                         self.display.build_menu(self.sheet.get_text(
                             'err_skill_first'), is_error=True)
                         continue
-                    self.run_cadet_choice(trials, cadets)
+                    yield from self.run_cadet_choice(trials, cadets)
                     continue
                 case '3':
                     trials.remove_highlight()
@@ -221,7 +253,8 @@ class Menu():
         while True:
             self.display.build_menu(skill_choice_texts)
             self.display.build_screen(trial_status, 16)
-            skill_nr = input(self.display.build_input()).strip()
+            skill_nr = yield from self.display.read_key(
+                valid=self.__choices(len(cadets.skills)))
             self.display.clear(is_error=True)
             try:
                 # Convert user input into a valid index
@@ -237,7 +270,7 @@ class Menu():
                 self.display.clear(is_error=True)
                 break
         self.chosen_skill = cadets.skills[skill_nr]
-        self.run_cadet_choice(trials, cadets, skill_nr)
+        yield from self.run_cadet_choice(trials, cadets, skill_nr)
         # Returns to run_trial_loop()
 
     def run_cadet_choice(self, trials: object, cadets: object, skill_nr=None):
@@ -270,8 +303,9 @@ class Menu():
         self.display.build_menu(cadet_choice_texts)
         # Get player input for first cadet
         while True:
-            c1 = input(self.display.build_input(
-                self.sheet.get_text('prompt_cadet_1'))).strip()
+            c1 = yield from self.display.read_key(
+                self.sheet.get_text('prompt_cadet_1'),
+                valid=self.__choices(len(cadets.names)))
             try:
                 # Enumeration starts at 1, therefore "- 1" to get index
                 c1 = int(c1) - 1
@@ -293,8 +327,9 @@ class Menu():
         self.display.build_screen(trial_status, row_nr=16)
         # Get player input for second cadet
         while True:
-            c2 = input(self.display.build_input(
-                self.sheet.get_text('prompt_cadet_2'))).strip()
+            c2 = yield from self.display.read_key(
+                self.sheet.get_text('prompt_cadet_2'),
+                valid=self.__choices(len(cadets.names), str(c1 + 1)))
             # Make sure the player doesn't choose the same cadet twice
             if str(c1+1) == c2:
                 self.display.build_menu(self.sheet.get_text(
@@ -317,7 +352,7 @@ class Menu():
         trial_status[1] = trial_status[1][:-3] + f'{cadets.names[c2]}'
         self.display.build_screen(trial_status, row_nr=16)
         # Start the trial for the chosen cadet pair
-        trials.fill_trials(cadets, skill_nr, c1, c2)
+        yield from trials.fill_trials(cadets, skill_nr, c1, c2)
         # Remove cadet pair from screen but leave active skill
         self.display.build_screen((f'{self.chosen_skill}:  '), 17)
         # Check if all allowed trial runs have been exhausted
@@ -346,7 +381,8 @@ class Menu():
             f'⁞{c[0]}⁞ {c[1]}' for c in enumerate(short_names, 1)])
         self.display.build_menu(mission_loop_texts)
         while True:
-            choice = input(self.display.build_input()).strip()
+            choice = yield from self.__read_checkpoint(
+                'mission', valid=self.__choices(len(available_cadets)))
             self.display.clear(is_error=True)
             try:
                 # Enumeration starts at 1, therefore "- 1" to get index
@@ -378,16 +414,21 @@ class Menu():
         match part:
             case '1_logo':
                 # Displays the start screen with the logo
-                logo = [f'{"    🟇 🟍 ✵  AD ASTRA ✵ 🟍 🟇":<32}']
-                logo.extend(self.sheet.get_text('logo_ad_astra'))
                 self.display.clear()
-                self.display.build_screen(logo, 2, center_logo=True)
+                if self.display.first_time:
+                    # The reveal animation must be played on game start even
+                    # if the logo screen has already been cached
+                    self.__build_logo()
+                    yield from self.display.reveal_screen()
+                else:
+                    self.display.build_static('1_logo', self.__build_logo)
                 return
             case '2_welcome':
                 # Displays the game description
-                message = self.sheet.get_text('welcome')
                 self.display.clear()
-                self.display.build_screen(message)
+                self.display.build_static(
+                    '2_welcome', lambda: self.display.build_screen(
+                        self.sheet.get_text('welcome')))
                 return
             case '3_recruit':
                 # Displays a personalized welcome message and the cadet names
@@ -400,7 +441,7 @@ class Menu():
                 # Wait for the user to read screen and press ENTER before
                 # starting trials
                 self.display.build_menu('')
-                input(self.display.build_input(prompt_enter=True))
+                yield from self.display.read_key(prompt_enter=True)
                 return
             case '4_trials_desc':
                 # Displays the description of the trials phase
@@ -414,22 +455,21 @@ class Menu():
                 mission = value
                 self.display.clear()
                 self.display.draw()
-                time.sleep(0.7)
-                self.display.flush_input()
+                yield from self.display.wait(0.7)
                 self.display.clear()
                 alert_header = (f'{self.BRIGHT_RED}{"▓"*33}'
                                 f'{self.sheet.get_text("red_alert_header")}'
                                 f'{"▓"*32}{self.RESET}')
                 alert = self.sheet.get_text('red_alert_msg')
                 choices = self.sheet.get_text('red_alert_choices')
-                self.display.build_screen(alert_header,
-                                          2, center=True, ansi=11)
+                self.display.build_screen(alert_header, 2, center=True)
                 self.display.build_screen(alert, 4)
                 self.display.build_menu(choices)
                 while True:
                     # The following choice is only needed for storytelling;
                     # it doesn't impact the game
-                    choice = input(self.display.build_input())
+                    choice = yield from self.display.read_key(
+                        valid=self.__choices(2))
                     self.display.clear(is_error=True)
                     match choice:
                         case '1':
@@ -451,22 +491,25 @@ class Menu():
                         f"prediction_{mission.suffix}", mission.prognosis)
                     self.display.build_screen(message_2, 10)
                     self.display.build_menu('')
-                    input(self.display.build_input(prompt_enter=True))
+                    yield from self.display.read_key(prompt_enter=True)
                     return
             case '6_ship_anim':
                 # Displays the flying ship animation
-                print('\033c', end='')
+                # The frames only depend on the ship text, so they are built
+                # once per text catalog version and shared by all sessions
+                key = ('6_ship_anim', self.sheet.version)
+                frames = self.display.frame_cache.get(key)
+                if frames is None:
+                    ship = self.sheet.get_text('ship_anim')
+                    parsed_ship = [f'{" "*80}{row:73}' for row in ship]
+                    frames = self.display.build_frames(
+                        [[line[i:-1 if i >= -76 else i+76]
+                          for line in parsed_ship]
+                         for i in range(-2, -153, -2)], 3)
+                    self.display.frame_cache[key] = frames
                 self.display.clear()
-                ship = self.sheet.get_text('ship_anim')
-                parsed_ship = [f'{" "*80}{row:73}' for row in ship]
-                for i in range(-2, -153, -2):
-                    all_lines = []
-                    for line in parsed_ship:
-                        all_lines.append(line[i:-1 if i >= -76 else i+76])
-                    self.display.build_screen(all_lines, 3)
-                    self.display.draw(shallow_clear=True)
-                    time.sleep(0.09)
-                self.display.flush_input()
+                self.display.draw()
+                yield from self.display.play_frames(frames, 0.09)
                 return
             case '7_mission_score':
                 # Value is final mission score here
@@ -474,23 +517,23 @@ class Menu():
                 self.display.build_menu("")
                 message = self.sheet.get_text(f'mission_score_{value}')
                 self.display.build_screen(
-                    self.BRIGHT_CYAN + message[0] + self.RESET, 3, ansi=11)
+                    self.BRIGHT_CYAN + message[0] + self.RESET, 3)
                 if value in [0, 1, 2]:
                     self.display.build_screen(
-                        self.BRIGHT_RED + message[1] + self.RESET, 5, ansi=11)
+                        self.BRIGHT_RED + message[1] + self.RESET, 5)
                 else:
                     self.display.build_screen(
-                        self.BRIGHT_GREEN + message[1] + self.RESET, 5,
-                        ansi=11)
+                        self.BRIGHT_GREEN + message[1] + self.RESET, 5)
                 self.display.build_screen(message[2:], 6)
-                input(self.display.build_input(prompt_enter=True))
+                yield from self.display.read_key(prompt_enter=True)
                 return
             case '8_player_score':
                 # Displays the detailed player score
-                self.display.build_screen(
-                    self.sheet.get_text('scores_header'), 2)
-                input(self.display.build_input(
-                    self.sheet.get_text('prompt_highscore')))
+                self.display.build_static(
+                    '8_scores_header', lambda: self.display.build_screen(
+                        self.sheet.get_text('scores_header'), 2), 2, 3)
+                yield from self.display.read_key(
+                    self.sheet.get_text('prompt_highscore'), valid=('',))
                 return
             case '9_highscore':
                 # Displays the highscore table
@@ -499,33 +542,82 @@ class Menu():
                 self.display.build_screen(f"{self.BRIGHT_GREEN}"
                                           f"{self.sheet.get_text('hs_header')}"
                                           f"{self.RESET}",
-                                          3, center=True, ansi=11)
-                self.display.build_screen(
-                    self.sheet.get_score(), 6, center=True, ansi=11)
+                                          3, center=True)
+                scores = yield from call(self.sheet.get_score)
+                self.display.build_screen(scores, 6, center=True)
                 self.display.build_menu("")
-                input(self.display.build_input(prompt_enter=True))
+                yield from self.display.read_key(prompt_enter=True)
                 return
             case '10_say_goodbye':
-                # Constructs and shows the exit screen with the credits
-                fill_sym = "⸾"
-                scr = []
+                # Shows the exit screen with the credits
                 self.display.clear()
                 self.display.clear(is_error=True)
                 self.display.build_menu('')
-                scr = [f'{fill_sym*76}']*7
-                scr.append(f'{fill_sym*25}{" "*27}{fill_sym*24}')
-                scr.append(f'{fill_sym*25}'
-                           f'{self.sheet.get_text("exit_live_long")}'
-                           f'{fill_sym*24}')
-                scr.append(f'{fill_sym*25}{" "*27}{fill_sym*24}')
-                scr.extend([f'{fill_sym*76}']*5)
-                scr.append(f'{fill_sym*17}{self.sheet.get_text("exit_by")}'
-                           f'{fill_sym*17}')
-                scr.append(f'{fill_sym*17}{self.sheet.get_text("exit_mail")}'
-                           f'{fill_sym*17}')
-                scr.append(f'{fill_sym*76}')
-                self.display.build_screen(scr, 1, center=True)
+                self.display.build_static(
+                    '10_say_goodbye', self.__build_goodbye)
                 self.display.draw()
             case _:
                 print("Internal error: no such info screen: ", part)
-                input()
+                # Wait for ENTER without redrawing the screen, so that the
+                # error message stays visible
+                yield (LINE, None)
+
+    def __build_logo(self):
+        """Builds the start screen with the logo"""
+        logo = [f'{"    🟇 🟍 ✵  AD ASTRA ✵ 🟍 🟇":<32}']
+        logo.extend(self.sheet.get_text('logo_ad_astra'))
+        self.display.build_screen(logo, 2, center_logo=True)
+
+    def __build_goodbye(self):
+        """Constructs the exit screen with the credits"""
+        fill_sym = "⸾"
+        scr = [f'{fill_sym*76}']*7
+        scr.append(f'{fill_sym*25}{" "*27}{fill_sym*24}')
+        scr.append(f'{fill_sym*25}'
+                   f'{self.sheet.get_text("exit_live_long")}'
+                   f'{fill_sym*24}')
+        scr.append(f'{fill_sym*25}{" "*27}{fill_sym*24}')
+        scr.extend([f'{fill_sym*76}']*5)
+        scr.append(f'{fill_sym*17}{self.sheet.get_text("exit_by")}'
+                   f'{fill_sym*17}')
+        scr.append(f'{fill_sym*17}{self.sheet.get_text("exit_mail")}'
+                   f'{fill_sym*17}')
+        scr.append(f'{fill_sym*76}')
+        self.display.build_screen(scr, 1, center=True)
+
+    def __read_checkpoint(self, position: str, valid: tuple):
+        """Reads a menu choice at a prompt where the game can be saved
+
+        Players tend to leave the game idle at these prompts, so a host can
+        hibernate the session there (see game/UI/snapshot.py).
+        Generator: must be called with 'yield from'.
+
+        Args:
+            position (str): Name of the prompt, stored in self.position
+            valid (tuple): Valid choices, see read_key()
+
+        Returns:
+            str: The key the player pressed
+        """
+        self.position = position
+        try:
+            return (yield from self.display.read_key(valid=valid))
+        finally:
+            self.position = None
+
+    def __choices(self, count: int, excluded=None) -> tuple:
+        """Returns the valid keys of an enumerated menu
+
+        Keys that the player typed ahead are only applied to a prompt if they
+        are one of these choices.
+
+        Args:
+            count (int): Amount of menu choices, enumerated from 1
+            excluded (str, optional): Key that is not a valid choice, e.g. an
+                already chosen cadet. Defaults to None.
+
+        Returns:
+            tuple: The valid keys as strings
+        """
+        return tuple(str(nr) for nr in range(1, count + 1)
+                     if str(nr) != excluded)
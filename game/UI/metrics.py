@@ -0,0 +1,236 @@
+"""Contains the Metrics class which exports measurements of the game host
+
+The metrics are rendered in the Prometheus text format, so they can be
+scraped from a local port or picked up from a file, e.g. by the textfile
+collector of the node exporter.
+
+Exported metrics:
+    adastra_sessions{phase}               games per game phase (gauge)
+    adastra_process_resident_bytes        memory of the host process (gauge)
+    adastra_process_resident_bytes_per_session
+                                          memory of the host process per
+                                          game in event loop mode (gauge)
+    adastra_session_resident_bytes{pid}   memory of each game process in
+                                          zygote mode (gauge)
+    adastra_frame_render_seconds          time to build and send a frame
+    adastra_input_latency_seconds         time from a key to its frame
+    adastra_sheet_call_seconds{call}      duration of Sheet requests
+The last three are histograms.
+
+The memory of a single game can only be measured in zygote mode, where each
+game has its own process. In event loop mode all games share one process,
+so only the average memory per running game is exported, which includes
+the memory of the host itself; queued and hibernated players are not
+counted, and without running games the average is 0.
+"""
+import asyncio
+import os
+
+
+class Metrics:
+    """Collects measurements and renders them in the Prometheus text format
+
+    Histograms are updated whenever something is measured. Gauges describe
+    the current state, so they are set by the collect function right before
+    the metrics are rendered.
+
+    Args:
+        collect (Callable, optional): Function that sets the gauges with
+            set_gauge(). Defaults to None.
+        port (int, optional): Local TCP port to serve the metrics on.
+            Defaults to None.
+        path (str, optional): File to write the metrics to. Defaults to
+            None.
+
+    Attributes:
+        PREFIX (str): Prefix of all metric names
+        BUCKETS (tuple): Upper bounds of the histogram buckets in seconds
+        INTERVAL (float): Seconds between two writes of the metrics file
+        PHASES (tuple): Game phases of the sessions gauge, which are
+            exported even if no game is in them
+        TYPES (dict): Type and description of each metric
+        collect (Callable): Function that sets the gauges
+        port (int): Port to serve the metrics on, or None
+        path (str): File to write the metrics to, or None
+        histograms (dict): Bucket counts, sum and count of each histogram,
+            keyed by metric name and labels
+        gauges (dict): Value of each gauge, keyed by metric name and labels
+
+    Methods:
+        observe(): Adds a measurement to a histogram
+        set_gauge(): Sets the value of a gauge
+        render(): Returns all metrics in the Prometheus text format
+        write(): Writes the metrics to the file
+        run(): Serves the metrics and writes the file until cancelled
+        resident_bytes(): Returns the resident memory of a process
+    """
+    PREFIX = 'adastra_'
+    BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+               0.5, 1, 2.5, 5, 10)
+    INTERVAL = 15
+    PHASES = ('queued', 'menu', 'recruit', 'trials', 'mission', 'score',
+              'hibernated')
+    TYPES = {
+        'sessions': ('gauge', 'Games per game phase'),
+        'process_resident_bytes': ('gauge',
+                                   'Resident memory of the host process'),
+        'process_resident_bytes_per_session': (
+            'gauge', 'Resident memory of the host process per game'),
+        'session_resident_bytes': ('gauge',
+                                   'Resident memory of each game process'),
+        'frame_render_seconds': ('histogram',
+                                 'Time to build and send one frame'),
+        'input_latency_seconds': ('histogram',
+                                  'Time from a key to the frame it causes'),
+        'sheet_call_seconds': ('histogram', 'Duration of Sheet requests'),
+    }
+
+    def __init__(self, collect=None, port=None, path=None):
+        self.collect = collect
+        self.port = port
+        self.path = path
+        self.histograms = {}
+        self.gauges = {}
+
+    def observe(self, name: str, seconds: float, **labels):
+        """Adds a measurement to a histogram
+
+        Args:
+            name (str): Metric name without prefix, see TYPES
+            seconds (float): The measured duration
+            **labels: Labels of the measurement, e.g. call='get_score'
+        """
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            # One count per bucket, then the sum and the total count
+            histogram = self.histograms[key] = [0] * len(self.BUCKETS) + [0, 0]
+        for idx, bound in enumerate(self.BUCKETS):
+            if seconds <= bound:
+                histogram[idx] += 1
+        histogram[-2] += seconds
+        histogram[-1] += 1
+
+    def set_gauge(self, name: str, value: float, **labels):
+        """Sets the value of a gauge
+
+        Args:
+            name (str): Metric name without prefix, see TYPES
+            value (float): The current value
+            **labels: Labels of the value, e.g. phase='trials'
+        """
+        self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def render(self) -> str:
+        """Returns all metrics in the Prometheus text format
+
+        Returns:
+            str: One line per sample, grouped by metric
+        """
+        self.gauges = {}
+        if self.collect:
+            self.collect()
+        samples = {}
+        for (name, labels), value in self.gauges.items():
+            samples.setdefault(name, []).append(
+                f'{self.PREFIX}{name}{self.__labels(labels)} {value}')
+        for (name, labels), histogram in self.histograms.items():
+            lines = samples.setdefault(name, [])
+            for bound, count in zip(self.BUCKETS, histogram):
+                lines.append(f'{self.PREFIX}{name}_bucket'
+                             f'{self.__labels(labels + (("le", bound),))} '
+                             f'{count}')
+            lines.append(f'{self.PREFIX}{name}_bucket'
+                         f'{self.__labels(labels + (("le", "+Inf"),))} '
+                         f'{histogram[-1]}')
+            lines.append(f'{self.PREFIX}{name}_sum{self.__labels(labels)} '
+                         f'{histogram[-2]}')
+            lines.append(f'{self.PREFIX}{name}_count{self.__labels(labels)} '
+                         f'{histogram[-1]}')
+        output = []
+        for name, lines in samples.items():
+            kind, description = self.TYPES[name]
+            output.append(f'# HELP {self.PREFIX}{name} {description}')
+            output.append(f'# TYPE {self.PREFIX}{name} {kind}')
+            output.extend(lines)
+        return '\n'.join(output) + '\n'
+
+    def write(self):
+        """Writes the metrics to the file
+
+        The file is replaced in one step, so readers never see a partly
+        written file.
+        """
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(self.render())
+        os.replace(temp_path, self.path)
+
+    async def run(self):
+        """Serves the metrics on the port and writes the file until cancelled"""
+        server = None
+        if self.port:
+            server = await asyncio.start_server(
+                self.__answer, '127.0.0.1', self.port)
+        try:
+            while True:
+                if self.path:
+                    self.write()
+                await asyncio.sleep(self.INTERVAL)
+        finally:
+            if server:
+                server.close()
+
+    @staticmethod
+    def resident_bytes(pid='self') -> int:
+        """Returns the resident memory of a process
+
+        Args:
+            pid (int, optional): Process ID. Defaults to the own process.
+
+        Returns:
+            int: Resident memory in bytes; None if it can't be determined,
+                e.g. because /proc is not available or the process has exited
+        """
+        try:
+            with open(f'/proc/{pid}/statm', encoding='ascii') as file:
+                pages = int(file.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            return None
+        return pages * os.sysconf('SC_PAGE_SIZE')
+
+    async def __answer(self, reader, writer):
+        """Answers any HTTP request with the metrics
+
+        Args:
+            reader (asyncio.StreamReader): Input from the client
+            writer (asyncio.StreamWriter): Output to the client
+        """
+        try:
+            # The request itself doesn't matter; wait for its header
+            await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), 5)
+            body = self.render().encode()
+            writer.write(b'HTTP/1.0 200 OK\r\n'
+                         b'Content-Type: text/plain; version=0.0.4\r\n'
+                         + f'Content-Length: {len(body)}\r\n\r\n'.encode()
+                         + body)
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError,
+                ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def __labels(self, labels: tuple) -> str:
+        """Formats labels for a sample line
+
+        Args:
+            labels (tuple): Pairs of label name and value
+
+        Returns:
+            str: e.g. '{phase="trials"}'; '' if there are no labels
+        """
+        if not labels:
+            return ''
+        return '{' + ','.join(f'{key}="{value}"' for key, value in labels) \
+            + '}'
@@ -0,0 +1,149 @@
+"""Contains the Recorder class which records sessions for bug reports
+
+The Recorder keeps the most recent frames of a session in a ring buffer
+and writes them to an asciicast v2 file (https://docs.asciinema.org/) when
+the game exits or crashes. The file can be replayed with 'asciinema play'
+to see exactly what the player saw.
+
+Usage:
+    recorder = Recorder('recordings')
+    display.listeners.append(recorder.record)
+    recorder.install()
+"""
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+
+class Recorder:
+    """Records timestamped frames in a ring buffer and exports asciicasts
+
+    Recording a frame only appends a reference to the output string that
+    has already been written to the terminal, so the overhead is small
+    enough to keep the recorder enabled at all times. Memory is bounded by
+    MAX_BYTES: the oldest frames are dropped once the limit is reached.
+
+    Args:
+        directory (str): Directory in which the asciicast files are saved
+        max_bytes (int, optional): Maximum amount of output characters kept
+            in the ring buffer. Defaults to MAX_BYTES.
+
+    Attributes:
+        MAX_BYTES (int): Default size limit of the ring buffer
+        WIDTH, HEIGHT (int): Terminal size written to the asciicast header
+        directory (str): Directory in which the asciicast files are saved
+        max_bytes (int): Size limit of the ring buffer
+        frames (deque): Recorded frames in the format (seconds since start,
+            rows on screen, output string)
+        size (int): Total length of all output strings in frames
+
+    Methods:
+        record(): Appends a frame; can be used as a Display listener
+        dump(): Writes the ring buffer to a file in a background thread
+        install(): Makes sure the ring buffer is written on exit or crash
+    """
+    MAX_BYTES = 1_000_000
+    WIDTH = 80
+    HEIGHT = 24
+
+    def __init__(self, directory: str, max_bytes=MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.frames = deque()
+        self.size = 0
+        self.start = time.monotonic()
+        self.started_at = int(time.time())
+        self.__dumped = False
+
+    def record(self, rows: tuple, output: str):
+        """Appends a frame to the ring buffer
+
+        Args:
+            rows (tuple): All rows that are on screen after this frame
+            output (str): The string that was written to the terminal
+        """
+        self.frames.append((time.monotonic() - self.start, rows, output))
+        self.size += len(output)
+        # Drop the oldest frames, but always keep the newest one
+        while self.size > self.max_bytes and len(self.frames) > 1:
+            self.size -= len(self.frames.popleft()[2])
+
+    def dump(self, reason='exit') -> threading.Thread:
+        """Writes the recorded frames to an asciicast file
+
+        The frames are copied right away; the file is written in a
+        background thread so that the game isn't blocked.
+
+        Args:
+            reason (str, optional): Added to the file name, e.g. 'crash'.
+                Defaults to 'exit'.
+
+        Returns:
+            threading.Thread: The thread writing the file
+        """
+        frames = list(self.frames)
+        path = os.path.join(
+            self.directory,
+            f'adastra-{self.started_at}-{os.getpid()}-{reason}.cast')
+        thread = threading.Thread(target=self.__write, args=(path, frames))
+        thread.start()
+        return thread
+
+    def install(self):
+        """Dumps the ring buffer when the program exits or crashes
+
+        Uncaught exceptions are recorded as 'crash', every other exit
+        (including sys.exit()) as 'exit'. Only the first dump is written.
+        """
+        previous_hook = sys.excepthook
+
+        def excepthook(exc_type, exc, traceback):
+            self.__dump_once('crash')
+            previous_hook(exc_type, exc, traceback)
+
+        sys.excepthook = excepthook
+        atexit.register(self.__dump_once, 'exit')
+
+    def __dump_once(self, reason: str):
+        """Dumps the ring buffer unless that has already happened
+
+        Waits for the file to be written, since the program is about to end.
+
+        Args:
+            reason (str): Added to the file name
+        """
+        if self.__dumped:
+            return
+        self.__dumped = True
+        self.dump(reason).join()
+
+    def __write(self, path: str, frames: list):
+        """Writes frames to an asciicast v2 file
+
+        Args:
+            path (str): Path of the file to write
+            frames (list): Frames in the format of self.frames
+        """
+        if not frames:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        offset = frames[0][0]
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(json.dumps({
+                'version': 2, 'width': self.WIDTH, 'height': self.HEIGHT,
+                'timestamp': self.started_at + int(offset)}) + '\n')
+            # The oldest frames may have been dropped, so the recording
+            # starts with the complete screen as it was after the first frame
+            first = frames[0]
+            keyframe = '\033c' + ''.join(
+                f'\033[{idx + 1};1H{row}' for idx, row in enumerate(first[1]))
+            file.write(json.dumps([0.0, 'o', keyframe]) + '\n')
+            for timestamp, _, output in frames[1:]:
+                # The terminal driver turns '\n' into '\r\n'; the asciicast
+                # must contain what the terminal actually received
+                file.write(json.dumps([round(timestamp - offset, 6), 'o',
+                                       output.replace('\n', '\r\n')]) + '\n')
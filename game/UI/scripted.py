@@ -0,0 +1,134 @@
+"""Contains the ScriptedKeyboard class which plays the game without a human
+
+ScriptedKeyboard can be used to play a Session instead of the real Keyboard.
+It answers every prompt from a recorded or generated sequence of keys and
+never waits, so all pacing delays of the game are skipped. Together with
+HeadlessDisplay and MemorySheet, a complete playthrough from the outer menu
+to the highscore table runs in milliseconds.
+
+Usage:
+    display = HeadlessDisplay(sheet)
+    menu = Menu(display, sheet, run)
+    Session(game(menu)).play(ScriptedKeyboard.load('playthrough.keys'))
+"""
+
+
+class ScriptedKeyboard:
+    """Keyboard replacement that reads keys from a script
+
+    Each item of the script answers one prompt: one key for a menu choice,
+    '' for ENTER or a whole line for the player name. An item may also be a
+    function that is called with the keys the prompt accepts (None if any
+    key is accepted) and returns the answer, so that scripts can be
+    generated while the game is running.
+
+    Args:
+        script (Iterable): Answers to the prompts in the order they appear
+
+    Attributes:
+        script (Iterator): Remaining answers
+        history (list): All answers given so far; can be saved with save()
+            to replay the same playthrough later
+
+    Methods:
+        read_key(): Returns the next answer from the script
+        read_keys(): Returns the next answer from the script as a list
+        read_line(): Returns the next answer from the script
+        wait(): Returns at once; scripted input never interrupts a wait
+        pending(): Returns no keys since there is no type-ahead
+        load(): Creates a ScriptedKeyboard from a key file
+        save(): Writes the history to a key file
+    """
+
+    def __init__(self, script):
+        self.script = iter(script)
+        self.history = []
+
+    def read_key(self, valid=None) -> str:
+        """Returns the next answer from the script
+
+        Args:
+            valid (Collection, optional): Keys accepted by the prompt; passed
+                to answers that are functions. Defaults to None.
+
+        Raises:
+            EOFError: The script has no more answers, like input() does at
+                the end of a file
+
+        Returns:
+            str: The answer without surrounding whitespace
+        """
+        try:
+            answer = next(self.script)
+        except StopIteration:
+            raise EOFError('The input script has ended') from None
+        if callable(answer):
+            answer = answer(valid)
+        answer = answer.strip()
+        self.history.append(answer)
+        return answer
+
+    def read_keys(self, valid=None) -> list:
+        """Returns the next answer from the script, like Keyboard.read_keys()
+
+        Args:
+            valid (Collection, optional): Keys accepted by the prompt; passed
+                to answers that are functions. Defaults to None.
+
+        Returns:
+            list: The answer as the only key
+        """
+        return [self.read_key(valid)]
+
+    def read_line(self) -> str:
+        """Returns the next answer from the script
+
+        Returns:
+            str: The answer without surrounding whitespace
+        """
+        return self.read_key()
+
+    def wait(self, timeout: float) -> bool:
+        """Returns at once so that no time is spent on pacing
+
+        Args:
+            timeout (float): Ignored
+
+        Returns:
+            bool: Always False since no key is pressed during a wait
+        """
+        return False
+
+    def pending(self) -> list:
+        """Returns no keys; every answer is consumed by exactly one prompt
+
+        Returns:
+            list: Always empty
+        """
+        return []
+
+    @classmethod
+    def load(cls, path: str) -> 'ScriptedKeyboard':
+        """Creates a ScriptedKeyboard from a key file
+
+        A key file contains one answer per line; an empty line stands for
+        ENTER. Lines starting with '#' are comments.
+
+        Args:
+            path (str): Path of the key file
+
+        Returns:
+            ScriptedKeyboard: Keyboard that plays the answers in the file
+        """
+        with open(path, encoding='utf-8') as file:
+            return cls([line.rstrip('\n') for line in file
+                        if not line.startswith('#')])
+
+    def save(self, path: str):
+        """Writes all answers given so far to a key file
+
+        Args:
+            path (str): Path of the key file
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            file.writelines(f'{answer}\n' for answer in self.history)
@@ -0,0 +1,270 @@
+"""Contains the Session class which advances a game flow step by step
+
+The game flow (run() in run.py, the Menu methods and the blocking parts of
+Display, Trials and Mission) is written as generators. Instead of waiting
+for input or sleeping, they yield a request and receive the answer:
+
+    (KEY, valid)      waits for one key; valid is a collection of the keys
+                      the prompt accepts, or None for any key. Answer: str
+    (LINE, None)      waits for a whole line of input. Answer: str
+    (SLEEP, deadline) waits until time.monotonic() reaches the deadline.
+                      Answer: True if a key was pressed before, else False
+    (CALL, function)  runs a slow function, e.g. a Google Sheets request,
+                      without arguments. Answer: its return value
+
+A Session runs such a generator. It can either be driven by a keyboard,
+which blocks like a classic terminal program:
+
+    Session(game(menu)).play(Keyboard())
+
+or be fed with input events and timer wake-ups, so that one interpreter can
+advance any number of games without blocking on any one of them:
+
+    session = Session(game(menu))
+    request = session.start()
+    request = session.feed('1')       # a key or line typed by the player
+    request = session.wake()          # the deadline of a SLEEP has passed
+    request = session.complete(value) # the function of a CALL has returned
+
+The frames themselves are written by each session's Display, e.g. into a
+HeadlessDisplay buffer or a Display listener.
+"""
+import time
+from collections import deque
+from functools import partial
+
+KEY = 'key'
+LINE = 'line'
+SLEEP = 'sleep'
+CALL = 'call'
+
+
+def call(function, *args):
+    """Runs a slow function through the Session that advances the flow
+
+    Event-driven hosts can run the function in a worker thread, so that
+    other games don't have to wait for it.
+    Generator: must be called with 'yield from'.
+
+    Args:
+        function (Callable): The function to run
+        *args: Arguments for the function
+
+    Yields:
+        tuple: The request (CALL, function)
+
+    Returns:
+        The return value of the function
+    """
+    return (yield (CALL, partial(function, *args)))
+
+
+class Session:
+    """Runs a game flow generator and answers its requests
+
+    When fed with events, keys that arrive during a pause end the pause and
+    are kept in a type-ahead queue. A following key prompt takes the first
+    queued key that it accepts; keys it doesn't accept are discarded.
+
+    Args:
+        flow (Generator): The game flow, e.g. game(menu) from run.py
+
+    Attributes:
+        QUEUE_SIZE (int): Maximum amount of keys kept in the type-ahead queue
+        flow (Generator): The game flow
+        request (tuple): The request the flow is waiting for; None once the
+            flow has finished
+        queue (deque): Keys typed ahead during pauses
+        done (bool): True once the flow has finished
+        result: The return value of the flow once it has finished
+
+    Methods:
+        start(): Runs the flow until its first request
+        feed(): Answers the current request with one input event
+        wake(): Ends the current pause if its deadline has passed
+        complete(): Answers the current CALL request with its result
+        fail(): Raises an exception inside the flow, e.g. when the
+            function of a CALL request has failed
+        play(): Runs the whole flow with a blocking keyboard
+    """
+    QUEUE_SIZE = 8
+
+    def __init__(self, flow):
+        self.flow = flow
+        self.request = None
+        self.queue = deque()
+        self.done = False
+        self.result = None
+
+    def start(self) -> tuple:
+        """Runs the flow until it waits for the first time
+
+        Returns:
+            tuple: The first request; None if the flow didn't wait at all
+        """
+        return self.__resume(None)
+
+    def feed(self, data: str) -> tuple:
+        """Answers the current request with one input event
+
+        Args:
+            data (str): A key for KEY requests, a whole line for LINE
+                requests. Keys that arrive during a pause or a CALL are kept
+                for the next prompt.
+
+        Returns:
+            tuple: The next request; None if the flow has finished
+        """
+        kind = self.request[0] if self.request else None
+        if kind in (KEY, LINE):
+            return self.__resume(data.strip())
+        if kind in (SLEEP, CALL):
+            # Keep the key for the next prompt
+            self.__enqueue([data.strip()])
+        if kind == SLEEP:
+            # The key ends the pause
+            return self.__resume(True)
+        return self.request
+
+    def wake(self, now=None) -> tuple:
+        """Ends the current pause if its deadline has passed
+
+        Args:
+            now (float, optional): Current time.monotonic() value. Defaults
+                to the current time.
+
+        Returns:
+            tuple: The next request, or the current one if it is not a pause
+                that has ended; None if the flow has finished
+        """
+        if self.request and self.request[0] == SLEEP:
+            if (now or time.monotonic()) >= self.request[1]:
+                return self.__resume(False)
+        return self.request
+
+    def complete(self, result) -> tuple:
+        """Answers the current CALL request with the function's result
+
+        Args:
+            result: The return value of the function
+
+        Returns:
+            tuple: The next request; None if the flow has finished
+        """
+        if self.request and self.request[0] == CALL:
+            return self.__resume(result)
+        return self.request
+
+    def fail(self, error: BaseException) -> tuple:
+        """Raises an exception inside the flow at the current request
+
+        If the flow doesn't handle the exception, it is raised again here.
+
+        Args:
+            error (BaseException): The exception to raise
+
+        Returns:
+            tuple: The next request; None if the flow has finished
+        """
+        return self.__resume(None, error)
+
+    def play(self, keyboard: object):
+        """Runs the whole flow, reading input from a keyboard
+
+        Blocks until the flow has finished. Keys that the keyboard reads
+        together with the answer to a prompt, and keys pressed during a
+        pause, are kept in the type-ahead queue like fed keys.
+
+        Args:
+            keyboard (object): Reference to Keyboard class instance or any
+                object with the same methods, e.g. a ScriptedKeyboard
+
+        Returns:
+            The return value of the flow
+        """
+        request = self.start()
+        while request is not None:
+            kind, argument = request
+            if kind == KEY:
+                key, *typed_ahead = keyboard.read_keys(argument)
+                # The queue must be filled before the flow reaches the next
+                # prompt
+                self.__enqueue(typed_ahead)
+                request = self.__resume(key)
+            elif kind == LINE:
+                request = self.__resume(keyboard.read_line())
+            elif kind == CALL:
+                request = self.__resume(argument())
+            else:
+                delay = argument - time.monotonic()
+                skipped = delay > 0 and keyboard.wait(delay)
+                # Keep the keys pressed during the pause for the next prompts
+                self.__enqueue(keyboard.pending())
+                request = self.__resume(skipped)
+        return self.result
+
+    def __resume(self, answer, error=None) -> tuple:
+        """Sends an answer to the flow and runs it until the next request
+
+        Requests that can be answered right away, i.e. key prompts with a
+        valid key in the type-ahead queue and pauses whose deadline has
+        already passed, are answered without returning.
+
+        Args:
+            answer: The answer to the current request
+            error (BaseException, optional): Exception to raise inside the
+                flow instead of sending an answer. Defaults to None.
+
+        Returns:
+            tuple: The next request; None if the flow has finished
+        """
+        while True:
+            try:
+                if error is not None:
+                    request, error = self.flow.throw(error), None
+                else:
+                    request = self.flow.send(answer)
+            except StopIteration as stop:
+                self.done = True
+                self.request = None
+                self.result = stop.value
+                return None
+            kind, argument = request
+            if kind == KEY and self.queue:
+                answer = self.__typed_ahead(argument)
+                if answer is not None:
+                    continue
+            elif kind == LINE:
+                # Keys typed ahead are meant for menus, not for names
+                self.queue.clear()
+            elif kind == SLEEP and argument <= time.monotonic():
+                answer = False
+                continue
+            self.request = request
+            return request
+
+    def __enqueue(self, keys: list):
+        """Adds keys to the type-ahead queue, discarding those that don't fit
+
+        Args:
+            keys (list): Keys to add
+        """
+        for key in keys:
+            if len(self.queue) >= self.QUEUE_SIZE:
+                break
+            self.queue.append(key)
+
+    def __typed_ahead(self, valid) -> str:
+        """Takes the first key from the queue that the prompt accepts
+
+        Args:
+            valid (Collection): Keys the prompt accepts; None for any key
+
+        Returns:
+            str: The key; None if the queue holds no valid key
+        """
+        while self.queue:
+            key = self.queue.popleft()
+            if valid is None or key in valid:
+                return key
+        return None
@@ -3,11 +3,11 @@
 The class accesses the data in the spreadsheet, formats and returns the data
 on demand, and writes new data into the spreadsheet.
 """
+import hashlib
+import json
 import sys
 import textwrap
 from typing import Union
-import gspread
-from google.oauth2.service_account import Credentials
 
 
 class Sheet:
@@ -18,59 +18,34 @@ class Sheet:
     On instantiation, all messages from the sheet 'texts' are loaded into a
     dictionary. Each message has a unique ID with which it can be accessed.
 
+    The connection is established when the class is instantiated, not when
+    the module is imported, so that the module can be used without
+    credentials, e.g. by MemorySheet.
+
     Attributes:
         SCOPE: List with scope URLs
-        CREDS: The constructed credentials
-        SCOPED_CREDS: Credentials prepared by oauth2 module
-        GSPREAD_CLIENT: Client instance for authorized Google API access
-        SHEET: Spreadsheet instance for Google sheet 'ad_astra' returned by
-            gspread module
-        score_table: Worksheet instance for 'highscore'
-        texts: Worksheet instance for 'texts'
+        highscore: Worksheet instance for 'highscore'
         MAX_ENTRIES (int): Maximum highscore entries allowed
         BRIGHT_GREEN, RESET (str): ANSI style codes
-        
+        msg_dict (dict): All messages from the 'texts' worksheet
+        version (str): Checksum of msg_dict; identifies the text catalog so
+            that screens built from it can be cached
+
     Methods:
         get_score(): Retrieves list with formatted highscore entries
         write_score(): Writes new name and score into highscore sheet
         get_mission_msg(): Retrieves specific description of mission results
             for each cadet
         get_text(): Retrieves formatted message for specific key
+        get_list(): Retrieves a list of items for specific key
+        checksum(): Returns a checksum that identifies a text catalog
+        close_connections(): Closes pooled connections to Google
     """
     SCOPE = [
         "https://www.googleapis.com/auth/spreadsheets",
         "https://www.googleapis.com/auth/drive.file",
         "https://www.googleapis.com/auth/drive"
     ]
-    # Information about gspread module exception handling found here:
-    # https://snyk.io/advisor/python/gspread/functions/
-    # gspread.exceptions.WorksheetNotFound
-    try:
-        CREDS = Credentials.from_service_account_file('creds.json')
-        SCOPED_CREDS = CREDS.with_scopes(SCOPE)
-        GSPREAD_CLIENT = gspread.authorize(SCOPED_CREDS)
-        SHEET = GSPREAD_CLIENT.open('ad_astra')
-        highscore = SHEET.worksheet("highscore")
-        texts = SHEET.worksheet("texts")
-    except gspread.exceptions.SpreadsheetNotFound as e:
-        print(
-            "Trying to open non-existent or inaccessible spreadsheet "
-            f"document: {e}\nPlease restart the game or contact the dev: "
-            "wasirika@gmail.com")
-        sys.exit()
-    except gspread.exceptions.WorksheetNotFound as e:
-        print("Trying to open non-existent worksheet. Verify that the sheet "
-              f"name exists: {e}\nPlease restart the game or contact the dev: "
-              "wasirika@gmail.com")
-        sys.exit()
-    except Exception as e:
-        print("There is no connection to Google Sheets. Possible reason: No "
-              "internet connection. There might also be an issue with the "
-              "Google Drive API credentials or the sheet hasn't been shared "
-              "with the application.\nPlease check your internet connection, "
-              "restart the game or contact the dev: "
-              "wasirika@gmail.com")
-        sys.exit()
     # Max highscore entries allowed
     MAX_ENTRIES = 10
     # ANSI color codes
@@ -78,8 +53,76 @@ class Sheet:
     RESET = "\033[0m"
 
     def __init__(self):
+        texts = self.__connect()
         # Build a dictionary with all messages in the 'texts' worksheet
-        self.msg_dict = dict(self.texts.get_all_values())
+        self.msg_dict = dict(texts.get_all_values())
+        self.version = self.checksum(self.msg_dict)
+
+    @staticmethod
+    def checksum(msg_dict: dict) -> str:
+        """Returns a short checksum that identifies a text catalog
+
+        Args:
+            msg_dict (dict): All messages, keyed by message ID
+
+        Returns:
+            str: The first 12 hex digits of the SHA-1 of the catalog
+        """
+        return hashlib.sha1(
+            repr(sorted(msg_dict.items())).encode()).hexdigest()[:12]
+
+    def close_connections(self):
+        """Closes the pooled HTTP connections to Google
+
+        Must be called before the process forks: connections inherited by
+        several child processes would be shared by all of them. The next
+        request opens a new connection.
+        """
+        self.highscore.client.session.close()
+
+    def __connect(self):
+        """Opens the spreadsheet and sets self.highscore
+
+        Exits the game with an error message if the spreadsheet can't be
+        accessed.
+
+        Returns:
+            Worksheet instance for 'texts'
+        """
+        # gspread and google-auth take longer to import than the whole game,
+        # so they are only imported when a connection is made
+        import gspread
+        from google.oauth2.service_account import Credentials
+        # Information about gspread module exception handling found here:
+        # https://snyk.io/advisor/python/gspread/functions/
+        # gspread.exceptions.WorksheetNotFound
+        try:
+            creds = Credentials.from_service_account_file('creds.json')
+            scoped_creds = creds.with_scopes(self.SCOPE)
+            client = gspread.authorize(scoped_creds)
+            spreadsheet = client.open('ad_astra')
+            self.highscore = spreadsheet.worksheet("highscore")
+            texts = spreadsheet.worksheet("texts")
+        except gspread.exceptions.SpreadsheetNotFound as e:
+            print(
+                "Trying to open non-existent or inaccessible spreadsheet "
+                f"document: {e}\nPlease restart the game or contact the dev: "
+                "wasirika@gmail.com")
+            sys.exit()
+        except gspread.exceptions.WorksheetNotFound as e:
+            print("Trying to open non-existent worksheet. Verify that the "
+                  f"sheet name exists: {e}\nPlease restart the game or "
+                  "contact the dev: wasirika@gmail.com")
+            sys.exit()
+        except Exception as e:
+            print("There is no connection to Google Sheets. Possible reason: "
+                  "No internet connection. There might also be an issue with "
+                  "the Google Drive API credentials or the sheet hasn't been "
+                  "shared with the application.\nPlease check your internet "
+                  "connection, restart the game or contact the dev: "
+                  "wasirika@gmail.com")
+            sys.exit()
+        return texts
 
     def get_score(self) -> list:
         """Reads highscore table from worksheet and returns it in list form
@@ -111,7 +154,7 @@ class Sheet:
         score_list = self.highscore.get_all_values()
         entries_num = len(score_list)
         # Get lowest score in the table
-        last_score = int(score_list[-1][1])
+        last_score = int(score_list[-1][1]) if score_list else 0
         # If less than max amount of entries: append new score to list
         if entries_num < self.MAX_ENTRIES:
             score_list.append([new_name, new_score])
@@ -199,3 +242,84 @@ class Sheet:
         """
         list_raw = self.msg_dict[key]
         return list_raw.split(', ')
+
+
+class MemoryWorksheet:
+    """Keeps the rows of a worksheet in memory
+
+    Provides the two gspread Worksheet methods that Sheet uses, so that a
+    MemorySheet can share all of Sheet's formatting and highscore logic.
+
+    Args:
+        rows (list): Rows of the worksheet as lists of strings
+
+    Methods:
+        get_all_values(): Returns all rows as lists of strings
+        update(): Replaces the rows
+    """
+
+    def __init__(self, rows: list):
+        self.rows = [[str(cell) for cell in row] for row in rows]
+
+    def get_all_values(self) -> list:
+        """Returns a copy of all rows, with all cells as strings"""
+        return [list(row) for row in self.rows]
+
+    def update(self, values: list, range_name=None):
+        """Replaces the rows; range_name is accepted for compatibility"""
+        self.rows = [[str(cell) for cell in row] for row in values]
+
+
+class MemorySheet(Sheet):
+    """Sheet that keeps the text catalog and highscore table in memory
+
+    Needs no credentials or network access and answers every call at once,
+    which makes it suitable for headless playthroughs and benchmarks. The
+    catalog can be saved from a connected Sheet with MemorySheet.save() and
+    loaded with MemorySheet.load().
+
+    Args:
+        msg_dict (dict): All messages, keyed by message ID
+        highscore (list, optional): Highscore rows in the format
+            [name, score]. Defaults to an empty table.
+
+    Methods:
+        save(): Saves the catalog and highscore table of any sheet to a file
+        load(): Creates a MemorySheet from a file written by save()
+        close_connections(): Does nothing, as there are no connections
+    """
+
+    def __init__(self, msg_dict: dict, highscore=None):
+        self.msg_dict = dict(msg_dict)
+        self.version = self.checksum(self.msg_dict)
+        self.highscore = MemoryWorksheet(highscore or [])
+
+    def close_connections(self):
+        """Does nothing, as a MemorySheet has no connections"""
+
+    @staticmethod
+    def save(sheet: object, path: str):
+        """Saves the text catalog and highscore table of a sheet as JSON
+
+        Args:
+            sheet (object): Reference to Sheet class instance
+            path (str): Path of the file to write
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'texts': sheet.msg_dict,
+                       'highscore': sheet.highscore.get_all_values()},
+                      file, ensure_ascii=False, indent=1)
+
+    @classmethod
+    def load(cls, path: str) -> 'MemorySheet':
+        """Creates a MemorySheet from a file written by save()
+
+        Args:
+            path (str): Path of the JSON file
+
+        Returns:
+            MemorySheet: The loaded sheet
+        """
+        with open(path, encoding='utf-8') as file:
+            data = json.load(file)
+        return cls(data['texts'], data.get('highscore'))
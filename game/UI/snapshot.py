@@ -0,0 +1,184 @@
+"""Contains the Snapshot class which saves and restores a game in progress
+
+A running game flow is a chain of generators, which can't be saved. The
+game state behind it can, though, at the prompts where players tend to
+leave the game idle: the outer menu, the trials menu and the crew
+assignment of the mission. Menu.position names the prompt the player is at.
+
+A snapshot holds the game state at such a prompt as a small dict with only
+strings, numbers and lists, which is stored as compressed JSON of a few
+hundred bytes. To resume the game, resume() in run.py restores the state
+into a new Menu and continues the game flow at the same prompt.
+
+Usage:
+    snapshot = Snapshot.take(menu)     # None if not at a saveable prompt
+    snapshot.save(path)
+    ...
+    snapshot = Snapshot.load(path)
+    flow = resume(Menu(display, sheet, run), snapshot)
+"""
+import json
+import zlib
+from game.components.cadets import Cadets
+from game.components.player import Player
+from game.phases.mission import Mission
+from game.phases.trials import Trials
+
+
+class Snapshot:
+    """Game state of a session at a menu prompt
+
+    Args:
+        state (dict): The saved game state, as created by take()
+
+    Attributes:
+        VERSION (int): Format version; snapshots of other versions are
+            rejected by load()
+        state (dict): The saved game state
+        position (str): The prompt the snapshot was taken at, see
+            Menu.position
+
+    Methods:
+        take(): Saves the game state of a menu at its current prompt
+        restore(): Rebuilds the game objects in a new menu
+        to_bytes(): Returns the snapshot as compressed JSON
+        from_bytes(): Creates a snapshot from compressed JSON
+        save(): Writes the snapshot to a file
+        load(): Reads a snapshot from a file
+    """
+    VERSION = 1
+
+    def __init__(self, state: dict):
+        self.state = state
+        self.position = state['position']
+
+    @classmethod
+    def take(cls, menu: object) -> 'Snapshot':
+        """Saves the game state of a menu at its current prompt
+
+        Args:
+            menu (object): Reference to Menu class instance
+
+        Returns:
+            Snapshot: The snapshot; None if the menu is not at a prompt
+                where the game can be saved
+        """
+        if menu.position is None:
+            return None
+        player = menu.active_player
+        state = {'version': cls.VERSION,
+                 'position': menu.position,
+                 'player': player.name if player else None}
+        if menu.position == 'outer':
+            # Between games, only the player is kept
+            return cls(state)
+        cadets, trials, mission = menu.cadets, menu.trials, menu.mission
+        state['menu'] = [menu.chosen_skill, menu.stay_in_trial_menu,
+                         menu.trial_first_time]
+        state['cadets'] = {
+            'skills': cadets.skills,
+            'names': cadets.names,
+            'values': [[cadets.cadets[name][skill] for skill in cadets.skills]
+                       for name in cadets.names]}
+        state['trials'] = {
+            'runs': trials.runs,
+            'skill': trials.skill,
+            'last_skill': trials.last_skill,
+            'pair': [trials.c1, trials.c2],
+            'log': [[record['skill'], *record['cadets'], record['outcome'],
+                     record['highlight']]
+                    for records in trials.trials_log.values()
+                    for record in records]}
+        state['mission'] = {
+            'parameters': mission.mission_parameters,
+            'crew': [[role, *value] for role, value in mission.crew.items()]}
+        return cls(state)
+
+    def restore(self, menu: object):
+        """Rebuilds the game objects in a new menu
+
+        The screen is rebuilt by the menu when the game continues.
+        Restoring draws no random numbers.
+        Sets menu.active_player and, for snapshots taken during a game,
+        menu.cadets, menu.trials and menu.mission.
+
+        Args:
+            menu (object): Reference to a new Menu class instance
+        """
+        state = self.state
+        display, sheet = menu.display, menu.sheet
+        # The logo animation is only played when the game starts
+        display.first_time = False
+        if state['player'] is not None:
+            menu.active_player = Player()
+            menu.active_player.set_name(state['player'])
+        if self.position == 'outer':
+            return
+        menu.phase = self.position
+        (menu.chosen_skill, menu.stay_in_trial_menu,
+         menu.trial_first_time) = state['menu']
+        cadets = Cadets(sheet, names=state['cadets']['names'])
+        cadets.skills = state['cadets']['skills']
+        cadets.cadets = {name: dict(zip(cadets.skills, values))
+                         for name, values in zip(
+                             cadets.names, state['cadets']['values'])}
+        trials = Trials(display, sheet)
+        trials.runs = state['trials']['runs']
+        trials.skill = state['trials']['skill']
+        trials.last_skill = state['trials']['last_skill']
+        trials.c1, trials.c2 = state['trials']['pair']
+        trials.restore_log(
+            {'skill': skill, 'cadets': [c1, c2], 'outcome': outcome,
+             'highlight': highlight}
+            for skill, c1, c2, outcome, highlight in state['trials']['log'])
+        mission = Mission(cadets.skills, display, sheet,
+                          state['mission']['parameters'])
+        mission.crew = {role: [name, value]
+                        for role, name, value in state['mission']['crew']}
+        menu.cadets, menu.trials, menu.mission = cadets, trials, mission
+
+    def to_bytes(self) -> bytes:
+        """Returns the snapshot as compressed JSON"""
+        return zlib.compress(
+            json.dumps(self.state, separators=(',', ':')).encode())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Snapshot':
+        """Creates a snapshot from compressed JSON
+
+        Args:
+            data (bytes): Data returned by to_bytes()
+
+        Raises:
+            ValueError: If the snapshot was saved in another format version
+
+        Returns:
+            Snapshot: The snapshot
+        """
+        state = json.loads(zlib.decompress(data))
+        if state.get('version') != cls.VERSION:
+            raise ValueError(
+                f'Unsupported snapshot version: {state.get("version")}')
+        return cls(state)
+
+    def save(self, path: str):
+        """Writes the snapshot to a file
+
+        Args:
+            path (str): Path of the file to write
+        """
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'Snapshot':
+        """Reads a snapshot from a file written by save()
+
+        Args:
+            path (str): Path of the file
+
+        Returns:
+            Snapshot: The snapshot
+        """
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read())
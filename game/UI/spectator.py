@@ -0,0 +1,197 @@
+"""Contains the classes Broadcaster and SpectatorServer for spectator mode
+
+Spectator mode lets any number of people watch a player's terminal. Each
+frame is diffed and encoded only once by the Broadcaster, no matter how many
+spectators are watching. Spectators who join late or fall behind receive a
+keyframe with the complete screen, followed by the row diffs of all
+subsequent frames.
+
+Usage:
+    broadcaster = Broadcaster()
+    display.listeners.append(broadcaster.publish)
+    SpectatorServer(broadcaster, 8001).start()
+
+Spectators can then watch with any raw TCP client, e.g.:
+    nc localhost 8001
+"""
+import itertools
+import selectors
+import socket
+import threading
+from collections import deque
+
+
+class Broadcaster:
+    """Renders each frame once and hands it out to any number of spectators
+
+    The player's session only calls publish(), which never blocks on
+    spectators: the frame diff is stored in a bounded backlog and spectators
+    read from it whenever they are ready.
+
+    Attributes:
+        BACKLOG (int): Maximum amount of frame diffs kept for spectators that
+            are behind; older spectators receive a keyframe instead
+        rows (tuple): The rows of the last published frame
+        seq (int): Sequence number of the last published frame
+        backlog (deque): Pairs of (seq, encoded row diff)
+
+    Methods:
+        publish(): Stores a new frame; can be used as a Display listener
+        read(): Returns everything a spectator needs to catch up
+    """
+    BACKLOG = 64
+
+    def __init__(self):
+        self.rows = ()
+        self.seq = 0
+        self.backlog = deque(maxlen=self.BACKLOG)
+        self.__lock = threading.Lock()
+        # Encoded results of read() for the current seq, keyed by the seq the
+        # spectator had before; spectators at the same position share them
+        self.__reads = {}
+
+    def publish(self, rows: tuple, output=None):
+        """Stores a new frame as a diff against the previous frame
+
+        Args:
+            rows (tuple): All rows that are currently on screen
+            output (str, optional): The output written to the player's
+                terminal; not needed since spectators receive row diffs.
+        """
+        if rows == self.rows:
+            return
+        previous = self.rows
+        diff = ''.join(
+            f'\033[{idx + 1};1H{row}' for idx, row in enumerate(rows)
+            if idx >= len(previous) or previous[idx] != row).encode()
+        with self.__lock:
+            self.rows = rows
+            self.seq += 1
+            self.backlog.append((self.seq, diff))
+            self.__reads = {}
+
+    def read(self, since=None) -> tuple:
+        """Returns the output a spectator needs to catch up to the player
+
+        Args:
+            since (int, optional): Sequence number of the last frame the
+                spectator has received. None for a new spectator.
+
+        Returns:
+            tuple: New sequence number and the encoded output; a keyframe if
+                the spectator is new or too far behind, otherwise the row
+                diffs of all frames since 'since'
+        """
+        with self.__lock:
+            if since == self.seq:
+                return since, b''
+            if since in self.__reads:
+                return self.seq, self.__reads[since]
+            oldest = self.backlog[0][0] if self.backlog else self.seq + 1
+            if since is None or since + 1 < oldest:
+                # Keyframe: reset the terminal and draw all rows
+                output = ('\033c' + ''.join(
+                    f'\033[{idx + 1};1H{row}'
+                    for idx, row in enumerate(self.rows))).encode()
+            else:
+                output = b''.join(diff for _, diff in itertools.islice(
+                    self.backlog, since + 1 - oldest, None))
+            self.__reads[since] = output
+            return self.seq, output
+
+
+class SpectatorServer(threading.Thread):
+    """Streams a Broadcaster to read-only spectators over TCP
+
+    Runs in a daemon thread and serves all spectators with one non-blocking
+    selector loop. Input from spectators is read and ignored. Spectators
+    whose connection can't keep up are not waited for: their pending output
+    is dropped and they receive a keyframe once they have caught up.
+
+    Args:
+        broadcaster (object): Reference to Broadcaster class instance
+        port (int): TCP port to listen on
+        host (str, optional): Interface to listen on. Defaults to all.
+
+    Attributes:
+        INTERVAL (float): Seconds between two checks for new frames
+        MAX_PENDING (int): Maximum amount of unsent bytes per spectator
+
+    Methods:
+        run(): Accepts spectators and sends them new frames until the
+            program exits
+    """
+    INTERVAL = 0.03
+    MAX_PENDING = 64 * 1024
+
+    def __init__(self, broadcaster: object, port: int, host=''):
+        super().__init__(daemon=True)
+        self.broadcaster = broadcaster
+        self.listener = socket.create_server((host, port))
+        self.listener.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        # Per spectator socket: [seq of last frame read, unsent bytes]
+        self.spectators = {}
+
+    def run(self):
+        """Accepts spectators and sends them new frames"""
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        while True:
+            for key, _ in self.selector.select(self.INTERVAL):
+                if key.fileobj is self.listener:
+                    conn, _ = self.listener.accept()
+                    conn.setblocking(False)
+                    self.selector.register(conn, selectors.EVENT_READ)
+                    self.spectators[conn] = [None, b'']
+                else:
+                    self.__receive(key.fileobj)
+            for conn in list(self.spectators):
+                self.__send(conn)
+
+    def __receive(self, conn: socket.socket):
+        """Discards input from a spectator and detects disconnects
+
+        Args:
+            conn (socket): Spectator connection
+        """
+        try:
+            if conn.recv(4096):
+                return
+        except BlockingIOError:
+            return
+        except OSError:
+            pass
+        self.__close(conn)
+
+    def __send(self, conn: socket.socket):
+        """Sends all new output to a spectator without blocking
+
+        Args:
+            conn (socket): Spectator connection
+        """
+        state = self.spectators[conn]
+        if not state[1]:
+            state[0], state[1] = self.broadcaster.read(state[0])
+            if not state[1]:
+                return
+        try:
+            sent = conn.send(state[1])
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self.__close(conn)
+            return
+        state[1] = state[1][sent:]
+        if len(state[1]) > self.MAX_PENDING:
+            # The spectator is too slow; catch up with a keyframe later
+            state[0], state[1] = None, b''
+
+    def __close(self, conn: socket.socket):
+        """Closes a spectator connection
+
+        Args:
+            conn (socket): Spectator connection
+        """
+        self.selector.unregister(conn)
+        self.spectators.pop(conn, None)
+        conn.close()
@@ -0,0 +1,82 @@
+"""Contains functions that measure and pad strings by terminal cell width
+
+Python's len() counts code points, which is not what the terminal shows:
+ANSI escape sequences take up no space at all, combining characters are
+drawn on top of the previous character and East Asian wide characters take
+up two cells. The Display class uses these functions to fit each row into
+exactly 80 cells, no matter which colors or glyphs it contains.
+
+The width of each distinct string is only calculated once and then cached.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+
+# Matches CSI escape sequences such as SGR color codes ('\033[92;1m') and
+# cursor movements ('\033[1;1H') as well as the terminal reset ('\033c')
+ANSI_PATTERN = re.compile(r'\033(?:\[[0-9;?]*[A-Za-z]|c)')
+
+
+def strip_ansi(text: str) -> str:
+    """Removes all ANSI escape sequences from a string
+
+    Args:
+        text (str): String that may contain ANSI escape sequences
+
+    Returns:
+        str: String without ANSI escape sequences
+    """
+    return ANSI_PATTERN.sub('', text)
+
+
+@lru_cache(maxsize=4096)
+def char_width(char: str) -> int:
+    """Returns the amount of terminal cells a single character occupies
+
+    Args:
+        char (str): A single character
+
+    Returns:
+        int: 0 for control, format and combining characters, 2 for wide
+            and fullwidth East Asian characters, 1 for everything else
+    """
+    if unicodedata.combining(char) or unicodedata.category(char) in (
+            'Cc', 'Cf', 'Me', 'Mn'):
+        return 0
+    if unicodedata.east_asian_width(char) in ('W', 'F'):
+        return 2
+    return 1
+
+
+@lru_cache(maxsize=4096)
+def display_width(text: str) -> int:
+    """Returns the amount of terminal cells a string occupies
+
+    Args:
+        text (str): String that may contain ANSI escape sequences and
+            Unicode characters of any width
+
+    Returns:
+        int: Visible width of the string in terminal cells
+    """
+    stripped = strip_ansi(text)
+    # Plain ASCII strings are the most common case and need no lookup
+    if stripped.isascii() and stripped.isprintable():
+        return len(stripped)
+    return sum(char_width(char) for char in stripped)
+
+
+def pad(text: str, width: int) -> str:
+    """Pads a string with whitespaces on the right up to width cells
+
+    Works like f'{text:<width}', but measures the string by its terminal
+    cell width instead of its length.
+
+    Args:
+        text (str): String to pad
+        width (int): Amount of cells the result must occupy
+
+    Returns:
+        str: The padded string; unchanged if it is already wide enough
+    """
+    return text + ' ' * max(0, width - display_width(text))
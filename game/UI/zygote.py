@@ -0,0 +1,261 @@
+"""Contains the class Zygote which forks a warm process for every player
+
+Starting a new Python process per player means paying for the interpreter
+start-up, the module imports, the Google authorization and the download of
+the text catalog before the logo appears. A Zygote does all of this once in
+a parent process and then forks a child for each connection. The child
+starts with everything already in memory, shared with the parent by
+copy-on-write, so the first frame is sent within milliseconds.
+
+Only available on systems with os.fork(), i.e. not on Windows.
+
+Usage:
+    host = GameHost(sheet, start_game)    # see game/UI/host.py
+    Zygote(host).serve(port=8002)
+"""
+import asyncio
+import gc
+import os
+import random
+import select
+import signal
+import socket
+import time
+import traceback
+
+
+class Zygote:
+    """Plays each connection in a child forked from a warm parent process
+
+    The parent must have loaded the Sheet and filled the Display caches
+    before serve() is called (see warm_up() in server.py). Each child plays
+    exactly one game with the GameHost logic and then exits, so a crash or
+    a memory leak in one game never affects another.
+
+    If the host has an Admission, the parent keeps further players in its
+    queue and shows them their position until a child has exited. The
+    SIGCHLD handler wakes the parent through a pipe, so the next player is
+    admitted as soon as a game ends.
+    If the host has Metrics with a path, the parent writes the amount of
+    games and the memory of each child to that file. Timings are measured
+    in the children and are not exported in this mode.
+
+    Args:
+        host (object): Reference to GameHost class instance; each child
+            plays its game with it
+
+    Attributes:
+        children (set): Process IDs of the running children
+        waiting (dict): Connections of the players in the queue, with the
+            position last shown to each of them
+
+    Methods:
+        serve(): Accepts players until the program is stopped
+    """
+
+    def __init__(self, host: object):
+        self.host = host
+        self.children = set()
+        self.waiting = {}
+        # The SIGCHLD handler writes to this pipe to end select() at once
+        self.__wakeup_read, self.__wakeup_write = os.pipe()
+        os.set_blocking(self.__wakeup_read, False)
+        os.set_blocking(self.__wakeup_write, False)
+
+    def serve(self, address='', port=8002):
+        """Accepts players and forks a child for each of them
+
+        Args:
+            address (str, optional): Interface to listen on. Defaults to all.
+            port (int, optional): TCP port to listen on. Defaults to 8002.
+        """
+        # Connections inherited by several children would be shared by them
+        self.host.sheet.close_connections()
+        # Everything loaded so far stays alive until the end. Keeping it
+        # away from the garbage collector keeps the collector from writing
+        # to these objects in the children, which would copy their pages.
+        gc.freeze()
+        signal.signal(signal.SIGCHLD, self.__reap)
+        admission = self.host.admission
+        metrics = self.host.metrics
+        if metrics:
+            metrics.collect = self.__collect_metrics
+        next_write = 0
+        with socket.create_server((address, port)) as server:
+            while True:
+                # While players are waiting, check regularly whether memory
+                # has become available
+                timeout = admission.POLL_INTERVAL if self.waiting else None
+                if metrics and metrics.path:
+                    now = time.monotonic()
+                    if now >= next_write:
+                        metrics.write()
+                        next_write = now + metrics.INTERVAL
+                    timeout = min(timeout or metrics.INTERVAL,
+                                  next_write - now)
+                ready, _, _ = select.select(
+                    [server, self.__wakeup_read, *self.waiting], [], [],
+                    timeout)
+                for connection in ready:
+                    if connection == self.__wakeup_read:
+                        # A child has exited; its place is given away below
+                        self.__drain_wakeup()
+                    elif connection is server:
+                        connection, _ = server.accept()
+                        if admission is None:
+                            self.__fork(server, connection)
+                            continue
+                        admission.join(connection)
+                        self.waiting[connection] = None
+                    else:
+                        # Discard keys typed while waiting, and find out
+                        # whether the player has left
+                        self.__check_waiting(connection)
+                if admission is not None:
+                    self.__admit(server)
+
+    def __admit(self, server: socket.socket):
+        """Forks a child for each admitted player, updates waiting screens
+
+        Args:
+            server (socket.socket): The listening socket
+        """
+        admission = self.host.admission
+        for connection in admission.admit():
+            del self.waiting[connection]
+            self.__fork(server, connection)
+        for connection, shown in list(self.waiting.items()):
+            position = admission.position(connection)
+            if position != shown:
+                try:
+                    connection.sendall(admission.waiting_screen(position))
+                except OSError:
+                    self.__remove_waiting(connection)
+                    continue
+                self.waiting[connection] = position
+
+    def __check_waiting(self, connection: socket.socket):
+        """Reads input from a waiting player and removes players who left
+
+        Args:
+            connection (socket.socket): The waiting player's connection
+        """
+        try:
+            data = connection.recv(1024)
+        except ConnectionError:
+            data = b''
+        if not data:
+            self.__remove_waiting(connection)
+
+    def __drain_wakeup(self):
+        """Empties the wake-up pipe, which may hold a byte per exited child"""
+        try:
+            while os.read(self.__wakeup_read, 1024):
+                pass
+        except BlockingIOError:
+            pass
+
+    def __remove_waiting(self, connection: socket.socket):
+        """Removes a player who has left from the queue
+
+        Args:
+            connection (socket.socket): The waiting player's connection
+        """
+        self.host.admission.cancel(connection)
+        del self.waiting[connection]
+        connection.close()
+
+    def __fork(self, server: socket.socket, connection: socket.socket):
+        """Forks a child that plays one game over a connection
+
+        Args:
+            server (socket.socket): The listening socket, which the child
+                closes
+            connection (socket.socket): The player's connection
+        """
+        # A child that exits at once must not be reaped before its process
+        # ID has been added to self.children
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGCHLD})
+        pid = os.fork()
+        if pid == 0:
+            server.close()
+            for waiting in self.waiting:
+                waiting.close()
+            os.close(self.__wakeup_read)
+            os.close(self.__wakeup_write)
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGCHLD})
+            self.__play(connection)
+        self.children.add(pid)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGCHLD})
+        connection.close()
+
+    def __play(self, connection: socket.socket):
+        """Plays one game in a child process and exits
+
+        Args:
+            connection (socket.socket): The player's connection
+        """
+        status = 0
+        # The parent has already admitted the player and reports the metrics
+        self.host.admission = None
+        self.host.metrics = None
+        try:
+            # The child inherits the state of the random number generator;
+            # without a new seed, every player would get the same cadets
+            random.seed()
+            asyncio.run(self.__session(connection))
+        except Exception:
+            traceback.print_exc()
+            status = 1
+        finally:
+            # Skip the parent's cleanup handlers, which belong to the parent
+            os._exit(status)
+
+    async def __session(self, connection: socket.socket):
+        """Plays one game over a connection with the GameHost logic
+
+        Args:
+            connection (socket.socket): The player's connection
+        """
+        reader, writer = await asyncio.open_connection(sock=connection)
+        await self.host.play(reader, writer)
+
+    def __collect_metrics(self):
+        """Sets the gauges of the metrics before they are rendered"""
+        metrics = self.host.metrics
+        metrics.set_gauge('sessions', len(self.children), phase='playing')
+        metrics.set_gauge('sessions', len(self.waiting), phase='queued')
+        for pid in list(self.children):
+            resident = metrics.resident_bytes(pid)
+            if resident is not None:
+                metrics.set_gauge('session_resident_bytes', resident, pid=pid)
+        resident = metrics.resident_bytes()
+        if resident is not None:
+            metrics.set_gauge('process_resident_bytes', resident)
+
+    def __reap(self, signum, frame):
+        """Collects the exit status of finished children
+
+        Args:
+            signum (int): The signal number (SIGCHLD)
+            frame: The current stack frame; unused
+        """
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            if pid in self.children:
+                self.children.discard(pid)
+                if self.host.admission:
+                    self.host.admission.leave()
+                    # select() is resumed after this handler, so the queue
+                    # would wait for its timeout without the wake-up
+                    try:
+                        os.write(self.__wakeup_write, b'\0')
+                    except BlockingIOError:
+                        # The pipe is full, so serve() wakes up anyway
+                        pass
@@ -9,40 +9,368 @@ class Cadets:
     names, skills, and skill values.
 
     Args:
-        sheet (object): Reference to Sheet class instance
+        sheet (object, optional): Reference to Sheet class instance that
+            provides the skills and names. Defaults to None, in which case
+            skills and all_names must be given, e.g. in a simulation.
+            With a sheet, i.e. in the interactive game, there may be at
+            most MENU_LIMIT skills and cadets, see check_sheet().
+        skills (list, optional): Skills to use without a sheet
+        all_names (list, optional): Names to choose from without a sheet
+        names (list, optional): Names of the cadets, e.g. of a saved game.
+            Defaults to None, which draws ROSTER_SIZE of all_names.
 
     Attributes:
-        MAX_POINTS (int): Amount of skill points to divide among all 5 skills
+        MAX_POINTS (int): Amount of skill points to divide among all skills
             of a cadet
         LOWEST_SKILL (int): Value of the lowest allowed skill value
         HIGHEST_SKILL (int): Value of the highest allowed skill value
-        skills (list): Five skills the cadets are being tested for
+        ROSTER_SIZE (int): Amount of cadets to recruit
+        MENU_LIMIT (int): Highest amount of skills and cadets in the
+            interactive game, whose menus are chosen with single digit keys
+        UNIFORM_SKILLS (bool): If True, the skill values are drawn uniformly
+            from all valid combinations (see composition()) instead of by
+            __cadet_skill_generator()
+        STEPWISE_LIMITS (tuple): Amount of skills, MAX_POINTS, LOWEST_SKILL
+            and HIGHEST_SKILL that __cadet_skill_generator() works with;
+            with any other values, the uniform sampler is used
+        TABLE_LIMIT (int): Up to this amount of combinations, the uniform
+            sampler looks them up in the table of compositions(), which is
+            faster than computing them with composition()
+        skills (list): Skills the cadets are being tested for
         all_names (list): Names to randomly choose from when building dict
-        names (list): Random sample of 6 names from all_names variable
+        names (list): Random sample of ROSTER_SIZE names from all_names
         cadets (dict): Dict in the format {name: {skill: value, ...}, ... }
 
     Methods:
         recruit(): Builds cadet dict and outputs message on screen
+        combinations(): Returns the amount of valid combinations of skill
+            values
+        composition(): Returns the valid combination with an index
+        compositions(): Returns all valid combinations of skill values
+        generate_batch(): Generates the skill values of many rosters at once
+        check_sheet(): Checks that the game menus can show the skills of a
+            sheet
     """
     MAX_POINTS = 25
     LOWEST_SKILL = 1
     HIGHEST_SKILL = 10
+    ROSTER_SIZE = 6
+    MENU_LIMIT = 9
+    UNIFORM_SKILLS = False
+    # Amount of skills and limits that the step-by-step rules of
+    # __cadet_skill_generator() were written for; with any others, the
+    # uniform sampler is used
+    STEPWISE_LIMITS = (5, 25, 1, 10)
+    TABLE_LIMIT = 100_000
+    # Tables of compositions() and __counts(), keyed by amount of skills and
+    # the limits
+    __compositions = {}
+    __count_tables = {}
 
-    def __init__(self, sheet: object):
-        self.skills = sheet.get_list('skill_list')
-        self.names = random.sample(sheet.get_list('name_list'), 6)
+    def __init__(self, sheet=None, skills=None, all_names=None, names=None):
+        if sheet is not None:
+            skills = sheet.get_list('skill_list')
+            all_names = sheet.get_list('name_list')
+        self.skills = skills
+        # Given names, e.g. of a restored game, draw no random numbers
+        self.names = names if names is not None \
+            else random.sample(all_names, self.ROSTER_SIZE)
         self.cadets = {}
 
     def recruit(self):
         """Initializes cadet dictionary
 
-        Builds initial cadet dictionary with 6 cadets and their respective
-        secret skill values.
+        Builds initial cadet dictionary with ROSTER_SIZE cadets and their
+        respective secret skill values.
         """
-        self.cadets = {key: dict(zip(
-                                 self.skills, self.__cadet_skill_generator()))
+        generator = self.__cadet_skill_generator \
+            if self.__is_stepwise(len(self.skills)) \
+            else self.__uniform_skill_generator
+        self.cadets = {key: dict(zip(self.skills, generator()))
                        for key in self.names}
 
+    @classmethod
+    def check_sheet(cls, sheet: object):
+        """Checks that the game menus can show the skills of a sheet
+
+        Called once at start-up, so that an unsuitable text catalog is
+        reported before any game starts.
+
+        Args:
+            sheet (object): Reference to Sheet class instance
+
+        Raises:
+            ValueError: If there are more than MENU_LIMIT skills or cadets
+        """
+        skills = sheet.get_list('skill_list')
+        if max(len(skills), cls.ROSTER_SIZE) > cls.MENU_LIMIT:
+            raise ValueError(f'The game menus allow at most '
+                             f'{cls.MENU_LIMIT} skills and cadets')
+
+    @classmethod
+    def combinations(cls, skill_amount=5) -> int:
+        """Returns the amount of valid combinations of skill values
+
+        Args:
+            skill_amount (int, optional): Amount of skills. Defaults to 5.
+
+        Returns:
+            int: Amount of ways to divide MAX_POINTS among the skills with
+                each value between LOWEST_SKILL and HIGHEST_SKILL
+        """
+        return cls.__counts(skill_amount)[skill_amount][cls.MAX_POINTS]
+
+    @classmethod
+    def composition(cls, index: int, skill_amount=5) -> list:
+        """Returns the valid combination of skill values with an index
+
+        The combination is computed from the index without listing the
+        others, in time linear in the amount of skills, so this also works
+        for limits with far too many combinations to list.
+
+        Args:
+            index (int): Index from 0 to combinations() - 1, in the order of
+                compositions()
+            skill_amount (int, optional): Amount of skills. Defaults to 5.
+
+        Raises:
+            IndexError: If there is no combination with this index
+
+        Returns:
+            list: One value per skill
+        """
+        counts = cls.__counts(skill_amount)
+        points = cls.MAX_POINTS
+        if not 0 <= index < counts[skill_amount][points]:
+            raise IndexError(f'No combination of skill values with index '
+                             f'{index}')
+        values = []
+        for skills_left in range(skill_amount - 1, -1, -1):
+            # Skip all combinations that start with a lower value
+            value = cls.LOWEST_SKILL
+            while index >= counts[skills_left][points - value]:
+                index -= counts[skills_left][points - value]
+                value += 1
+            values.append(value)
+            points -= value
+        return values
+
+    @classmethod
+    def compositions(cls, skill_amount=5) -> list:
+        """Returns all valid combinations of skill values
+
+        Lists every way to divide MAX_POINTS among the skills with each value
+        between LOWEST_SKILL and HIGHEST_SKILL. The table is built once for
+        each set of limits and then kept. Its size grows exponentially with
+        the amount of skills; composition() doesn't need the table.
+
+        Args:
+            skill_amount (int, optional): Amount of skills. Defaults to 5.
+
+        Returns:
+            list: Tuples of skill values in lexicographic order; 5631 for
+                the default limits
+        """
+        key = (skill_amount, cls.MAX_POINTS, cls.LOWEST_SKILL,
+               cls.HIGHEST_SKILL)
+        table = cls.__compositions.get(key)
+        if table is None:
+            table = cls.__compositions[key] = cls.__build_compositions(
+                skill_amount, cls.MAX_POINTS)
+        return table
+
+    @classmethod
+    def __build_compositions(cls, skill_amount: int, points: int) -> list:
+        """Lists all ways to divide points among an amount of skills
+
+        Args:
+            skill_amount (int): Amount of skills
+            points (int): Points to divide
+
+        Returns:
+            list: Tuples of skill values
+        """
+        low, high = cls.LOWEST_SKILL, cls.HIGHEST_SKILL
+        if skill_amount == 1:
+            return [(points,)] if low <= points <= high else []
+        # The first value must leave enough points for the other skills,
+        # but not more than they can take
+        first_min = max(low, points - high * (skill_amount - 1))
+        first_max = min(high, points - low * (skill_amount - 1))
+        return [(first, *rest)
+                for first in range(first_min, first_max + 1)
+                for rest in cls.__build_compositions(skill_amount - 1,
+                                                     points - first)]
+
+    @classmethod
+    def __counts(cls, skill_amount: int) -> list:
+        """Counts the ways to divide any points among any amount of skills
+
+        Args:
+            skill_amount (int): Highest amount of skills
+
+        Returns:
+            list: counts[skills][points] is the amount of ways to divide
+                points among skills with each value within the limits;
+                points up to MAX_POINTS. Negative points count as 0 ways.
+        """
+        key = (skill_amount, cls.MAX_POINTS, cls.LOWEST_SKILL,
+               cls.HIGHEST_SKILL)
+        counts = cls.__count_tables.get(key)
+        if counts is None:
+            low, high = cls.LOWEST_SKILL, cls.HIGHEST_SKILL
+            # One extra entry of 0 ways, so that counts[k][-1] is 0
+            counts = [[1] + [0] * cls.MAX_POINTS + [0]]
+            for _ in range(skill_amount):
+                previous = counts[-1]
+                counts.append([sum(previous[points - value]
+                                   for value in range(low, high + 1)
+                                   if points - value >= 0)
+                               for points in range(cls.MAX_POINTS + 1)]
+                              + [0])
+            cls.__count_tables[key] = counts
+        return counts
+
+    @classmethod
+    def __is_stepwise(cls, skill_amount: int) -> bool:
+        """Checks whether __cadet_skill_generator() is used
+
+        Args:
+            skill_amount (int): Amount of skills
+
+        Returns:
+            bool: True unless UNIFORM_SKILLS is set or the amount of skills
+                or the limits differ from STEPWISE_LIMITS
+        """
+        return not cls.UNIFORM_SKILLS and cls.STEPWISE_LIMITS == (
+            skill_amount, cls.MAX_POINTS, cls.LOWEST_SKILL, cls.HIGHEST_SKILL)
+
+    @classmethod
+    def generate_batch(cls, rosters: int, rng=None,
+                       skill_amount=5) -> object:
+        """Generates the skill values of many rosters at once
+
+        Draws the skill values with the same rules as recruit(), but for
+        all cadets at once with NumPy, so the values have the same
+        distribution. Meant for simulations and analyses; the game itself
+        doesn't need NumPy.
+
+        Args:
+            rosters (int): Amount of rosters to generate
+            rng (numpy.random.Generator, optional): Random number generator.
+                Defaults to a new generator with a random seed.
+            skill_amount (int, optional): Amount of skills. Defaults to 5.
+
+        Raises:
+            ValueError: If no combination of skill values fits the limits
+
+        Returns:
+            numpy.ndarray: Array of shape (rosters, ROSTER_SIZE,
+                skill_amount) with the skill values of each cadet in the
+                order of self.skills
+        """
+        # NumPy is only imported when it is needed
+        import numpy as np
+        rng = rng if rng is not None else np.random.default_rng()
+        shape = (rosters, cls.ROSTER_SIZE)
+        if not cls.__is_stepwise(skill_amount):
+            return cls.__uniform_batch(shape, rng, skill_amount)
+        low, high = cls.LOWEST_SKILL, cls.HIGHEST_SKILL
+        points = np.empty((*shape, 5), dtype=np.int16)
+        # The first two values can be chosen randomly
+        points[..., 0] = rng.integers(low, high + 1, shape)
+        points[..., 1] = rng.integers(low, high + 1, shape)
+        # The 3rd and 4th values use the same ranges as in
+        # __cadet_skill_generator(), computed for all cadets at once
+        remaining = cls.MAX_POINTS - points[..., 0] - points[..., 1]
+        upper = np.minimum(remaining - 1, high + 1)
+        lower = np.where(remaining < high * 2, low,
+                         np.maximum(remaining % (high * 2), 1))
+        points[..., 2] = rng.integers(lower, upper)
+        remaining -= points[..., 2]
+        upper = np.minimum(remaining, high + 1)
+        lower = np.where(remaining < high, low,
+                         np.where(remaining == high * 2, high,
+                                  np.maximum(remaining % high, 1)))
+        points[..., 3] = rng.integers(lower, upper)
+        # The 5th value takes the remaining points
+        points[..., 4] = remaining - points[..., 3]
+        return points
+
+    @classmethod
+    def __uniform_batch(cls, shape: tuple, rng: object,
+                        skill_amount: int) -> object:
+        """Draws skill values uniformly for an array of cadets with NumPy
+
+        The values are drawn one skill after the other. Each value is drawn
+        with the share of the valid combinations that start with it, given
+        the values before it, which makes every combination equally likely.
+
+        Args:
+            shape (tuple): Amount of rosters and cadets per roster
+            rng (numpy.random.Generator): Random number generator
+            skill_amount (int): Amount of skills
+
+        Raises:
+            ValueError: If no combination of skill values fits the limits
+
+        Returns:
+            numpy.ndarray: Array of shape (*shape, skill_amount)
+        """
+        import numpy as np
+        amount = cls.combinations(skill_amount)
+        if amount == 0:
+            raise ValueError('No skill values fit MAX_POINTS, LOWEST_SKILL '
+                             'and HIGHEST_SKILL')
+        if amount <= cls.TABLE_LIMIT:
+            table = np.array(cls.compositions(skill_amount), dtype=np.int16)
+            return table[rng.integers(amount, size=shape)]
+        counts = np.array(cls.__counts(skill_amount), dtype=np.float64)
+        values = np.arange(cls.LOWEST_SKILL, cls.HIGHEST_SKILL + 1)
+        rows = np.arange(cls.MAX_POINTS + 1)
+        remaining = np.full(shape, cls.MAX_POINTS)
+        points = np.empty((*shape, skill_amount), dtype=np.int16)
+        for skill in range(skill_amount):
+            skills_left = skill_amount - skill - 1
+            # Cumulative share of each value, for every amount of remaining
+            # points; index -1 of counts is 0 ways
+            left = rows[:, None] - values[None, :]
+            ways = counts[skills_left][np.where(left >= 0, left, -1)]
+            totals = ways.sum(axis=1, keepdims=True)
+            shares = np.cumsum(ways, axis=1) / np.where(totals, totals, 1)
+            shares[:, -1] = 1
+            # Adding the row number makes the table one ascending array, so
+            # one search finds the value for all cadets
+            table = (shares + rows[:, None]).ravel()
+            index = np.searchsorted(table, remaining + rng.random(shape),
+                                    side='right') - remaining * len(values)
+            points[..., skill] = values[np.minimum(index, len(values) - 1)]
+            remaining = remaining - points[..., skill]
+        return points
+
+    def __uniform_skill_generator(self) -> list:
+        """Draws a list of skill values uniformly from all combinations
+
+        Every valid combination of skill values is equally likely; only one
+        random index is drawn, see compositions() and composition(). Works
+        for any amount of skills and any limits.
+
+        Raises:
+            ValueError: If no combination fits the limits
+
+        Returns:
+            list: One value per skill
+        """
+        skill_amount = len(self.skills)
+        amount = self.combinations(skill_amount)
+        if not amount:
+            raise ValueError('No skill values fit MAX_POINTS, LOWEST_SKILL '
+                             'and HIGHEST_SKILL')
+        index = random.randrange(amount)
+        if amount <= self.TABLE_LIMIT:
+            return list(self.compositions(skill_amount)[index])
+        return self.composition(index, skill_amount)
+
     def __cadet_skill_generator(self) -> list:
         """Generates a list with 5 random skill values
 
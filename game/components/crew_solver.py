@@ -0,0 +1,153 @@
+"""Contains the CrewSolver class which finds the best crew for a mission"""
+
+
+class CrewSolver:
+    """Assigns cadets to roles so that the crew is as good as possible
+
+    Solves the assignment problem on a matrix of weights, one row per role
+    and one column per cadet, with the Hungarian algorithm: every role gets
+    a different cadet, and the sum of the weights of the chosen cadets is
+    the highest possible. This takes O(roles² * cadets) steps instead of
+    trying every possible crew, so it also works for large rosters.
+
+    Usage:
+        weights = CrewSolver.mission_weights(skill_matrix, parameters)
+        columns = CrewSolver.assign(weights)
+
+    Methods:
+        assign(): Returns the best cadet for each role
+        mission_weights(): Weights for a mission with known parameters
+        expected_weights(): Weights for a mission with unknown parameters
+    """
+
+    @staticmethod
+    def assign(weights: list) -> list:
+        """Returns the best cadet for each role
+
+        Args:
+            weights (list): One row per role with the weight of each cadet
+                in this role; there must be at least as many cadets as roles
+
+        Raises:
+            ValueError: If there are fewer cadets than roles
+
+        Returns:
+            list: Column index of the chosen cadet for each role
+        """
+        roles = len(weights)
+        cadets = len(weights[0]) if roles else 0
+        if cadets < roles:
+            raise ValueError('There must be at least as many cadets as roles')
+        infinity = float('inf')
+        # Potentials of the roles and cadets, the role each cadet is
+        # assigned to, and the previous cadet on the shortest path. Index 0
+        # is a virtual cadet, and roles are numbered from 1.
+        role_potential = [0] * (roles + 1)
+        cadet_potential = [0] * (cadets + 1)
+        assigned = [0] * (cadets + 1)
+        previous = [0] * (cadets + 1)
+        for role in range(1, roles + 1):
+            # Find the shortest path that adds this role to the assignment;
+            # the costs are the negative weights
+            assigned[0] = role
+            cadet = 0
+            distance = [infinity] * (cadets + 1)
+            visited = [False] * (cadets + 1)
+            while True:
+                visited[cadet] = True
+                current_role = assigned[cadet]
+                row = weights[current_role - 1]
+                potential = role_potential[current_role]
+                delta = infinity
+                next_cadet = 0
+                for column in range(1, cadets + 1):
+                    if visited[column]:
+                        continue
+                    cost = -row[column - 1] - potential \
+                        - cadet_potential[column]
+                    if cost < distance[column]:
+                        distance[column] = cost
+                        previous[column] = cadet
+                    if distance[column] < delta:
+                        delta = distance[column]
+                        next_cadet = column
+                for column in range(cadets + 1):
+                    if visited[column]:
+                        role_potential[assigned[column]] += delta
+                        cadet_potential[column] -= delta
+                    else:
+                        distance[column] -= delta
+                cadet = next_cadet
+                if assigned[cadet] == 0:
+                    break
+            # Shift the assignments along the path
+            while cadet:
+                assigned[cadet] = assigned[previous[cadet]]
+                cadet = previous[cadet]
+        result = [0] * roles
+        for column in range(1, cadets + 1):
+            if assigned[column]:
+                result[assigned[column] - 1] = column - 1
+        return result
+
+    @staticmethod
+    def mission_weights(skills: list, parameters: list) -> list:
+        """Weights that maximize the mission score for known parameters
+
+        A cadet succeeds in a role if their skill value reaches the mission
+        parameter. Every success outweighs any difference in skill values,
+        so the best crew has the most successful cadets and, among those
+        crews, the highest skill values.
+
+        Args:
+            skills (list): One row per role with the skill value of each
+                cadet for this role
+            parameters (list): Mission parameter of each role
+
+        Returns:
+            list: Weights for assign()
+        """
+        success = CrewSolver.__value_range(skills)
+        return [[value + success if value >= param else value
+                 for value in row]
+                for row, param in zip(skills, parameters)]
+
+    @staticmethod
+    def expected_weights(skills: list, lowest: int, highest: int) -> list:
+        """Weights that maximize the expected mission score
+
+        For a player who doesn't know the mission parameters, each
+        parameter is a random integer from lowest to highest. The weight of
+        a cadet is the amount of parameters they would succeed against,
+        i.e. their chance to succeed times the amount of possible
+        parameters. Every one of these counts outweighs any difference in
+        skill values, which only decide between equal chances.
+
+        Args:
+            skills (list): One row per role with the skill value of each
+                cadet for this role
+            lowest (int): Lowest mission parameter, e.g. Mission.DIFF_MIN
+            highest (int): Highest mission parameter, e.g. Mission.DIFF_MAX
+
+        Returns:
+            list: Weights for assign()
+        """
+        success = CrewSolver.__value_range(skills)
+        outcomes = highest - lowest + 1
+        return [[min(max(value - lowest + 1, 0), outcomes) * success + value
+                 for value in row]
+                for row in skills]
+
+    @staticmethod
+    def __value_range(skills: list) -> int:
+        """Returns a weight that outweighs any difference in skill values
+
+        Args:
+            skills (list): One row per role with the skill value of each
+                cadet for this role
+
+        Returns:
+            int: More than the largest possible difference between the sums
+                of skill values of two crews
+        """
+        return sum(max(row) - min(row) for row in skills if row) + 1
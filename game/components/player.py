@@ -1,5 +1,6 @@
 """Contains the Player class which handles all player-related operations"""
 import re
+from game.components.cadets import Cadets
 
 
 class Player:
@@ -8,15 +9,30 @@ class Player:
     Attributes:
         STARTING_SCORE (int): The score that is used as a base for player score
             calculations
+        MISSION_PASS_SCORE (int): Amount of cadets who must succeed for the
+            mission to succeed
+        MISSION_FAILED_PENALTY (int): Penalty for a failed mission
+        ROLE_FAILED_PENALTY (int): Penalty for each cadet who has failed
+        SKILL_PENALTY (int): Penalty for each skill point the crew lacks
+            to the highest possible skill values
+        TRIAL_RUN_BONUS (int): Bonus for each unused trial run if the
+            mission has succeeded
         name (str): Player name as entered by user, set by a method in 
             the Menu object
         score (int): Player score as calculated by class method
 
     Methods:
         set_name(): Validates player name entry during player initialization
-        build_detailed_score(): Calculates player score at the end of the game
+        calculate_score(): Calculates player score at the end of the game
+        build_detailed_score(): Builds the score overview at the end of the
+            game
     """
     STARTING_SCORE = 1500
+    MISSION_PASS_SCORE = 3
+    MISSION_FAILED_PENALTY = 700
+    ROLE_FAILED_PENALTY = 100
+    SKILL_PENALTY = 10
+    TRIAL_RUN_BONUS = 10
 
     def __init__(self):
         self.name = ""
@@ -45,10 +61,13 @@ class Player:
             return True
         return False
 
-    def __calculate_score(self, trial_runs: int, trial_max_runs: int,
+    def calculate_score(self, trial_runs: int, trial_max_runs: int,
                         mission: object) -> tuple:
         """Calculates player score at the end of the game
 
+        The weights are class attributes so that they can be tuned, e.g. by
+        a simulation.
+
         Args:
             trial_runs (int): Used-up trial runs from Trial class instance
             trial_max_runs (int): Max trial runs from Trial class instance
@@ -59,13 +78,17 @@ class Player:
         """
         # Reset score in case same player starts a new game
         self.score = 0
-        mission_failed_penalty = 0 if mission.score >= 3 else 700
-        mission_score_penalty = (5 - mission.score) * 100
+        mission_failed_penalty = 0 \
+            if mission.score >= self.MISSION_PASS_SCORE \
+            else self.MISSION_FAILED_PENALTY
+        mission_score_penalty = (len(mission.crew) - mission.score) \
+            * self.ROLE_FAILED_PENALTY
         mission_prognosis_penalty = 100 - mission.prognosis
-        skill_penalty = 500 - sum([value[1]
-                                   for value in mission.crew.values()]) * 10
+        skill_penalty = (len(mission.crew) * Cadets.HIGHEST_SKILL - sum(
+            [value[1] for value in mission.crew.values()])) \
+            * self.SKILL_PENALTY
         trial_run_bonus = 0 if mission_failed_penalty != 0 else (
-            trial_max_runs - trial_runs + 1) * 10
+            trial_max_runs - trial_runs + 1) * self.TRIAL_RUN_BONUS
         mission_difficulty_bonus = 0 if mission_failed_penalty != 0 else int(
             mission.difficulty - mission.prognosis)
         result = int(self.STARTING_SCORE - mission_failed_penalty
@@ -84,7 +107,7 @@ class Player:
                              mission: object, display: object, sheet: object):
         """Builds detailed score overview and updates Display
         
-        Calls __calculate_score() and constructs a screen view out of all
+        Calls calculate_score() and constructs a screen view out of all
         received score elements.
 
         Args:
@@ -94,7 +117,7 @@ class Player:
             display (object): Reference to Display class instance
             sheet (object): Reference to Sheet class instance
         """
-        scores = self.__calculate_score(trial_runs, trial_max_runs, mission)
+        scores = self.calculate_score(trial_runs, trial_max_runs, mission)
         self.score = scores[0]
         for idx, score in enumerate(scores, 0):
             if idx == 0:
@@ -2,6 +2,7 @@
 import math
 import random
 import textwrap
+from game.components.crew_solver import CrewSolver
 
 
 class Mission:
@@ -12,8 +13,12 @@ class Mission:
 
     Args:
         roles (list): List with cadet roles
-        display (object): Reference to Display class instance
-        sheet (object): Reference to Sheet class instance
+        display (object, optional): Reference to Display class instance
+        sheet (object, optional): Reference to Sheet class instance
+            Both default to None, e.g. in a simulation, which may then only
+            use evaluate().
+        parameters (list, optional): Mission parameters, e.g. of a saved
+            game. Defaults to None, which draws a random one per role.
 
     Attributes:
         DIFF_MIN (int): Lower threshold for the random mission parameters
@@ -24,18 +29,22 @@ class Mission:
         mission_log (dict): Collection of all mission result texts
         crew (dict): Dict with all roles as keys and a cadet and their 
             skill value for each role
-        mission_parameters (list): 5 random values that decide the difficulty
-            of the mission and to which the cadet skills will be compared.
-            The value range is [DIFF_MIN, DIFF_MAX]
-        difficulty (int): Average of the 5 randomly chosen mission parameters
+        mission_parameters (list): Random values, one per role, that decide
+            the difficulty of the mission and to which the cadet skills will
+            be compared. The value range is [DIFF_MIN, DIFF_MAX]
+        difficulty (int): Average of the randomly chosen mission parameters
         suffix (str): String needed to construct a message ID
 
     Methods:
         assemble_crew(): Lets player assign cadets to the roles via the menu
+        best_crew(): Returns the crew with the highest mission score
+        evaluate(): Calculates prognosis and score of the chosen crew
         calculate_success(): Calculates the success of the chosen crew
         show_mission_logs(): Prepares mission logs for output, sends them to
             Display
 
+    The methods that wait for input are generators and must be called with
+    'yield from' (see game/UI/session.py).
     """
     DIFF_MIN = 3
     DIFF_MAX = 10
@@ -44,7 +53,8 @@ class Mission:
     BRIGHT_CYAN = '\033[96;1m'
     RESET = '\033[0m'
 
-    def __init__(self, roles: list, display: object, sheet: object):
+    def __init__(self, roles: list, display=None, sheet=None,
+                 parameters=None):
         self.roles = roles
         self.display = display
         self.sheet = sheet
@@ -52,9 +62,11 @@ class Mission:
         self.score = 0
         self.mission_log = {}
         self.crew = {}
-        self.mission_parameters = [random.randrange(
-            self.DIFF_MIN, self.DIFF_MAX+1) for _ in range(5)]
-        self.difficulty = int((sum(self.mission_parameters)/5)*10)
+        self.mission_parameters = parameters if parameters is not None \
+            else [random.randrange(self.DIFF_MIN, self.DIFF_MAX+1)
+                  for _ in roles]
+        self.difficulty = int(
+            (sum(self.mission_parameters)/len(self.mission_parameters))*10)
         self.suffix = ''
 
     def assemble_crew(self, menu: object, trials: object, cadets: object):
@@ -64,22 +76,33 @@ class Mission:
         crew along with other info text. It also calls a menu method so that
         the player can choose cadets for each role.
         The menu method makes sure that the index is valid.
+        Roles that are already in self.crew, e.g. in a game resumed from a
+        snapshot, keep their cadets.
 
         Args:
             menu (object): Reference to Menu class instance
             trials (object): Reference to Trials class instance
             cadets (object): Reference to Cadets class instance
         """
-        available_cadets = cadets.names[:]
-        self.display.build_screen(trials.trials_log, 1)
+        assigned = [value[0] for value in self.crew.values()]
+        available_cadets = [name for name in cadets.names
+                            if name not in assigned]
+        trials.show_log()
         crew_list = [self.sheet.get_text('scr_mission_welcome')]
+        crew_list.extend(f'{role} {value[0].split(" ")[1]}'
+                         for role, value in self.crew.items())
+        if self.crew:
+            self.display.build_screen(textwrap.wrap(
+                ', '.join(crew_list)+'!', 76), 16)
         for role in self.roles:
+            if role in self.crew:
+                continue
             self.display.build_screen(
                 self.sheet.get_text(
                     "scr_mission_role",
-                    f'{self.BRIGHT_CYAN}{role}{self.RESET}'), 18, ansi=11)
+                    f'{self.BRIGHT_CYAN}{role}{self.RESET}'), 18)
             # Get the next cadet index via user input in the menu
-            index = menu.run_mission_loop(available_cadets)
+            index = yield from menu.run_mission_loop(available_cadets)
             # Construct string from role and cadet last name
             crew_list.append(
                 f'{role} {available_cadets[index].split(" ")[1]}')
@@ -92,9 +115,9 @@ class Mission:
             available_cadets.pop(index)
         # Clear menu and wait for player to read the output and press ENTER
         self.display.build_screen(self.BRIGHT_CYAN + self.sheet.get_text(
-            'scr_mission_embark') + self.RESET, 18, center=True, ansi=11)
+            'scr_mission_embark') + self.RESET, 18, center=True)
         self.display.build_menu('')
-        input(self.display.build_input(prompt_enter=True))
+        yield from self.display.read_key(prompt_enter=True)
 
     def __calculate_prognosis(self):
         """Calculates the average skill level of the crew
@@ -126,6 +149,53 @@ class Mission:
         else:
             self.suffix = 'zero'
 
+    def best_crew(self, cadets: object, expected=False) -> dict:
+        """Returns the crew with the highest mission score
+
+        Solves the assignment of cadets to roles with CrewSolver, for any
+        amount of roles and cadets. Among the crews with the most successful
+        cadets, the one with the highest skill values is chosen, which also
+        gives the highest player score.
+
+        Args:
+            cadets (object): Reference to Cadets class instance
+            expected (bool, optional): If True, the mission parameters are
+                treated as unknown, as they are for the player, and the crew
+                with the highest expected mission score is chosen. Defaults
+                to False.
+
+        Returns:
+            dict: The crew in the format of self.crew
+        """
+        skills = [[cadets.cadets[name][role] for name in cadets.names]
+                  for role in self.roles]
+        if expected:
+            weights = CrewSolver.expected_weights(skills, self.DIFF_MIN,
+                                                  self.DIFF_MAX)
+        else:
+            weights = CrewSolver.mission_weights(skills,
+                                                 self.mission_parameters)
+        columns = CrewSolver.assign(weights)
+        return {role: [cadets.names[column], row[column]]
+                for role, row, column in zip(self.roles, skills, columns)}
+
+    def evaluate(self) -> list:
+        """Calculates prognosis and score of the chosen crew
+
+        Each cadet succeeds if their skill value reaches the respective
+        mission parameter. No texts are needed, so this also works without
+        a sheet.
+
+        Returns:
+            list: True for each role whose cadet has succeeded, in the order
+                of self.crew
+        """
+        self.__calculate_prognosis()
+        results = [value[1] >= param for param, value in zip(
+            self.mission_parameters, self.crew.values())]
+        self.score = sum(results)
+        return results
+
     def calculate_success(self):
         """Calculates the success of the chosen crew, writes the mission log
 
@@ -141,19 +211,14 @@ class Mission:
         sheet.get_mission_msg() also needs the cadet name to insert it into the
         mission description.
         """
-        self.__calculate_prognosis()
+        results = self.evaluate()
         diff_values = {1: "low", 2: "low", 3: "low", 4: "low",
                        5: "low", 6: "mid", 7: "mid", 8: "mid",
                        9: "high", 10: "high"}
         # Assign mission description according to each mission parameter and
         # calculate success for each cadet.
-        for param, (key, value) in zip(self.mission_parameters,
-                                       self.crew.items()):
-            if value[1] >= param:
-                self.score += 1
-                has_succeeded = True
-            else:
-                has_succeeded = False
+        for param, has_succeeded, (key, value) in zip(
+                self.mission_parameters, results, self.crew.items()):
             fname = value[0].split(" ")[1]
             try:
                 # Get the appropriate message from the Google sheet
@@ -162,7 +227,6 @@ class Mission:
             except (TypeError, KeyError) as e:
                 print("Internal error: dictionary issue, no such key:")
                 print(key, diff_values[param], has_succeeded, fname, e)
-                input()
                 raise e
             success_text = self.sheet.get_text('ml_succeeded')
             fail_text = self.sheet.get_text('ml_failed')
@@ -186,9 +250,9 @@ class Mission:
         self.display.clear()
         # Print mission log to the screen
         for key, value in self.mission_log.items():
-            self.display.build_screen(f'{self.BRIGHT_CYAN}{key}:{self.RESET}',
-                                      3, ansi=11)
-            self.display.build_screen(value[0], 5, ansi=11)
+            self.display.build_screen(
+                f'{self.BRIGHT_CYAN}{key}:{self.RESET}', 3)
+            self.display.build_screen(value[0], 5)
             self.display.build_screen(value[1:], 7)
-            input(self.display.build_input(prompt_enter=True))
+            yield from self.display.read_key(prompt_enter=True)
             self.display.clear()
@@ -1,5 +1,4 @@
 """Contains the Trials class which handles the Trials phase logic and data"""
-import time
 
 
 class Trials:
@@ -14,19 +13,30 @@ class Trials:
 
     Attributes:
         MAX_RUNS (int): Maximum allowed amount of trial runs
+        LOG_ROWS (int): Amount of screen rows available for the trials log
         BRIGHT_CYAN, RESET: ANSI color codes
         skill (str): Name of the skill to test the cadets for
         last_skill (str): Name of the previously chosen skill
         c1 (str): Name of the first cadet to test
         c2 (str): Name of the second cadet to test
-        trials_log (dict): Contains all results in text form,
-            format {skill: ['result string 1', 'result string 2',...]}
+        trials_log (dict): Contains all results as records grouped by skill,
+            format {skill: [{'skill': str, 'cadets': [str, str],
+                             'outcome': str, 'highlight': bool}, ...]};
+            'outcome' is the suffix of the 'trials_performance_' text ID
         runs (int): Current count of trial runs
 
     Methods:
-        fill_trials(): Receives cadet indexes and starts the trial run
+        fill_trials(): Receives cadet indexes and starts the trial run;
+            a generator that must be called with 'yield from'
+        remove_highlight(): Removes the highlight from the latest result
+        show_log(): Shows the trials log on screen
+        show_runs_left(): Shows the amount of trial runs left on screen
+        restore_log(): Rebuilds the trials log from saved records
+        compare(): Returns the outcome of a trial for two skill values
     """
     MAX_RUNS = 14
+    # Screen rows available for the trials log, starting at row 1
+    LOG_ROWS = 15
     BRIGHT_CYAN = '\033[96;1m'
     RESET = '\033[0m'
 
@@ -39,6 +49,12 @@ class Trials:
         self.c2 = ""
         self.trials_log = {}
         self.runs = 0
+        # Records in the order in which they are shown on screen, the
+        # formatted screen row of each record, and the index of the
+        # highlighted record
+        self.__layout = []
+        self.__rows = []
+        self.__highlighted = None
 
     def fill_trials(self, cadets: object, skill_nr: int, c1: int, c2: int):
         """Receives skill and cadet indexes from the menu, starts the trial run
@@ -61,8 +77,7 @@ class Trials:
                                   + f'{trials_left_str:>55}', row_nr=18)
         self.display.draw()
         # Artificial waiting period for ongoing trial phase
-        time.sleep(1)
-        self.display.flush_input()
+        yield from self.display.wait(1)
         # If the player has skipped the skill choice, the previous skill is
         # used. The menu function makes sure that self.skill is set before
         # allowing the player to skip the skill choice.
@@ -71,8 +86,12 @@ class Trials:
         self.c1 = cadets.names[c1]
         self.c2 = cadets.names[c2]
         self.__run_trials(cadets)
-        self.display.build_screen(self.trials_log, row_nr=1)
+        self.show_log()
         # Updated countdown after running the trial
+        self.show_runs_left()
+
+    def show_runs_left(self):
+        """Shows the amount of trial runs left in the bottom row of the log"""
         trials_left = self.MAX_RUNS - self.runs
         sing_plural = self.sheet.get_text("trials_hours_left") \
             if trials_left != 1 \
@@ -80,61 +99,144 @@ class Trials:
         trials_left_str = f'{trials_left}{sing_plural}'
         self.display.build_screen(f"{trials_left_str:>76}", 18)
 
-    def __run_trials(self, cadets: object):
-        """Compares skill values for a cadet pair and logs the result
+    @staticmethod
+    def compare(skill_c1: int, skill_c2: int) -> str:
+        """Returns the outcome of a trial for two skill values
 
-        The result string depends on the difference in skill points for the
+        The outcome depends on the difference in skill points for the
         tested cadets.
 
         Args:
-            cadets (object): Reference to Cadet class instance
+            skill_c1 (int): Skill value of the first cadet
+            skill_c2 (int): Skill value of the second cadet
+
+        Returns:
+            str: 'mw'/'w' if the first cadet is much worse/worse than the
+                second one, 'mb'/'b' if much better/better, 'eq' if equal
         """
-        skill_c1 = cadets.cadets[self.c1][self.skill]
-        skill_c2 = cadets.cadets[self.c2][self.skill]
         skill_diff = skill_c1 - skill_c2
         if skill_diff <= -4:
-            performance = self.sheet.get_text('trials_performance_mw')
-            result_string = f'{self.c1}{performance}{self.c2}'
-        elif skill_diff < 0:
-            performance = self.sheet.get_text('trials_performance_w')
-            result_string = f'{self.c1}{performance}{self.c2}'
-        elif skill_diff >= 4:
-            performance = self.sheet.get_text('trials_performance_mb')
-            result_string = f'{self.c1}{performance}{self.c2}'
-        elif skill_diff > 0:
-            performance = self.sheet.get_text('trials_performance_b')
-            result_string = f'{self.c1}{performance}{self.c2}'
+            return 'mw'
+        if skill_diff < 0:
+            return 'w'
+        if skill_diff >= 4:
+            return 'mb'
+        if skill_diff > 0:
+            return 'b'
+        return 'eq'
+
+    def restore_log(self, records: list):
+        """Rebuilds the trials log from saved records
+
+        The records must be in the order of self.trials_log, i.e. grouped by
+        skill, as saved by game/UI/snapshot.py. Adding them in this order
+        restores the same screen layout.
+
+        Args:
+            records (list): Trial result records, see self.trials_log
+        """
+        self.trials_log = {}
+        self.__layout = []
+        self.__rows = []
+        self.__highlighted = None
+        for record in records:
+            self.__add_record(dict(record))
+
+    def __run_trials(self, cadets: object):
+        """Compares skill values for a cadet pair and logs the result
+
+        Args:
+            cadets (object): Reference to Cadet class instance
+        """
+        outcome = self.compare(cadets.cadets[self.c1][self.skill],
+                               cadets.cadets[self.c2][self.skill])
+        # Remove previous highlight
+        self.remove_highlight()
+        # Add and highlight the current result
+        record = {'skill': self.skill, 'cadets': [self.c1, self.c2],
+                  'outcome': outcome, 'highlight': True}
+        self.__add_record(record)
+        self.last_skill = self.skill
+        self.runs += 1
+
+    def __add_record(self, record: dict):
+        """Adds a record to the trials log and formats its screen row
+
+        The record is inserted behind the other results for the same skill.
+        Only the new record is formatted; the rows of all other records are
+        kept as they are.
+
+        Args:
+            record (dict): Trial result record
+        """
+        skill = record['skill']
+        # The new record goes behind all records of the skills that come
+        # before it and of its own skill
+        position = 0
+        for key, records in self.trials_log.items():
+            position += len(records)
+            if key == skill:
+                break
         else:
-            performance = self.sheet.get_text('trials_performance_eq')
+            self.trials_log[skill] = []
+        self.trials_log[skill].append(record)
+        self.__layout.insert(position, record)
+        self.__rows.insert(position, self.__format_record(position))
+        if record['highlight']:
+            self.__highlighted = position
+
+    def __format_record(self, position: int) -> str:
+        """Formats the screen row for the record at a position in the layout
+
+        The first record of each skill shows the skill name in front of the
+        result.
+
+        Args:
+            position (int): Index of the record in the layout
+
+        Returns:
+            str: Screen row with border chars
+        """
+        record = self.__layout[position]
+        c1, c2 = record['cadets']
+        performance = self.sheet.get_text(
+            f'trials_performance_{record["outcome"]}')
+        if record['outcome'] == 'eq':
             and_string = self.sheet.get_text('trials_performance_and')
-            result_string = f'{self.c1}{and_string}{self.c2}{performance}'
-
-        if self.trials_log.get(self.skill):
-            # Remove previous highlight
-            self.remove_highlight()
-            # Add and highlight the current result
-            self.trials_log[self.skill].append(
-                f'{self.BRIGHT_CYAN}{result_string:<61}{self.RESET}')
+            result_string = f'{c1}{and_string}{c2}{performance}'
         else:
-            # Remove previous highlight
-            self.remove_highlight()
-            # Add and highlight the current result.
-            # Result must be stored as a list to ensure correct processing by
-            # the Display class
-            self.trials_log[self.skill] = [
-                f'{self.BRIGHT_CYAN}{result_string:<61}{self.RESET}']
-        self.last_skill = self.skill
-        self.runs += 1
+            result_string = f'{c1}{performance}{c2}'
+        if record['highlight']:
+            result_string = (f'{self.BRIGHT_CYAN}{result_string:<61}'
+                             f'{self.RESET}')
+        is_first = (position == 0 or
+                    self.__layout[position - 1]['skill'] != record['skill'])
+        key = f'{record["skill"]}: ' if is_first else ''
+        return self.display.format_dict_row(key, result_string)
 
     def remove_highlight(self):
         """Removes highlight from previously highlighted entry
         
-        The last added list element for the previously chosen skill in the
-        trials_log dictionary is highlighted in cyan. This highlight must be
-        removed as soon as the next element is added and highlighted.
+        The last added result is highlighted in cyan. This highlight must be
+        removed as soon as the next result is added and highlighted. Only the
+        screen row of that one result is formatted again.
+        """
+        if self.__highlighted is not None:
+            position = self.__highlighted
+            self.__highlighted = None
+            self.__layout[position]['highlight'] = False
+            self.__rows[position] = self.__format_record(position)
+
+    def show_log(self):
+        """Shows the trials log on screen, starting at row 1
+
+        If the log is longer than LOG_ROWS, the part of the log that ends
+        with the highlighted result (or the last page if no result is
+        highlighted) is shown.
         """
-        if self.last_skill:
-            color_string = self.trials_log[self.last_skill][-1]
-            color_string = color_string.replace('\x1b[96;1m', '')
-            color_string = color_string.replace('\x1b[0m', '')
-            self.trials_log[self.last_skill][-1] = color_string
+        start = 0
+        if len(self.__rows) > self.LOG_ROWS:
+            end = len(self.__rows) if self.__highlighted is None \
+                else max(self.__highlighted + 1, self.LOG_ROWS)
+            start = end - self.LOG_ROWS
+        self.display.blit(self.__rows[start:start + self.LOG_ROWS], 1)
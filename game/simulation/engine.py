@@ -0,0 +1,365 @@
+"""Plays games without Display or Sheet to collect score statistics
+
+Each simulated game uses the real game logic: Cadets recruits the cadets,
+Trials.compare() decides the trial outcomes, Mission draws the mission
+parameters and evaluates the crew, and Player.calculate_score() scores the
+game. Only the screens, texts and pauses are left out, so a game takes
+microseconds instead of minutes, and a Strategy plays the part of the
+player.
+
+The games are split into chunks, which a process pool plays on all CPU
+cores. Every chunk has its own seed, so a simulation with the same seed
+and chunk size gives the same result with any amount of processes.
+
+Usage:
+    result = simulate('knockout', 1_000_000,
+                      {'Mission.DIFF_MIN': 4, 'Trials.MAX_RUNS': 10})
+    print(result.report())
+"""
+import math
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from game.components.cadets import Cadets
+from game.components.player import Player
+from game.phases.mission import Mission
+from game.phases.trials import Trials
+from game.simulation.strategies import load_strategy
+
+# The simulation needs no texts; roles and names are only labels. Further
+# roles are numbered.
+SKILLS = ['Captain', 'Doctor', 'Engineer', 'Pilot', 'Security']
+# Classes whose UPPER-case attributes can be overridden, e.g.
+# 'Mission.DIFF_MIN'
+TUNABLE = {cls.__name__: cls for cls in (Cadets, Trials, Mission, Player)}
+# Games per task of the process pool
+CHUNK_SIZE = 20_000
+
+
+class SimulatedGame:
+    """One game as a strategy sees it
+
+    Args:
+        cadets (object): Reference to Cadets class instance with recruited
+            cadets
+        mission (object): Reference to Mission class instance
+
+    Attributes:
+        skills (list): Skills to test, which are also the mission roles
+        names (list): Names of the cadets
+        difficulty (int): Mission difficulty as shown to the player
+        max_runs (int): Maximum amount of trial runs
+        runs (int): Trial runs used so far
+
+    Methods:
+        trial(): Tests two cadets for a skill and returns the outcome
+        reveal(): Returns the hidden skill values and mission parameters
+    """
+
+    def __init__(self, cadets: object, mission: object):
+        self.skills = cadets.skills
+        self.names = cadets.names
+        self.difficulty = mission.difficulty
+        self.max_runs = Trials.MAX_RUNS
+        self.runs = 0
+        self.__cadets = cadets
+        self.__mission = mission
+
+    def trial(self, skill: str, c1: str, c2: str) -> str:
+        """Tests two cadets for a skill, like a trial run in the game
+
+        Args:
+            skill (str): Skill to test
+            c1 (str): Name of the first cadet
+            c2 (str): Name of the second cadet
+
+        Raises:
+            ValueError: If a cadet is tested against themself
+
+        Returns:
+            str: Outcome for the first cadet, see Trials.compare(); None if
+                all trial runs are used up
+        """
+        if c1 == c2:
+            raise ValueError('A cadet cannot be tested against themself')
+        if self.runs >= self.max_runs:
+            return None
+        self.runs += 1
+        cadets = self.__cadets.cadets
+        return Trials.compare(cadets[c1][skill], cadets[c2][skill])
+
+    def reveal(self) -> tuple:
+        """Returns what a player can't know, for reference strategies
+
+        Returns:
+            tuple: The cadets dict of Cadets and the mission parameters
+        """
+        return self.__cadets.cadets, self.__mission.mission_parameters
+
+
+class SimulationResult:
+    """Score and mission success distributions of simulated games
+
+    Args:
+        scores (Counter, optional): Amount of games per player score
+        successes (Counter, optional): Amount of games per mission score,
+            i.e. per amount of successful cadets
+        pass_score (int, optional): Mission score needed for a successful
+            mission. Defaults to Player.MISSION_PASS_SCORE.
+
+    Attributes:
+        scores (Counter): Amount of games per player score
+        successes (Counter): Amount of games per mission score
+        pass_score (int): Mission score needed for a successful mission
+        games (int): Amount of games
+
+    Methods:
+        add(): Adds the games of another result
+        mean(): Returns the average player score
+        stdev(): Returns the standard deviation of the player score
+        percentile(): Returns a percentile of the player score
+        success_rate(): Returns the share of successful missions
+        report(): Returns the distributions as text
+        to_dict(): Returns the distributions as a JSON-compatible dict
+    """
+
+    def __init__(self, scores=None, successes=None, pass_score=None):
+        self.scores = Counter(scores or {})
+        self.successes = Counter(successes or {})
+        self.pass_score = pass_score or Player.MISSION_PASS_SCORE
+        self.games = sum(self.scores.values())
+
+    def add(self, other: 'SimulationResult'):
+        """Adds the games of another result
+
+        Args:
+            other (SimulationResult): Result of other games
+        """
+        self.scores.update(other.scores)
+        self.successes.update(other.successes)
+        self.pass_score = other.pass_score
+        self.games += other.games
+
+    def mean(self) -> float:
+        """Returns the average player score"""
+        return sum(score * count for score, count in self.scores.items()) \
+            / self.games
+
+    def stdev(self) -> float:
+        """Returns the standard deviation of the player score"""
+        mean = self.mean()
+        return math.sqrt(sum((score - mean) ** 2 * count
+                             for score, count in self.scores.items())
+                         / self.games)
+
+    def percentile(self, share: float) -> int:
+        """Returns a percentile of the player score
+
+        Args:
+            share (float): Share of games between 0 and 1, e.g. 0.5 for the
+                median
+
+        Returns:
+            int: The lowest score that at least this share of games reaches
+                or falls below
+        """
+        target = share * self.games
+        seen = 0
+        for score in sorted(self.scores):
+            seen += self.scores[score]
+            if seen >= target:
+                return score
+        return max(self.scores)
+
+    def success_rate(self) -> float:
+        """Returns the share of successful missions"""
+        return sum(count for score, count in self.successes.items()
+                   if score >= self.pass_score) / self.games
+
+    def report(self, bin_width=100) -> str:
+        """Returns the distributions as text with a bar for each value
+
+        Args:
+            bin_width (int, optional): Width of the player score bins.
+                Defaults to 100.
+
+        Returns:
+            str: Summary, mission scores and binned player scores
+        """
+        lines = [f'games:            {self.games}',
+                 f'mission success:  {self.success_rate():.1%}',
+                 f'player score:     mean {self.mean():.1f}, '
+                 f'stdev {self.stdev():.1f}, '
+                 f'p10 {self.percentile(0.1)}, '
+                 f'median {self.percentile(0.5)}, '
+                 f'p90 {self.percentile(0.9)}',
+                 'successful cadets:']
+        for score in range(max(self.successes) + 1):
+            lines.append(self.__bar(str(score), self.successes[score]))
+        lines.append('player scores:')
+        bins = Counter()
+        for score, count in self.scores.items():
+            bins[score // bin_width * bin_width] += count
+        for start in range(min(bins), max(bins) + 1, bin_width):
+            lines.append(self.__bar(f'{start}-{start + bin_width - 1}',
+                                    bins[start]))
+        return '\n'.join(lines)
+
+    def to_dict(self) -> dict:
+        """Returns the distributions as a JSON-compatible dict"""
+        return {'games': self.games,
+                'success_rate': self.success_rate(),
+                'mean': self.mean(),
+                'stdev': self.stdev(),
+                'successes': {str(score): count for score, count
+                              in sorted(self.successes.items())},
+                'scores': {str(score): count for score, count
+                           in sorted(self.scores.items())}}
+
+    def __bar(self, label: str, count: int) -> str:
+        """Formats one row of a distribution
+
+        Args:
+            label (str): Value or range of the row
+            count (int): Amount of games in the row
+
+        Returns:
+            str: Label, share of games and a bar of up to 50 chars
+        """
+        share = count / self.games
+        return f'  {label:>9} {share:6.1%} {"#" * round(share * 50)}'
+
+
+def apply_overrides(overrides: dict) -> dict:
+    """Overrides tunable game constants in this process
+
+    Args:
+        overrides (dict): New values keyed by 'Class.ATTRIBUTE', e.g.
+            {'Mission.DIFF_MIN': 4}; the classes are listed in TUNABLE
+
+    Raises:
+        ValueError: If a key doesn't name an UPPER-case attribute of a
+            tunable class
+
+    Returns:
+        dict: The previous values, to undo the overrides
+    """
+    previous = {}
+    for key, value in overrides.items():
+        class_name, _, attribute = key.partition('.')
+        cls = TUNABLE.get(class_name)
+        if cls is None or not attribute.isupper() \
+                or not hasattr(cls, attribute):
+            raise ValueError(f'Not a tunable constant: {key}')
+        previous[key] = getattr(cls, attribute)
+        setattr(cls, attribute, value)
+    return previous
+
+
+def play_game(strategy: object, skills: list, names: list) -> tuple:
+    """Plays one game with a strategy
+
+    Args:
+        strategy (object): Reference to Strategy class instance
+        skills (list): Skills of the cadets, which are also the roles
+        names (list): Names of the cadets, Cadets.ROSTER_SIZE or more
+
+    Raises:
+        ValueError: If the strategy returns an invalid crew
+
+    Returns:
+        tuple: Player score and mission score
+    """
+    cadets = Cadets(skills=skills, all_names=names)
+    cadets.recruit()
+    mission = Mission(cadets.skills)
+    game = SimulatedGame(cadets, mission)
+    crew = strategy.play(game)
+    if len(set(crew)) != len(skills) or not set(crew) <= set(cadets.names):
+        raise ValueError(f'Invalid crew: {crew}')
+    mission.crew = {role: [name, cadets.cadets[name][role]]
+                    for role, name in zip(cadets.skills, crew)}
+    mission.evaluate()
+    scores = Player().calculate_score(game.runs, Trials.MAX_RUNS, mission)
+    return scores[0], mission.score
+
+
+def play_chunk(strategy_name: str, overrides: dict, games: int,
+               seed: int, skill_amount=5) -> SimulationResult:
+    """Plays a chunk of games; the task of a pool process
+
+    Args:
+        strategy_name (str): Name of the strategy, see load_strategy()
+        overrides (dict): Game constants to override, see
+            apply_overrides()
+        games (int): Amount of games to play
+        seed (int): Seed of the random numbers of this chunk
+        skill_amount (int, optional): Amount of skills and roles. Defaults
+            to 5.
+
+    Returns:
+        SimulationResult: Distributions of the chunk
+    """
+    previous = apply_overrides(overrides)
+    random.seed(seed)
+    strategy = load_strategy(strategy_name)
+    skills = (SKILLS + [f'Role {nr}' for nr in range(
+        len(SKILLS) + 1, skill_amount + 1)])[:skill_amount]
+    names = [f'Cadet {nr}' for nr in range(1, Cadets.ROSTER_SIZE + 1)]
+    scores = Counter()
+    successes = Counter()
+    try:
+        for _ in range(games):
+            score, mission_score = play_game(strategy, skills, names)
+            scores[score] += 1
+            successes[mission_score] += 1
+        return SimulationResult(scores, successes, Player.MISSION_PASS_SCORE)
+    finally:
+        apply_overrides(previous)
+
+
+def simulate(strategy_name: str, games: int, overrides=None, workers=None,
+             seed=0, chunk_size=CHUNK_SIZE,
+             skill_amount=5) -> SimulationResult:
+    """Plays many games on all CPU cores
+
+    Args:
+        strategy_name (str): Name of the strategy, see load_strategy()
+        games (int): Amount of games to play
+        overrides (dict, optional): Game constants to override, see
+            apply_overrides(). Defaults to None.
+        workers (int, optional): Amount of processes. Defaults to None,
+            which uses one per CPU core; 1 plays in this process.
+        seed (int, optional): Seed of the simulation. Defaults to 0.
+        chunk_size (int, optional): Games per task. Defaults to CHUNK_SIZE.
+        skill_amount (int, optional): Amount of skills and roles. Defaults
+            to 5.
+
+    Raises:
+        ValueError: If the strategy or an override is unknown, or there are
+            fewer cadets than roles
+
+    Returns:
+        SimulationResult: Distributions of all games
+    """
+    overrides = overrides or {}
+    # Fail early instead of in every pool process; the overrides are
+    # checked and undone at once
+    load_strategy(strategy_name)
+    apply_overrides(apply_overrides(overrides))
+    if overrides.get('Cadets.ROSTER_SIZE', Cadets.ROSTER_SIZE) \
+            < skill_amount:
+        raise ValueError('Cadets.ROSTER_SIZE must be at least the amount '
+                         'of skills')
+    chunks = [(strategy_name, overrides, min(chunk_size, games - start),
+               seed * 1_000_003 + nr, skill_amount)
+              for nr, start in enumerate(range(0, games, chunk_size))]
+    result = SimulationResult()
+    if workers == 1:
+        for chunk in chunks:
+            result.add(play_chunk(*chunk))
+        return result
+    with ProcessPoolExecutor(workers) as pool:
+        for chunk_result in pool.map(play_chunk, *zip(*chunks)):
+            result.add(chunk_result)
+    return result
@@ -0,0 +1,114 @@
+"""Contains the player strategies for simulated games
+
+A strategy plays the part of the player in a SimulatedGame: it may test
+cadets in trial runs and then names the crew. Strategies only see what a
+player sees on screen, i.e. the mission difficulty and the trial outcomes,
+except for Oracle, which shows the best possible result.
+
+Custom strategies subclass Strategy and can be passed to simulate.py as
+'module:ClassName'.
+"""
+import importlib
+import random
+from game.components.crew_solver import CrewSolver
+
+
+class Strategy:
+    """Base class of all strategies
+
+    Attributes:
+        NAME (str): Name of the strategy on the command line
+
+    Methods:
+        play(): Plays the trials and returns the crew
+    """
+    NAME = ''
+
+    def play(self, game: object) -> list:
+        """Plays the trials and returns the crew
+
+        Args:
+            game (object): Reference to SimulatedGame class instance
+
+        Returns:
+            list: Cadet names in the order of game.skills, one per role
+        """
+        raise NotImplementedError
+
+
+class RandomCrew(Strategy):
+    """Skips the trials and assigns the cadets at random"""
+    NAME = 'random'
+
+    def play(self, game: object) -> list:
+        return random.sample(game.names, len(game.skills))
+
+
+class Knockout(Strategy):
+    """Finds the best remaining cadet for each role in a knockout round
+
+    Roles are filled in order. For each role, the cadets who are still
+    available are tested against the current favourite until the trial
+    runs are used up; then the favourite gets the role.
+    """
+    NAME = 'knockout'
+
+    def play(self, game: object) -> list:
+        available = list(game.names)
+        random.shuffle(available)
+        crew = []
+        for skill in game.skills:
+            best = available[0]
+            for challenger in available[1:]:
+                outcome = game.trial(skill, best, challenger)
+                if outcome is None:
+                    # No trial runs left
+                    break
+                if outcome in ('w', 'mw'):
+                    best = challenger
+            crew.append(best)
+            available.remove(best)
+        return crew
+
+
+class Oracle(Strategy):
+    """Knows all skill values and mission parameters
+
+    Uses no trial runs and lets CrewSolver pick the crew with the most
+    successful cadets and, among those, the highest skill values. This is
+    the upper bound of what any strategy can reach.
+    """
+    NAME = 'oracle'
+
+    def play(self, game: object) -> list:
+        cadets, parameters = game.reveal()
+        skills = [[cadets[name][skill] for name in game.names]
+                  for skill in game.skills]
+        columns = CrewSolver.assign(
+            CrewSolver.mission_weights(skills, parameters))
+        return [game.names[column] for column in columns]
+
+
+STRATEGIES = {strategy.NAME: strategy
+              for strategy in (RandomCrew, Knockout, Oracle)}
+
+
+def load_strategy(name: str) -> Strategy:
+    """Returns a new instance of a strategy
+
+    Args:
+        name (str): Name of a built-in strategy, see STRATEGIES, or
+            'module:ClassName' of a custom Strategy subclass
+
+    Raises:
+        ValueError: If there is no such strategy
+
+    Returns:
+        Strategy: The strategy
+    """
+    if name in STRATEGIES:
+        return STRATEGIES[name]()
+    module_name, _, class_name = name.partition(':')
+    if not class_name:
+        raise ValueError(f'Unknown strategy: {name}')
+    return getattr(importlib.import_module(module_name), class_name)()
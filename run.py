@@ -1,9 +1,12 @@
 """Main game file that must be run in order to start the game"""
 # coding=utf-8
+import os
 import sys
-from game.UI.sheets import Sheet
+from game.UI.sheets import MemorySheet, Sheet
 from game.UI.display import Display
+from game.UI.keyboard import Keyboard
 from game.UI.menu import Menu
+from game.UI.session import Session, call
 from game.components.player import Player
 from game.components.cadets import Cadets
 from game.phases.trials import Trials
@@ -15,6 +18,8 @@ def run(menu: object, player: object, display: object, sheet: object):
 
     This function initializes the game component and phases classes, calls the
     different game phases in the correct order and shows info screens.
+    It is a generator that is advanced by a Session (see game/UI/session.py),
+    so the menu calls it with 'yield from'.
 
     Args:
         menu (object): Reference to Menu class instance
@@ -25,6 +30,7 @@ def run(menu: object, player: object, display: object, sheet: object):
     # Some menu variables must be reset when the game is played in several
     # playthroughs in one session
     menu.reset_menu()
+    menu.phase = 'recruit'
     # Only run player initialization if the game is running for the first time
     # or if the user chooses to enter a new name in the outer menu. If a player
     # has already been initialized, the player object is passed from the menu
@@ -32,34 +38,90 @@ def run(menu: object, player: object, display: object, sheet: object):
     if player is None:
         player = Player()
         menu.active_player = player
-        menu.run_player_init()
+        yield from menu.run_player_init()
     # Initialize cadets and show their names
     cadets = Cadets(sheet)
     cadets.recruit()
-    menu.info_screen('3_recruit', cadets.names)
+    yield from menu.info_screen('3_recruit', cadets.names)
     # Initialize trials;
     # initialize mission to show the mission difficulty to the player
     trials = Trials(display, sheet)
     mission = Mission(cadets.skills, display, sheet)
+    # The menu keeps the game objects so that the game can be saved as a
+    # snapshot at its prompts (see game/UI/snapshot.py)
+    menu.cadets, menu.trials, menu.mission = cadets, trials, mission
     # Start trials phase via the menu
-    menu.run_trial_loop(trials, cadets, mission)
+    menu.phase = 'trials'
+    yield from menu.run_trial_loop(trials, cadets, mission)
+    yield from run_mission(menu, player, display, sheet)
+    # Return to menu.run_outer_loop()
+
+
+def run_mission(menu: object, player: object, display: object,
+                sheet: object):
+    """Runs the mission phase and saves the player score
+
+    The second part of run(), which a resumed game can also continue with.
+    The Cadets, Trials and Mission instances are taken from the menu.
+
+    Args:
+        menu (object): Reference to Menu class instance
+        player (object): Reference to Player class instance
+        display (object): Reference to Display class instance
+        sheet (object): Reference to Sheet class instance
+    """
+    cadets, trials, mission = menu.cadets, menu.trials, menu.mission
     # Start mission phase
-    mission.assemble_crew(menu, trials, cadets)
+    menu.phase = 'mission'
+    yield from mission.assemble_crew(menu, trials, cadets)
     mission.calculate_success()
-    menu.info_screen('5_red_alert', mission)
-    menu.info_screen('6_ship_anim')
-    menu.info_screen('7_mission_score', mission.score)
-    mission.show_mission_logs()
+    yield from menu.info_screen('5_red_alert', mission)
+    yield from menu.info_screen('6_ship_anim')
+    yield from menu.info_screen('7_mission_score', mission.score)
+    yield from mission.show_mission_logs()
+    menu.phase = 'score'
     player.build_detailed_score(
         trials.runs, trials.MAX_RUNS, mission, display, sheet)
     # Save player score to highscore table
-    menu.info_screen('8_player_score', mission)
+    yield from menu.info_screen('8_player_score', mission)
     display.build_menu(sheet.get_text('please_wait'))
     display.draw()
-    sheet.write_score(player.score, player.name)
+    # Writing to the Google sheet is slow; run it through the session
+    yield from call(sheet.write_score, player.score, player.name)
     display.clear()
-    menu.info_screen('9_highscore')
-    # Return to menu.run_outer_loop()
+    yield from menu.info_screen('9_highscore')
+
+
+def game(menu: object):
+    """Runs a whole session from the outer menu to the credits
+
+    A generator that is advanced by a Session.
+
+    Args:
+        menu (object): Reference to Menu class instance
+    """
+    yield from menu.run_outer_loop()
+    yield from menu.info_screen('10_say_goodbye')
+
+
+def resume(menu: object, snapshot: object):
+    """Continues a game from a snapshot until the credits
+
+    The snapshot is restored into the menu, and the game continues at the
+    prompt it was taken at, and then like game().
+    A generator that is advanced by a Session.
+
+    Args:
+        menu (object): Reference to a new Menu class instance
+        snapshot (object): Reference to Snapshot class instance
+    """
+    snapshot.restore(menu)
+    if snapshot.position == 'trials':
+        yield from menu.run_trial_loop(menu.trials, menu.cadets, menu.mission)
+    if snapshot.position in ('trials', 'mission'):
+        yield from run_mission(menu, menu.active_player, menu.display,
+                               menu.sheet)
+    yield from game(menu)
 
 
 def main():
@@ -67,17 +129,43 @@ def main():
 
     This function starts the game by clearing the screen, initializing the UI
     classes Sheet, Display and Menu, and running the outer menu choice loop.
+    If the environment variable SPECTATOR_PORT is set, the game can be
+    watched by spectators connecting to this TCP port. If RECORD_DIR is set,
+    the last frames of the session are saved there as an asciicast file when
+    the game exits or crashes. If CATALOG is set, the texts are read from
+    this JSON file (see MemorySheet) instead of the Google sheet. A text
+    catalog with more skills than the menus can show ends the program with
+    an error message before the game starts.
+    Modules that are only needed for these options are imported on demand
+    to keep the start-up fast.
     On game exit, the function calls say_goodbye() to show the credits and exit
     the program.
     """
     # Clear the screen
     print('\033c', end='')
-    sheet = Sheet()
+    if os.environ.get('CATALOG'):
+        sheet = MemorySheet.load(os.environ['CATALOG'])
+    else:
+        sheet = Sheet()
+    try:
+        Cadets.check_sheet(sheet)
+    except ValueError as e:
+        print("Invalid text catalog: ", e)
+        sys.exit()
     display = Display(sheet)
+    if os.environ.get('SPECTATOR_PORT'):
+        from game.UI.spectator import Broadcaster, SpectatorServer
+        broadcaster = Broadcaster()
+        display.listeners.append(broadcaster.publish)
+        SpectatorServer(broadcaster, int(os.environ['SPECTATOR_PORT'])).start()
+    if os.environ.get('RECORD_DIR'):
+        from game.UI.recorder import Recorder
+        recorder = Recorder(os.environ['RECORD_DIR'])
+        display.listeners.append(recorder.record)
+        recorder.install()
     menu = Menu(display, sheet, run)
     try:
-        menu.run_outer_loop()
-        menu.info_screen('10_say_goodbye')
+        Session(game(menu)).play(Keyboard())
     except KeyError as e:
         print("Internal error: invalid dictionary key ", e)
     sys.exit()
@@ -0,0 +1,120 @@
+"""Serves the game to many players at once from a single process
+
+Usage:
+    python3 server.py
+
+Players connect with a raw terminal client, e.g. 'nc localhost 8002', or
+through the web terminal with GAME_HOST_PORT set (see controllers/default.js).
+The environment variable GAME_PORT sets the TCP port (default: 8002). If
+CATALOG is set, the texts are read from this JSON file (see MemorySheet)
+instead of the Google sheet, and high scores are kept in memory only.
+
+If HIBERNATE_AFTER is set, games that wait at a menu prompt for this many
+seconds are saved as snapshot files in SNAPSHOT_DIR (default: the system's
+temp directory) and resumed on the next key.
+
+MAX_GAMES limits the amount of games running at the same time, and
+MIN_MEMORY_MB keeps new games from starting while less memory is available.
+Further players wait in a queue and see their position.
+
+METRICS_PORT serves metrics in the Prometheus text format on this local
+port, and METRICS_FILE writes them to this file every 15 seconds.
+
+If ZYGOTE is set, every player is served by a child process forked from a
+warm parent (see game/UI/zygote.py) instead of sharing one event loop. With
+CATALOG, each child then keeps its own high scores.
+"""
+# coding=utf-8
+import asyncio
+import os
+import sys
+from game.UI.admission import Admission
+from game.UI.headless import HeadlessDisplay
+from game.UI.host import GameHost
+from game.UI.menu import Menu
+from game.UI.metrics import Metrics
+from game.UI.scripted import ScriptedKeyboard
+from game.UI.session import Session
+from game.UI.sheets import MemorySheet, Sheet
+from game.UI.zygote import Zygote
+from game.components.cadets import Cadets
+from run import game, resume, run
+
+# Answers for one complete game, used to warm up the caches
+WARM_UP_KEYS = os.path.join(
+    os.path.dirname(__file__), 'benchmarks', 'playthrough.keys')
+
+
+def warm_up(sheet: object):
+    """Plays one complete game offline to fill the Display caches
+
+    All static screens and animation frames built during the game are kept
+    in the class-level caches of Display, so the games of real players
+    start with them already built. The game is played with a copy of the
+    text catalog, so no highscore is written to the real sheet.
+
+    Args:
+        sheet (object): Reference to Sheet class instance
+    """
+    offline = MemorySheet(sheet.msg_dict)
+    display = HeadlessDisplay(offline, keep_output=False)
+    keyboard = ScriptedKeyboard.load(WARM_UP_KEYS)
+    Session(game(Menu(display, offline, run))).play(keyboard)
+
+
+def main():
+    """Loads the text catalog once and serves games until interrupted"""
+    if os.environ.get('CATALOG'):
+        sheet = MemorySheet.load(os.environ['CATALOG'])
+    else:
+        sheet = Sheet()
+
+    def start_game(display: object, snapshot=None) -> tuple:
+        """Starts a new game, or resumes a game from a snapshot
+
+        Args:
+            display (object): Reference to Display class instance
+            snapshot (object, optional): Reference to Snapshot class
+                instance. Defaults to None, which starts a new game.
+
+        Returns:
+            tuple: The Menu class instance and the game flow
+        """
+        menu = Menu(display, sheet, run)
+        if snapshot is None:
+            return menu, game(menu)
+        return menu, resume(menu, snapshot)
+
+    try:
+        Cadets.check_sheet(sheet)
+    except ValueError as e:
+        sys.exit(f'Invalid text catalog: {e}')
+    idle_timeout = os.environ.get('HIBERNATE_AFTER')
+    max_games = os.environ.get('MAX_GAMES')
+    min_memory = os.environ.get('MIN_MEMORY_MB')
+    admission = None
+    if max_games or min_memory:
+        admission = Admission(int(max_games) if max_games else None,
+                              int(min_memory) if min_memory else None)
+    metrics_port = os.environ.get('METRICS_PORT')
+    metrics = None
+    if metrics_port or os.environ.get('METRICS_FILE'):
+        metrics = Metrics(port=int(metrics_port) if metrics_port else None,
+                          path=os.environ.get('METRICS_FILE'))
+    host = GameHost(sheet, start_game,
+                    float(idle_timeout) if idle_timeout else None,
+                    os.environ.get('SNAPSHOT_DIR'), admission, metrics)
+    port = int(os.environ.get('GAME_PORT', 8002))
+    print(f'Serving Ad Astra on port {port}')
+    try:
+        if os.environ.get('ZYGOTE'):
+            warm_up(sheet)
+            Zygote(host).serve(port=port)
+        else:
+            asyncio.run(host.serve(port=port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
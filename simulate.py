@@ -0,0 +1,98 @@
+"""Simulates many games to tune the game balance
+
+Usage:
+    python3 simulate.py -n 1000000
+    python3 simulate.py -s random -s knockout -s oracle
+    python3 simulate.py --set Mission.DIFF_MIN=2,3,4 --set Trials.MAX_RUNS=10,14
+    python3 simulate.py --skills 7 --set Cadets.ROSTER_SIZE=9
+
+The games are played without Display or Sheet by player strategies (see
+game/simulation/strategies.py) on all CPU cores, and the score and mission
+success distributions are printed for each strategy. Each --set overrides a
+game constant such as Mission.DIFF_MIN, Mission.DIFF_MAX, Trials.MAX_RUNS,
+Cadets.MAX_POINTS, Cadets.ROSTER_SIZE or one of the score weights of
+Player; several values separated by commas are simulated one after the
+other, and several --set options are combined in every possible way.
+--skills changes the amount of skills and roles. --json saves all
+distributions for further analysis.
+"""
+import argparse
+import itertools
+import json
+import time
+from game.simulation.engine import simulate
+from game.simulation.strategies import STRATEGIES
+
+
+def parse_setting(text: str) -> tuple:
+    """Parses a --set option
+
+    Args:
+        text (str): e.g. 'Mission.DIFF_MIN=2,3,4'
+
+    Raises:
+        argparse.ArgumentTypeError: If the option is malformed
+
+    Returns:
+        tuple: The constant and the list of its values
+    """
+    key, _, values = text.partition('=')
+    try:
+        return key, [int(value) for value in values.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f'expected CLASS.CONSTANT=VALUE[,VALUE...], got {text}') from None
+
+
+def main():
+    """Runs the simulations and prints their distributions"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--games', type=int, default=100_000,
+                        help='games per simulation (default: %(default)s)')
+    parser.add_argument('-s', '--strategy', action='append',
+                        help='strategy to play with, one of '
+                        f'{", ".join(STRATEGIES)} or module:ClassName; '
+                        'can be repeated (default: knockout)')
+    parser.add_argument('--set', action='append', type=parse_setting,
+                        default=[], metavar='CLASS.CONSTANT=VALUES',
+                        help='override a game constant; can be repeated')
+    parser.add_argument('-w', '--workers', type=int,
+                        help='processes (default: one per CPU core)')
+    parser.add_argument('--skills', type=int, default=5,
+                        help='skills per cadet, which is also the amount of '
+                        'roles (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--bin-width', type=int, default=100,
+                        help='width of the player score bins '
+                        '(default: %(default)s)')
+    parser.add_argument('--json', help='file to save all distributions to')
+    args = parser.parse_args()
+
+    keys = [key for key, _ in args.set]
+    results = []
+    for strategy in args.strategy or ['knockout']:
+        for values in itertools.product(*(values for _, values in args.set)):
+            overrides = dict(zip(keys, values))
+            start = time.perf_counter()
+            try:
+                result = simulate(strategy, args.games, overrides,
+                                  args.workers, args.seed,
+                                  skill_amount=args.skills)
+            except ValueError as error:
+                parser.error(str(error))
+            duration = time.perf_counter() - start
+            settings = ', '.join(f'{key}={value}'
+                                 for key, value in overrides.items())
+            print(f'== {strategy}' + (f' ({settings})' if settings else ''))
+            print(result.report(args.bin_width))
+            print(f'time:             {duration:.2f} s, '
+                  f'{args.games / duration:.0f} games/s\n')
+            results.append({'strategy': strategy, 'overrides': overrides,
+                            **result.to_dict()})
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=1)
+
+
+if __name__ == '__main__':
+    main()
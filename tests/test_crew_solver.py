@@ -0,0 +1,96 @@
+"""Compares CrewSolver with trying every possible crew"""
+import itertools
+import random
+import unittest
+from game.components.crew_solver import CrewSolver
+
+
+def brute_force(weights: list) -> float:
+    """Returns the highest sum of weights of any crew"""
+    roles, cadets = len(weights), len(weights[0])
+    return max(sum(weights[role][column] for role, column in enumerate(crew))
+               for crew in itertools.permutations(range(cadets), roles))
+
+
+def crew_sum(matrix: list, columns: list) -> int:
+    """Returns the sum of the matrix entries of a crew"""
+    return sum(matrix[role][column] for role, column in enumerate(columns))
+
+
+class TestCrewSolver(unittest.TestCase):
+    """Checks the solver and its weights on small random matrices"""
+
+    def setUp(self):
+        self.rng = random.Random(1)
+
+    def random_skills(self, low=1, high=10) -> list:
+        roles = self.rng.randint(1, 5)
+        cadets = self.rng.randint(roles, 7)
+        return [[self.rng.randint(low, high) for _ in range(cadets)]
+                for _ in range(roles)]
+
+    def test_assign_matches_brute_force(self):
+        for _ in range(500):
+            weights = self.random_skills(-5, 30)
+            columns = CrewSolver.assign(weights)
+            self.assertEqual(len(set(columns)), len(weights))
+            self.assertEqual(crew_sum(weights, columns),
+                             brute_force(weights))
+
+    def test_too_few_cadets(self):
+        with self.assertRaises(ValueError):
+            CrewSolver.assign([[1], [2]])
+
+    def test_mission_weights_maximize_successes(self):
+        for _ in range(500):
+            skills = self.random_skills()
+            parameters = [self.rng.randint(3, 10) for _ in skills]
+            successes = [[int(value >= param) for value in row]
+                         for row, param in zip(skills, parameters)]
+            columns = CrewSolver.assign(
+                CrewSolver.mission_weights(skills, parameters))
+            self.assertEqual(crew_sum(successes, columns),
+                             brute_force(successes))
+
+    def test_expected_weights_on_narrow_ranges(self):
+        # With parameters from 1 to 4, the higher skill values of the
+        # diagonal crew must not outweigh one more successful parameter
+        columns = CrewSolver.assign(
+            CrewSolver.expected_weights([[2, 5], [3, 10]], 1, 4))
+        self.assertEqual(columns, [1, 0])
+        for _ in range(1000):
+            lowest = self.rng.randint(1, 9)
+            highest = self.rng.randint(lowest, min(lowest + 3, 10))
+            skills = self.random_skills()
+            chances = [[min(max(value - lowest + 1, 0), highest - lowest + 1)
+                        for value in row] for row in skills]
+            columns = CrewSolver.assign(
+                CrewSolver.expected_weights(skills, lowest, highest))
+            self.assertEqual(crew_sum(chances, columns),
+                             brute_force(chances))
+
+    def test_expected_weights_rank_chances_first(self):
+        # Every crew with more successful parameters must weigh more than
+        # any crew with fewer, whatever their skill values
+        for _ in range(300):
+            lowest = self.rng.randint(1, 9)
+            highest = self.rng.randint(lowest, min(lowest + 3, 10))
+            skills = self.random_skills()
+            weights = CrewSolver.expected_weights(skills, lowest, highest)
+            crews = [(sum(min(max(skills[role][column] - lowest + 1, 0),
+                              highest - lowest + 1)
+                          for role, column in enumerate(crew)),
+                      crew_sum(weights, crew))
+                     for crew in itertools.permutations(
+                         range(len(skills[0])), len(skills))]
+            lighter = None
+            for chances in sorted({chances for chances, _ in crews}):
+                weights_at = [weight for count, weight in crews
+                              if count == chances]
+                if lighter is not None:
+                    self.assertGreater(min(weights_at), lighter)
+                lighter = max(weights_at)
+
+
+if __name__ == '__main__':
+    unittest.main()